@@ -22,23 +22,94 @@ Usage:
     langchain_tool = skill.to_langchain()
 """
 
+import hashlib
+import io
 import json
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, TextIO, Tuple
 from dataclasses import dataclass, field
 
 # Try to import yaml, fall back to simple parsing
 try:
     import yaml
     HAS_YAML = True
+    # Prefer the libyaml C binding, which is much faster than the pure-Python loader
+    HAS_YAML_C = hasattr(yaml, "CSafeLoader")
+    _SafeLoader = yaml.CSafeLoader if HAS_YAML_C else yaml.SafeLoader
 except ImportError:
     HAS_YAML = False
+    HAS_YAML_C = False
 
-__all__ = ["SkillLoader", "Skill", "load_skill", "load_skills_from_dir"]
+# Fallback frontmatter parser: top-level "key: value" lines, scanned in one pass
+_FM_RE = re.compile(r"^([^\s:][^:\n]*?)[ \t]*:[ \t]*(.*?)[ \t]*$", re.MULTILINE)
 
+# Bump when the frontmatter rules change so ~/.skills/cache/parsed entries are re-parsed
+_PARSE_CACHE_VERSION = 2
 
-@dataclass
+# Prefer orjson for JSON when available (C-accelerated, parses bytes directly)
+try:
+    import orjson
+    HAS_ORJSON = True
+    _json_loads = orjson.loads
+except ImportError:
+    HAS_ORJSON = False
+    _json_loads = json.loads
+
+
+# Reuse keep-alive connections across remote fetches when urllib3 is available
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+_http_pool = None
+
+_USER_AGENT = "skills-loader/1.0"
+
+
+def _fetch_text(url: str, timeout: int = 30) -> str:
+    """Fetch a URL as UTF-8 text, through a shared connection pool when possible."""
+    global _http_pool
+    if HAS_URLLIB3:
+        if _http_pool is None:
+            # PoolManager is thread-safe; a racing duplicate is harmless
+            _http_pool = urllib3.PoolManager(headers={"User-Agent": _USER_AGENT})
+        response = _http_pool.request("GET", url, timeout=timeout)
+        if response.status >= 400:
+            raise OSError(f"HTTP {response.status} fetching {url}")
+        return response.data.decode("utf-8")
+    
+    from urllib.request import urlopen, Request
+    
+    req = Request(url, headers={"User-Agent": _USER_AGENT})
+    with urlopen(req, timeout=timeout) as response:
+        return response.read().decode("utf-8")
+
+
+def _json_dumps_compact(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes, rejecting values JSON can't round-trip (e.g. dates)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(obj).encode("utf-8")
+
+
+__all__ = ["SkillLoader", "Skill", "LazySkill", "load_skill", "load_skills_from_dir"]
+
+# Slotted dataclasses (3.10+) for the small per-skill records; Skill itself
+# keeps its __dict__ for cached_property and LazySkill.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Files that mark a directory as a skill
+_SKILL_FILES = frozenset({"skill.json", "SKILL.md"})
+
+
+@dataclass(**_SLOTS)
 class SkillInput:
     """Skill input parameter definition."""
     name: str
@@ -46,14 +117,32 @@ class SkillInput:
     description: str = ""
     required: bool = False
     default: Any = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the input definition as a plain dict."""
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "required": self.required,
+            "default": self.default,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SkillOutput:
     """Skill output definition."""
     name: str
     type: str = "string"
     description: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the output definition as a plain dict."""
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+        }
 
 
 @dataclass
@@ -63,6 +152,9 @@ class Skill:
     
     Can be loaded from SKILL.md, skill.json, or both.
     Provides methods to export to different runtime formats.
+    
+    Derived payloads (input/output dicts, tool schemas) are built once per
+    instance and shared across exports, so treat a loaded Skill as read-only.
     """
     id: str
     name: str
@@ -79,6 +171,42 @@ class Skill:
     outputs: List[SkillOutput] = field(default_factory=list)
     path: Optional[Path] = None
     raw_manifest: Dict[str, Any] = field(default_factory=dict)
+    slug: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Tool-style identifier used by the runtime exporters
+        self.slug = self.name.replace(" ", "_").lower()
+    
+    @cached_property
+    def _inputs_dicts(self) -> List[Dict[str, Any]]:
+        return [i.to_dict() for i in self.inputs]
+    
+    @cached_property
+    def _outputs_dicts(self) -> List[Dict[str, Any]]:
+        return [o.to_dict() for o in self.outputs]
+    
+    @cached_property
+    def _input_schema(self) -> Dict[str, Any]:
+        """JSON schema for the skill inputs, shared by the tool exporters."""
+        return {
+            "type": "object",
+            "properties": {
+                inp.name: {
+                    "type": inp.type,
+                    "description": inp.description,
+                }
+                for inp in self.inputs
+            },
+            "required": [inp.name for inp in self.inputs if inp.required],
+        }
+    
+    @cached_property
+    def _input_var_re(self) -> Optional["re.Pattern[str]"]:
+        """Matches {input_name} for any declared input, or None if there are no inputs."""
+        if not self.inputs:
+            return None
+        names = "|".join(re.escape(inp.name) for inp in self.inputs)
+        return re.compile(r"\{(" + names + r")\}")
     
     def get_instructions(self) -> str:
         """Get the skill instructions (from SKILL.md)."""
@@ -97,8 +225,8 @@ class Skill:
             "keywords": self.keywords,
             "capabilities": self.capabilities,
             "dependencies": self.dependencies,
-            "inputs": [vars(i) for i in self.inputs],
-            "outputs": [vars(o) for o in self.outputs],
+            "inputs": self._inputs_dicts,
+            "outputs": self._outputs_dicts,
         }
     
     def to_mcp(self) -> Dict[str, Any]:
@@ -125,13 +253,10 @@ class Skill:
         
         Returns the skill instructions formatted for LangChain.
         """
-        # Format inputs as template variables
-        template = self.instructions
-        for inp in self.inputs:
-            # Replace {input_name} with LangChain variable syntax
-            template = template.replace(f"{{{inp.name}}}", f"{{{{{inp.name}}}}}")
-        
-        return template
+        # Replace {input_name} with LangChain variable syntax in a single pass
+        if self._input_var_re is None:
+            return self.instructions
+        return self._input_var_re.sub(r"{{\1}}", self.instructions)
     
     def to_langchain_tool(self) -> Dict[str, Any]:
         """
@@ -140,19 +265,9 @@ class Skill:
         Returns a dict that can be used to create a LangChain Tool.
         """
         return {
-            "name": self.name.replace(" ", "_").lower(),
+            "name": self.slug,
             "description": self.description,
-            "args_schema": {
-                "type": "object",
-                "properties": {
-                    inp.name: {
-                        "type": inp.type,
-                        "description": inp.description,
-                    }
-                    for inp in self.inputs
-                },
-                "required": [inp.name for inp in self.inputs if inp.required],
-            },
+            "args_schema": self._input_schema,
             "instructions": self.instructions,
         }
     
@@ -211,19 +326,9 @@ class Skill:
             return []
         
         return [{
-            "name": f"{self.name.replace(' ', '_').lower()}_execute",
+            "name": f"{self.slug}_execute",
             "description": self.description,
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    inp.name: {
-                        "type": inp.type,
-                        "description": inp.description,
-                    }
-                    for inp in self.inputs
-                },
-                "required": [inp.name for inp in self.inputs if inp.required],
-            }
+            "input_schema": self._input_schema,
         }]
     
     def to_system_prompt(self) -> str:
@@ -231,34 +336,33 @@ class Skill:
         Export skill as a system prompt for any LLM.
         
         This is the most universal format, usable with any chat model.
+        The rendered prompt is cached on the skill after the first call.
         """
-        parts = [f"# {self.name}", ""]
+        return self._system_prompt
+    
+    @cached_property
+    def _system_prompt(self) -> str:
+        blocks = [f"# {self.name}\n"]
         
         if self.description:
-            parts.append(self.description)
-            parts.append("")
+            blocks.append(f"{self.description}\n")
         
         if self.instructions:
-            parts.append("## Instructions")
-            parts.append("")
-            parts.append(self.instructions)
+            blocks.append(f"## Instructions\n\n{self.instructions}")
         
         if self.inputs:
-            parts.append("")
-            parts.append("## Expected Inputs")
-            parts.append("")
-            for inp in self.inputs:
-                required = " (required)" if inp.required else ""
-                parts.append(f"- **{inp.name}** ({inp.type}){required}: {inp.description}")
+            blocks.append("\n## Expected Inputs\n\n" + "\n".join(
+                f"- **{inp.name}** ({inp.type}){' (required)' if inp.required else ''}: {inp.description}"
+                for inp in self.inputs
+            ))
         
         if self.outputs:
-            parts.append("")
-            parts.append("## Expected Outputs")
-            parts.append("")
-            for out in self.outputs:
-                parts.append(f"- **{out.name}** ({out.type}): {out.description}")
+            blocks.append("\n## Expected Outputs\n\n" + "\n".join(
+                f"- **{out.name}** ({out.type}): {out.description}"
+                for out in self.outputs
+            ))
         
-        return "\n".join(parts)
+        return "\n".join(blocks)
 
 
 class SkillLoader:
@@ -272,34 +376,50 @@ class SkillLoader:
     """
     
     @staticmethod
-    def from_directory(path: Path) -> Skill:
-        """Load a skill from a local directory."""
+    def from_directory(path: Path, lazy: bool = False) -> Skill:
+        """
+        Load a skill from a local directory.
+        
+        With lazy=True only the SKILL.md frontmatter is read up front and a
+        LazySkill is returned; the instructions body is read on first access.
+        """
         path = Path(path)
         
-        if not path.exists():
-            raise FileNotFoundError(f"Skill directory not found: {path}")
+        # One directory read tells us which of skill.json / SKILL.md exist
+        try:
+            with os.scandir(path) as it:
+                present = {entry.name for entry in it if entry.name in _SKILL_FILES}
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Skill directory not found: {path}") from None
+        except NotADirectoryError:
+            present = set()
         
         manifest = {}
         instructions = ""
         
         # Load skill.json if exists
         manifest_path = path / "skill.json"
-        if manifest_path.exists():
+        if "skill.json" in present:
             try:
-                manifest = json.loads(manifest_path.read_text())
+                manifest = _json_loads(manifest_path.read_bytes())
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid skill.json: {e}")
         
         # Load SKILL.md if exists
         skill_md_path = path / "SKILL.md"
-        if skill_md_path.exists():
-            content = skill_md_path.read_text()
-            instructions, frontmatter = SkillLoader._parse_skill_md(content)
+        has_skill_md = "SKILL.md" in present
+        if has_skill_md:
+            if lazy:
+                frontmatter = SkillLoader._load_parsed(skill_md_path)
+            else:
+                content = skill_md_path.read_text()
+                instructions = SkillLoader._strip_frontmatter(content)
+                frontmatter = SkillLoader._load_parsed(skill_md_path, content)
             
             # Merge frontmatter into manifest (frontmatter takes precedence)
             manifest = {**manifest, **frontmatter}
         
-        if not manifest and not instructions:
+        if not manifest and not instructions and not (lazy and has_skill_md):
             raise ValueError(f"No skill.json or SKILL.md found in {path}")
         
         # Build skill ID from path or manifest
@@ -325,12 +445,11 @@ class SkillLoader:
                 description=out_data.get("description", ""),
             ))
         
-        return Skill(
+        fields = dict(
             id=skill_id,
             name=manifest.get("name", path.name),
             version=manifest.get("version", "0.0.0"),
             description=manifest.get("description", ""),
-            instructions=instructions,
             author=manifest.get("author", ""),
             license=manifest.get("license", ""),
             runtime=manifest.get("runtime", "universal"),
@@ -342,29 +461,26 @@ class SkillLoader:
             path=path,
             raw_manifest=manifest,
         )
+        
+        if lazy:
+            return LazySkill(skill_md_path=skill_md_path if has_skill_md else None, **fields)
+        return Skill(instructions=instructions, **fields)
     
     @staticmethod
     def from_url(skill_md_url: str, manifest_url: str = None) -> Skill:
         """Load a skill from remote URLs."""
-        from urllib.request import urlopen, Request
-        
-        def fetch(url: str) -> str:
-            req = Request(url, headers={"User-Agent": "skills-loader/1.0"})
-            with urlopen(req, timeout=30) as response:
-                return response.read().decode("utf-8")
-        
         manifest = {}
         instructions = ""
         
         # Fetch manifest if URL provided
         if manifest_url:
             try:
-                manifest = json.loads(fetch(manifest_url))
+                manifest = _json_loads(_fetch_text(manifest_url))
             except Exception:
                 pass
         
         # Fetch SKILL.md
-        content = fetch(skill_md_url)
+        content = _fetch_text(skill_md_url)
         instructions, frontmatter = SkillLoader._parse_skill_md(content)
         manifest = {**manifest, **frontmatter}
         
@@ -392,8 +508,6 @@ class SkillLoader:
     @staticmethod
     def from_catalog_entry(entry: Dict[str, Any], fetch_content: bool = True) -> Skill:
         """Load a skill from a catalog entry."""
-        from urllib.request import urlopen, Request
-        
         instructions = ""
         
         if fetch_content:
@@ -402,9 +516,7 @@ class SkillLoader:
             
             if skill_md_url:
                 try:
-                    req = Request(skill_md_url, headers={"User-Agent": "skills-loader/1.0"})
-                    with urlopen(req, timeout=30) as response:
-                        content = response.read().decode("utf-8")
+                    content = _fetch_text(skill_md_url)
                     instructions, _ = SkillLoader._parse_skill_md(content)
                 except Exception:
                     pass
@@ -434,27 +546,142 @@ class SkillLoader:
         
         Returns (instructions, frontmatter_dict)
         """
+        # Check for YAML frontmatter (--- at start)
+        frontmatter_text, body = SkillLoader._split_frontmatter(content)
+        if frontmatter_text is None:
+            return content, {}
+        return body.strip(), SkillLoader._parse_frontmatter(frontmatter_text)
+    
+    @staticmethod
+    def _parse_frontmatter(text: str) -> Dict[str, Any]:
+        """Parse the YAML block between the SKILL.md --- markers."""
         frontmatter = {}
-        instructions = content
+        try:
+            if HAS_YAML:
+                frontmatter = yaml.load(text, Loader=_SafeLoader) or {}
+            else:
+                # Simple fallback parser for basic key: value pairs
+                frontmatter = dict(_FM_RE.findall(text))
+        except Exception:
+            pass
+        return frontmatter
+    
+    @staticmethod
+    def _load_parsed(skill_md_path: Path, content: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the parsed frontmatter of a local SKILL.md via the on-disk parse cache.
         
-        # Check for YAML frontmatter (--- at start)
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                try:
-                    if HAS_YAML:
-                        frontmatter = yaml.safe_load(parts[1]) or {}
-                    else:
-                        # Simple fallback parser for basic key: value pairs
-                        for line in parts[1].strip().split("\n"):
-                            if ":" in line:
-                                key, val = line.split(":", 1)
-                                frontmatter[key.strip()] = val.strip()
-                except Exception:
-                    pass
-                instructions = parts[2].strip()
+        Entries live in ~/.skills/cache/parsed/ and are keyed by the file's
+        path, mtime and size, so YAML is only re-parsed after the file changes.
+        The stamp also records HAS_YAML, so fallback-parser entries are redone
+        once PyYAML is installed.
+        If content is given it is used instead of re-reading the file on a miss.
+        """
+        from cli.skills import SKILLS_CACHE
+        
+        abs_path = os.path.abspath(skill_md_path)
+        st = os.stat(abs_path)
+        stamp = [_PARSE_CACHE_VERSION, HAS_YAML, st.st_mtime_ns, st.st_size]
+        key = hashlib.blake2b(abs_path.encode(), digest_size=16).hexdigest()
+        cache_path = SKILLS_CACHE / "parsed" / f"{key}.json"
+        
+        try:
+            cached = _json_loads(cache_path.read_bytes())
+            if cached["stamp"] == stamp:
+                return cached["frontmatter"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, corrupt or stale cache entry
+        
+        if content is None:
+            frontmatter = SkillLoader._parse_frontmatter(SkillLoader._read_frontmatter_only(abs_path)[0])
+        else:
+            _, frontmatter = SkillLoader._parse_skill_md(content)
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_json_dumps_compact({"stamp": stamp, "frontmatter": frontmatter}))
+        except (OSError, TypeError, ValueError):
+            pass  # Unwritable cache or frontmatter that isn't JSON-serializable (e.g. YAML dates)
         
-        return instructions, frontmatter
+        return frontmatter
+    
+    @staticmethod
+    def _read_frontmatter_only(skill_md_path: Path) -> Tuple[str, int]:
+        """
+        Read only the frontmatter block of a SKILL.md, stopping at the closing ---.
+        
+        Returns (frontmatter_text, offset) where offset is the byte position
+        at which the instructions body starts, so callers can seek past the
+        frontmatter instead of re-reading it.
+        """
+        with open(skill_md_path, encoding="utf-8") as f:
+            text = SkillLoader._scan_frontmatter(f)
+            return text or "", f.tell()
+    
+    @staticmethod
+    def _scan_frontmatter(f: TextIO) -> Optional[str]:
+        """
+        Consume the frontmatter from a text file, leaving f at the start of the body.
+        
+        The block opens with a first line starting with --- and closes at the
+        next line starting with ---. Without a closed block, f is rewound and
+        None is returned. Every SKILL.md reader goes through this one rule.
+        """
+        if not f.readline().startswith("---"):
+            f.seek(0)
+            return None
+        lines = []
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            if line.startswith("---"):
+                return "".join(lines)
+            lines.append(line)
+        f.seek(0)  # Unterminated frontmatter is treated as plain instructions
+        return None
+    
+    @staticmethod
+    def _split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+        """Split SKILL.md text into (frontmatter or None, body) using _scan_frontmatter's rule."""
+        f = io.StringIO(content)
+        frontmatter = SkillLoader._scan_frontmatter(f)
+        if frontmatter is None:
+            return None, content
+        return frontmatter, f.read()
+    
+    @staticmethod
+    def _strip_frontmatter(content: str) -> str:
+        """Return the SKILL.md body without its frontmatter block."""
+        frontmatter, body = SkillLoader._split_frontmatter(content)
+        return content if frontmatter is None else body.strip()
+
+
+class LazySkill(Skill):
+    """
+    Skill whose SKILL.md body is only read when ``instructions`` is first accessed.
+    
+    Metadata comes from skill.json and the SKILL.md frontmatter, so listing
+    many skills does not pay for reading every instructions body.
+    """
+    
+    def __init__(self, *args, skill_md_path: Optional[Path] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._skill_md_path = skill_md_path
+        # Skill.__init__ stored the default instructions on the instance;
+        # drop it so attribute access falls through to the cached property.
+        self.__dict__.pop("instructions", None)
+    
+    @cached_property
+    def instructions(self) -> str:
+        if self._skill_md_path is None:
+            return ""
+        # Seek past the frontmatter and read only the body; text mode gives the
+        # same universal-newline handling as the eager read_text() path
+        with open(self._skill_md_path, encoding="utf-8") as f:
+            if SkillLoader._scan_frontmatter(f) is None:
+                return f.read()
+            return f.read().strip()
 
 
 def load_skill(skill_id_or_path: str) -> Skill:
@@ -481,50 +708,80 @@ def load_skill(skill_id_or_path: str) -> Skill:
     raise FileNotFoundError(f"Skill not found: {skill_id_or_path}")
 
 
+def _try_load_lazy(dir_path: str) -> Optional[Skill]:
+    """Load a skill lazily, returning None for invalid skills."""
+    try:
+        return SkillLoader.from_directory(Path(dir_path), lazy=True)
+    except Exception:
+        return None  # Skip invalid skills
+
+
+def _has_skill_files(dir_path: str) -> bool:
+    """Check whether a directory directly contains skill.json or SKILL.md."""
+    return (
+        os.path.exists(os.path.join(dir_path, "skill.json"))
+        or os.path.exists(os.path.join(dir_path, "SKILL.md"))
+    )
+
+
 def load_skills_from_dir(directory: Path) -> List[Skill]:
     """
     Load all skills from a directory.
     
-    Scans for subdirectories containing skill.json or SKILL.md.
+    Scans for subdirectories containing skill.json or SKILL.md. Skills are
+    returned as LazySkill instances, so instructions are read on demand.
     """
-    skills = []
-    directory = Path(directory)
-    
-    if not directory.exists():
-        return skills
-    
-    for entry in directory.iterdir():
-        if not entry.is_dir():
+    try:
+        with os.scandir(directory) as it:
+            entries = [entry.path for entry in it if entry.is_dir()]
+    except OSError:
+        return []
+    
+    # Collect candidate skill directories first, then load them in one pass
+    candidates = []
+    for entry_path in entries:
+        if _has_skill_files(entry_path):
+            candidates.append(entry_path)
             continue
         
-        # Check if this looks like a skill directory
-        has_skill = (entry / "skill.json").exists() or (entry / "SKILL.md").exists()
-        
-        if has_skill:
-            try:
-                skill = SkillLoader.from_directory(entry)
-                skills.append(skill)
-            except Exception:
-                pass  # Skip invalid skills
-        else:
-            # Check for nested provider/skill structure
-            for sub_entry in entry.iterdir():
-                if sub_entry.is_dir():
-                    has_skill = (sub_entry / "skill.json").exists() or (sub_entry / "SKILL.md").exists()
-                    if has_skill:
-                        try:
-                            skill = SkillLoader.from_directory(sub_entry)
-                            skills.append(skill)
-                        except Exception:
-                            pass
+        # Check for nested provider/skill structure
+        try:
+            with os.scandir(entry_path) as it:
+                candidates.extend(
+                    sub.path for sub in it
+                    if sub.is_dir() and _has_skill_files(sub.path)
+                )
+        except OSError:
+            continue
+    
+    if not candidates:
+        return []
     
-    return skills
+    # Loading is dominated by blocking file reads, so overlap them across threads
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(candidates))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = executor.map(_try_load_lazy, candidates)
+        return [skill for skill in loaded if skill is not None]
 
 
 # =============================================================================
 # Runtime-specific helper functions
 # =============================================================================
 
+def _skill_files_mtime(path: Optional[Path]) -> Optional[int]:
+    """Latest modification time (ns) of a skill's skill.json/SKILL.md, or None if both are gone."""
+    if path is None:
+        return None
+    
+    mtimes = []
+    for name in ("skill.json", "SKILL.md"):
+        try:
+            mtimes.append(os.stat(path / name).st_mtime_ns)
+        except OSError:
+            pass
+    return max(mtimes) if mtimes else None
+
+
 def create_mcp_resource_handler(skills_dir: Path) -> Callable:
     """
     Create an MCP resource handler that serves skills.
@@ -549,17 +806,45 @@ def create_mcp_resource_handler(skills_dir: Path) -> Callable:
         def __init__(self, skills_dir: Path):
             self.skills_dir = Path(skills_dir).expanduser()
             self._cache: Dict[str, Skill] = {}
+            self._mcp_cache: Dict[str, Dict[str, Any]] = {}
+            self._mtimes: Dict[str, Optional[int]] = {}
         
         def _load_skills(self):
             if not self._cache:
                 skills = load_skills_from_dir(self.skills_dir)
                 self._cache = {s.id: s for s in skills}
+                self._mtimes = {s.id: _skill_files_mtime(s.path) for s in skills}
             return self._cache
         
+        def _mcp_payload(self, skill_id: str) -> Optional[Dict[str, Any]]:
+            """Return the cached MCP payload for a skill, rebuilding it if its files changed."""
+            skill = self._cache[skill_id]
+            mtime = _skill_files_mtime(skill.path)
+            
+            if mtime != self._mtimes.get(skill_id):
+                self._mcp_cache.pop(skill_id, None)
+                try:
+                    if mtime is None:
+                        raise FileNotFoundError(skill.path)
+                    skill = SkillLoader.from_directory(skill.path)
+                except (OSError, ValueError):
+                    # Skill was removed or became invalid since it was loaded
+                    del self._cache[skill_id]
+                    self._mtimes.pop(skill_id, None)
+                    return None
+                self._cache[skill_id] = skill
+                self._mtimes[skill_id] = mtime
+            
+            payload = self._mcp_cache.get(skill_id)
+            if payload is None:
+                payload = self._mcp_cache[skill_id] = skill.to_mcp()
+            return payload
+        
         def list(self) -> List[Dict[str, Any]]:
             """List all skills as MCP resources."""
             skills = self._load_skills()
-            return [skill.to_mcp() for skill in skills.values()]
+            payloads = (self._mcp_payload(skill_id) for skill_id in list(skills))
+            return [payload for payload in payloads if payload is not None]
         
         def read(self, uri: str) -> Dict[str, Any]:
             """Read a skill by URI."""
@@ -570,10 +855,11 @@ def create_mcp_resource_handler(skills_dir: Path) -> Callable:
                 skill_id = uri
             
             skills = self._load_skills()
-            if skill_id not in skills:
+            payload = self._mcp_payload(skill_id) if skill_id in skills else None
+            if payload is None:
                 raise KeyError(f"Skill not found: {skill_id}")
             
-            return skills[skill_id].to_mcp()
+            return payload
     
     return MCPSkillHandler(skills_dir)
 
@@ -583,20 +869,14 @@ def export_skills_for_copilot(skills_dir: Path, output_file: Path) -> None:
     Export skills as a combined instruction file for GitHub Copilot.
     
     Creates a markdown file that can be included in copilot-instructions.md.
+    Each skill's block is written as it is produced rather than accumulated.
     """
     skills = load_skills_from_dir(skills_dir)
     
-    parts = ["# Loaded Skills", ""]
-    
-    for skill in skills:
-        parts.append(f"## {skill.name}")
-        parts.append("")
-        parts.append(skill.to_system_prompt())
-        parts.append("")
-        parts.append("---")
-        parts.append("")
-    
-    output_file.write_text("\n".join(parts))
+    with Path(output_file).open("w", encoding="utf-8") as f:
+        f.write("# Loaded Skills\n")
+        for skill in skills:
+            f.write(f"\n## {skill.name}\n\n{skill.to_system_prompt()}\n\n---\n")
 
 
 def export_skills_for_claude(skills_dir: Path, output_file: Path) -> None:
@@ -604,29 +884,21 @@ def export_skills_for_claude(skills_dir: Path, output_file: Path) -> None:
     Export skills as a combined instruction file for Claude.
     
     Creates a markdown file that can be used with CLAUDE.md.
+    Each skill's block is written as it is produced rather than accumulated.
     """
     skills = load_skills_from_dir(skills_dir)
     
-    parts = ["# Agent Skills", ""]
-    parts.append("The following skills are available for use:")
-    parts.append("")
-    
-    for skill in skills:
-        parts.append(f"## {skill.name} (v{skill.version})")
-        parts.append("")
-        if skill.description:
-            parts.append(f"> {skill.description}")
-            parts.append("")
-        parts.append(skill.instructions)
-        parts.append("")
-    
-    output_file.write_text("\n".join(parts))
+    with Path(output_file).open("w", encoding="utf-8") as f:
+        f.write("# Agent Skills\n\nThe following skills are available for use:\n")
+        for skill in skills:
+            f.write(f"\n## {skill.name} (v{skill.version})\n\n")
+            if skill.description:
+                f.write(f"> {skill.description}\n\n")
+            f.write(f"{skill.instructions}\n")
 
 
 if __name__ == "__main__":
     # Demo usage
-    import sys
-    
     if len(sys.argv) > 1:
         path = sys.argv[1]
         try:
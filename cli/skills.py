@@ -44,17 +44,74 @@ __version__ = "0.1.0"
 __author__ = "Agent Skills Directory"
 
 import argparse
+import atexit
 import json
 import os
 import sys
 import shutil
 import hashlib
+import heapq
 import re
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from typing import Optional, Dict, Any, Callable, FrozenSet, Iterator, List, Tuple, Union
+
+# urllib.request (http.client, email, ssl) and concurrent.futures (logging)
+# are imported where used: together they are over a third of the module's
+# import time, and most commands never touch the network or a thread pool
+
+# =============================================================================
+# Optional Dependencies - Graceful Degradation
+# =============================================================================
+
+# JSON: prefer orjson (C-accelerated, parses bytes directly) over stdlib json
+_HAS_ORJSON = False
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    pass
+
+if _HAS_ORJSON:
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj as 2-space indented UTF-8 JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON."""
+        return _json_dumps_bytes(obj).decode("utf-8")
+
+    _json_dumps_compact = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON."""
+        return json.dumps(obj, indent=2)
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj as 2-space indented UTF-8 JSON."""
+        return _json_dumps(obj).encode("utf-8")
+
+    def _json_dumps_compact(obj: Any) -> bytes:
+        """Serialize obj as single-line UTF-8 JSON (request bodies)."""
+        return json.dumps(obj).encode("utf-8")
+
+# HTTP: reuse keep-alive connections through a urllib3 pool when available
+_HAS_URLLIB3 = False
+try:
+    import urllib3
+    _HAS_URLLIB3 = True
+except ImportError:
+    pass
+
+_http_pool = None
 
 # =============================================================================
 # Agent Profiles - Installation paths for different AI agents/IDEs
@@ -103,6 +160,55 @@ AGENT_PROFILES = {
     },
 }
 
+# Profiles that detect_agent can match; "generic" is only ever the fallback
+_NON_GENERIC_PROFILES = [
+    (agent_id, profile) for agent_id, profile in AGENT_PROFILES.items() if agent_id != "generic"
+]
+
+# (marker, agent_id) pairs in detection priority order
+_MARKER_INDEX: List[Tuple[str, str]] = [
+    (marker, agent_id) for agent_id, profile in _NON_GENERIC_PROFILES for marker in profile["markers"]
+]
+
+# Default project install dir and personal dir per agent, for get_install_path
+_PROFILE_PROJECT0: Dict[str, str] = {
+    agent_id: profile["project_paths"][0]
+    for agent_id, profile in AGENT_PROFILES.items() if profile.get("project_paths")
+}
+_PROFILE_PERSONAL: Dict[str, Path] = {
+    agent_id: profile["personal_path"]
+    for agent_id, profile in AGENT_PROFILES.items() if profile.get("personal_path")
+}
+
+# (agent_id, env_var) pairs checked first by detect_agent
+_ENV_VARS = [
+    (agent_id, profile["env_var"]) for agent_id, profile in _NON_GENERIC_PROFILES if profile["env_var"]
+]
+
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
+class _AgentProfile:
+    """An AGENT_PROFILES entry with every field present."""
+    name: str
+    project_paths: Tuple[str, ...]
+    personal_path: Path
+    instructions_file: Optional[str]
+    env_var: Optional[str]
+    markers: Tuple[str, ...]
+
+
+AGENT_PROFILES_RESOLVED: Dict[str, _AgentProfile] = {
+    agent_id: _AgentProfile(
+        name=profile["name"],
+        project_paths=tuple(profile.get("project_paths", ())),
+        personal_path=profile["personal_path"],
+        instructions_file=profile.get("instructions_file"),
+        env_var=profile.get("env_var"),
+        markers=tuple(profile.get("markers", ())),
+    )
+    for agent_id, profile in AGENT_PROFILES.items()
+}
+
 # =============================================================================
 # Constants
 # =============================================================================
@@ -115,9 +221,11 @@ SKILLS_LOCK = SKILLS_HOME / "skills-lock.json"
 
 CATALOG_URL = "https://cdn.jsdelivr.net/gh/dmgrok/agent_skills_directory@main/catalog.json"
 CATALOG_CACHE_TTL = 3600  # 1 hour
+SKILL_NAMES_URL = "https://cdn.jsdelivr.net/gh/dmgrok/agent_skills_directory@main/exports/skill-names.json"
+GITHUB_USER_CACHE_TTL = 86400  # 24 hours
 
 # ANSI colors
-class Colors:
+class _ColorsAnsi:
     RESET = "\033[0m"
     BOLD = "\033[1m"
     DIM = "\033[2m"
@@ -127,32 +235,45 @@ class Colors:
     BLUE = "\033[34m"
     MAGENTA = "\033[35m"
     CYAN = "\033[36m"
-    
-    @classmethod
-    def disable(cls):
-        for attr in dir(cls):
-            if not attr.startswith('_') and attr != 'disable':
-                setattr(cls, attr, "")
+
+
+class _ColorsNone:
+    RESET = ""
+    BOLD = ""
+    DIM = ""
+    RED = ""
+    GREEN = ""
+    YELLOW = ""
+    BLUE = ""
+    MAGENTA = ""
+    CYAN = ""
+
 
 # Disable colors if not a TTY
-if not sys.stdout.isatty():
-    Colors.disable()
+Colors = _ColorsAnsi if sys.stdout.isatty() else _ColorsNone
+
+# Fixed colored fragments, built once now that Colors is settled
+_RULE = f"{Colors.DIM}{'─' * 40}{Colors.RESET}"
+_ERROR_PREFIX = f"{Colors.RED}error:{Colors.RESET}"
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓{Colors.RESET}"
+_INFO_PREFIX = f"{Colors.CYAN}→{Colors.RESET}"
+_WARNING_PREFIX = f"{Colors.YELLOW}warning:{Colors.RESET}"
 
 
 def print_error(msg: str):
-    print(f"{Colors.RED}error:{Colors.RESET} {msg}", file=sys.stderr)
+    print(f"{_ERROR_PREFIX} {msg}", file=sys.stderr)
 
 
 def print_success(msg: str):
-    print(f"{Colors.GREEN}✓{Colors.RESET} {msg}")
+    print(f"{_SUCCESS_PREFIX} {msg}")
 
 
 def print_info(msg: str):
-    print(f"{Colors.CYAN}→{Colors.RESET} {msg}")
+    print(f"{_INFO_PREFIX} {msg}")
 
 
 def print_warning(msg: str):
-    print(f"{Colors.YELLOW}warning:{Colors.RESET} {msg}")
+    print(f"{_WARNING_PREFIX} {msg}")
 
 
 def ensure_dirs():
@@ -160,6 +281,7 @@ def ensure_dirs():
     SKILLS_HOME.mkdir(exist_ok=True)
     SKILLS_INSTALLED.mkdir(exist_ok=True)
     SKILLS_CACHE.mkdir(exist_ok=True)
+    clear_fs_cache()
     
     if not SKILLS_CONFIG.exists():
         default_config = {
@@ -170,60 +292,161 @@ def ensure_dirs():
             "default_agent": "auto",
             "default_scope": "global"  # global or project
         }
-        SKILLS_CONFIG.write_text(json.dumps(default_config, indent=2))
+        SKILLS_CONFIG.write_text(_json_dumps(default_config), encoding="utf-8")
 
 
 def load_config() -> Dict[str, Any]:
     """Load skills configuration."""
     ensure_dirs()
-    return json.loads(SKILLS_CONFIG.read_text())
+    return _json_loads(SKILLS_CONFIG.read_bytes())
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write-then-rename so concurrent readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 
 def save_config(config: Dict[str, Any]):
     """Save skills configuration."""
-    SKILLS_CONFIG.write_text(json.dumps(config, indent=2))
+    _atomic_write_bytes(SKILLS_CONFIG, _json_dumps_bytes(config))
 
 
 def fetch_url(url: str, timeout: int = 30) -> str:
     """Fetch URL content with error handling."""
-    req = Request(url, headers={"User-Agent": f"skills-cli/{__version__}"})
+    return fetch_url_bytes(url, timeout).decode("utf-8")
+
+
+def fetch_url_bytes(url: str, timeout: int = 30) -> bytes:
+    """Fetch raw URL content; for JSON that goes straight to _json_loads or disk."""
+    return fetch_url_conditional(url, None, timeout)[0]
+
+
+def fetch_url_conditional(url: str, etag: Optional[str], timeout: int = 30) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    GET url with If-None-Match: etag.
+    
+    Returns (None, etag) on 304 Not Modified, else (body, the response's ETag or None).
+    """
+    headers = {"User-Agent": f"skills-cli/{__version__}"}
+    if etag:
+        headers["If-None-Match"] = etag
+    
+    if _HAS_URLLIB3:
+        return _fetch_url_pooled(url, headers, etag, timeout)
+    
+    from urllib.request import urlopen, Request
+    from urllib.error import URLError, HTTPError
+    
+    req = Request(url, headers=headers)
     try:
         with urlopen(req, timeout=timeout) as response:
-            return response.read().decode("utf-8")
+            return response.read(), response.headers.get("ETag")
     except HTTPError as e:
+        if e.code == 304:
+            return None, etag
         raise RuntimeError(f"HTTP {e.code}: {e.reason}")
     except URLError as e:
         raise RuntimeError(f"Network error: {e.reason}")
 
 
+def _get_http_pool() -> "urllib3.PoolManager":
+    """Return the process-wide urllib3 PoolManager, creating it on first use."""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = urllib3.PoolManager(
+            maxsize=16,
+            headers={"User-Agent": f"skills-cli/{__version__}"},
+        )
+    return _http_pool
+
+
+def _fetch_url_pooled(
+    url: str, headers: Dict[str, str], etag: Optional[str], timeout: int
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """fetch_url_conditional() over a shared urllib3 PoolManager (thread-safe, keep-alive)."""
+    try:
+        response = _get_http_pool().request("GET", url, headers=headers, timeout=timeout)
+    except urllib3.exceptions.HTTPError as e:
+        raise RuntimeError(f"Network error: {e}")
+    if response.status == 304:
+        return None, etag
+    if response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status}: {response.reason}")
+    return response.data, response.headers.get("ETag")
+
+
 def get_cache_path(url: str) -> Path:
     """Get cache file path for a URL."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()
+    url_hash = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
     return SKILLS_CACHE / f"{url_hash}.json"
 
 
-def fetch_catalog(force_refresh: bool = False) -> Dict[str, Any]:
-    """Fetch catalog with caching."""
+# Parsed catalogs for this process: registry URL -> (cache file mtime_ns, catalog)
+_CATALOG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _read_cached_catalog(url: str, cache_path: Path) -> Dict[str, Any]:
+    """Parse the on-disk catalog cache, reusing this process's copy if the file is unchanged."""
+    mtime = cache_path.stat().st_mtime_ns
+    memo = _CATALOG_CACHE.get(url)
+    if memo and memo[0] == mtime:
+        return memo[1]
+    
+    catalog = _json_loads(cache_path.read_bytes())
+    _CATALOG_CACHE[url] = (mtime, catalog)
+    return catalog
+
+
+def fetch_catalog(force_refresh: bool = False, allow_stale: bool = False) -> Dict[str, Any]:
+    """
+    Fetch catalog with caching.
+    
+    allow_stale returns any cached copy regardless of cache_ttl, for
+    callers (publish-time duplicate checks) that don't need the latest.
+    """
     config = load_config()
-    cache_path = get_cache_path(config["registry"])
+    registry = config["registry"]
+    cache_path = get_cache_path(registry)
     
     # Check cache
     if not force_refresh and cache_path.exists():
         cache_age = datetime.now().timestamp() - cache_path.stat().st_mtime
-        if cache_age < config["cache_ttl"]:
-            return json.loads(cache_path.read_text())
+        if allow_stale or cache_age < config["cache_ttl"]:
+            return _read_cached_catalog(registry, cache_path)
+    
+    # Revalidate an existing copy with its ETag rather than re-downloading it
+    etag_path = cache_path.with_suffix(".etag")
+    etag = None
+    if cache_path.exists():
+        try:
+            etag = etag_path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            pass
     
     # Fetch fresh catalog
     print_info("Fetching catalog...")
     try:
-        content = fetch_url(config["registry"])
-        catalog = json.loads(content)
-        cache_path.write_text(content)
+        content, new_etag = fetch_url_conditional(registry, etag)
+        if content is None:
+            # 304 Not Modified: keep the cached copy and restart its TTL
+            catalog = _read_cached_catalog(registry, cache_path)
+            os.utime(cache_path)
+        else:
+            # Parse and cache the raw bytes; no str copy of the catalog is made
+            catalog = _json_loads(content)
+            _atomic_write_bytes(cache_path, content)
+            if new_etag:
+                _atomic_write_bytes(etag_path, new_etag.encode("utf-8"))
+            elif etag:
+                etag_path.unlink(missing_ok=True)
+        _CATALOG_CACHE[registry] = (cache_path.stat().st_mtime_ns, catalog)
         return catalog
     except Exception as e:
         if cache_path.exists():
             print_warning(f"Using cached catalog: {e}")
-            return json.loads(cache_path.read_text())
+            return _read_cached_catalog(registry, cache_path)
         raise
 
 
@@ -231,38 +454,90 @@ def fetch_catalog(force_refresh: bool = False) -> Dict[str, Any]:
 # Agent Detection
 # =============================================================================
 
+# Short-lived results for directory probes: path -> (checked_at, is_dir)
+_ISDIR_CACHE: Dict[str, Tuple[float, bool]] = {}
+
+
+def _isdir_cached(path: Path, ttl: float = 1.0) -> bool:
+    """os.path.isdir() memoized for ttl seconds."""
+    key = os.fspath(path)
+    now = time.monotonic()
+    hit = _ISDIR_CACHE.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    
+    is_dir = os.path.isdir(key)
+    _ISDIR_CACHE[key] = (now, is_dir)
+    return is_dir
+
+
+def clear_fs_cache():
+    """Forget cached directory checks, e.g. after creating or removing skill directories."""
+    _ISDIR_CACHE.clear()
+
+
+def _dir_entries(path: Union[str, Path]) -> set:
+    """Names of the entries in a directory, or an empty set if it can't be listed."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _subdir_names(path: Path) -> set:
+    """Names of the subdirectories of a directory, or an empty set if it can't be listed."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return set()
+
+
 def detect_agent(project_path: Path = None) -> str:
-    """Detect which AI agent is being used based on environment and project structure."""
-    project_path = project_path or Path.cwd()
+    """
+    Detect which AI agent is being used based on environment and project structure.
+    
+    Results are memoized per project path; call detect_agent.cache_clear()
+    after changing the environment or creating agent directories.
+    """
+    return _detect_agent_cached(Path(project_path) if project_path else Path.cwd())
+
+
+@lru_cache(maxsize=32)
+def _detect_agent_cached(project_path: Path) -> str:
+    # Each tier is checked across all agents before the next one, so an
+    # environment variable always beats a project marker, and so on.
     
     # 1. Check environment variables
-    for agent_id, profile in AGENT_PROFILES.items():
-        if agent_id == "generic":
-            continue
-        env_var = profile.get("env_var")
-        if env_var and os.environ.get(env_var):
+    env = os.environ
+    for agent_id, env_var in _ENV_VARS:
+        if env.get(env_var):
             return agent_id
     
-    # 2. Check for agent-specific markers in project
-    for agent_id, profile in AGENT_PROFILES.items():
-        if agent_id == "generic":
-            continue
-        for marker in profile.get("markers", []):
-            if (project_path / marker).exists():
-                return agent_id
+    # 2. Check for agent-specific markers in project. Top-level markers are
+    # looked up in one listing of the project dir instead of a stat each.
+    project_str = os.fspath(project_path)
+    entries = _dir_entries(project_str)
+    for marker, agent_id in _MARKER_INDEX:
+        if marker in entries:
+            return agent_id
+        if "/" in marker and os.path.lexists(os.path.join(project_str, marker)):
+            return agent_id
     
     # 3. Check for agent-specific personal directories
-    for agent_id, profile in AGENT_PROFILES.items():
-        if agent_id == "generic":
-            continue
-        personal_path = profile.get("personal_path")
-        if personal_path and personal_path.exists():
+    for agent_id, profile in _NON_GENERIC_PROFILES:
+        personal_path = profile["personal_path"]
+        if personal_path and _isdir_cached(personal_path):
             return agent_id
     
     # 4. Default to generic
     return "generic"
 
 
+detect_agent.cache_clear = _detect_agent_cached.cache_clear
+
+
 def get_install_path(skill_id: str, agent: str = "auto", project: bool = False, project_path: Path = None) -> Path:
     """
     Determine the installation path for a skill.
@@ -277,59 +552,94 @@ def get_install_path(skill_id: str, agent: str = "auto", project: bool = False,
         Path to install the skill
     """
     project_path = project_path or Path.cwd()
-    provider, name = skill_id.split("/")
+    provider, _, name = skill_id.rpartition("/")
+    if not provider or not name:
+        raise ValueError(f"Invalid skill ID (expected provider/name): {skill_id}")
     
     # Auto-detect agent if needed
     if agent == "auto":
         agent = detect_agent(project_path)
     
-    profile = AGENT_PROFILES.get(agent, AGENT_PROFILES["generic"])
+    if agent not in AGENT_PROFILES:
+        agent = "generic"
     
     if project:
         # Install to project's skills directory
-        skills_dir = project_path / profile["project_paths"][0]
+        skills_dir = project_path / _PROFILE_PROJECT0[agent]
     else:
         # Install to personal/global directory
-        skills_dir = profile.get("personal_path", SKILLS_INSTALLED)
+        skills_dir = _PROFILE_PERSONAL.get(agent, SKILLS_INSTALLED)
     
     return skills_dir / name
 
 
 def get_all_install_locations(project_path: Path = None) -> List[Tuple[str, Path]]:
     """Get all possible skill installation locations (for listing installed skills)."""
+    return list(_iter_install_locations(project_path))
+
+
+def _iter_install_locations(project_path: Path = None) -> Iterator[Tuple[str, Path]]:
+    """Yield existing (location_type, path) install locations; project paths are only probed once reached."""
     project_path = project_path or Path.cwd()
-    locations = []
-    
-    # Global location
-    if SKILLS_INSTALLED.exists():
-        locations.append(("global", SKILLS_INSTALLED))
     
-    # Agent-specific personal locations
+    # Global and agent-specific personal locations, probing each distinct directory once
+    personal = [("global", SKILLS_INSTALLED)]
+    seen = {SKILLS_INSTALLED}
     for agent_id, profile in AGENT_PROFILES.items():
         personal_path = profile.get("personal_path")
-        if personal_path and personal_path.exists() and personal_path != SKILLS_INSTALLED:
-            locations.append((f"personal ({agent_id})", personal_path))
-    
-    # Project locations
-    for agent_id, profile in AGENT_PROFILES.items():
-        for proj_path in profile.get("project_paths", []):
-            full_path = project_path / proj_path
-            if full_path.exists():
-                locations.append((f"project ({agent_id})", full_path))
+        if not personal_path or personal_path in seen:
+            continue
+        seen.add(personal_path)
+        personal.append((f"personal ({agent_id})", personal_path))
+    
+    is_dir = _map_io(_isdir_cached, [path for _, path in personal])
+    for (location_type, path), found in zip(personal, is_dir):
+        if found:
+            yield (location_type, path)
+    
+    # Project locations, listing each parent directory only once
+    candidates = [
+        (agent_id, project_path / proj_path)
+        for agent_id, profile in AGENT_PROFILES.items()
+        for proj_path in profile.get("project_paths", [])
+    ]
+    parents = list(dict.fromkeys(full_path.parent for _, full_path in candidates))
+    parent_entries = dict(zip(parents, _map_io(_subdir_names, parents)))
+    for agent_id, full_path in candidates:
+        if full_path.name in parent_entries[full_path.parent]:
+            yield (f"project ({agent_id})", full_path)
+
+
+def _map_io(probe: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """
+    Apply a blocking filesystem probe to each item, preserving order.
     
-    return locations
+    Larger batches are spread over a small thread pool so that slow (e.g.
+    network) filesystems overlap their round trips; small ones run inline.
+    """
+    if len(items) <= 4:
+        return [probe(item) for item in items]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        return list(executor.map(probe, items))
 
 
 # =============================================================================
 # Version handling and dependency resolution
 # =============================================================================
 
+_VERSION_PREFIX_RE = re.compile(r'^[\^~>=<]+')
+_SEMVER_RE = re.compile(r'^(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:-(.+))?$')
+
+
+# Version strings repeat heavily across a catalog, so parses are memoized
+@lru_cache(maxsize=4096)
 def parse_version(version: str) -> Tuple[int, int, int, str]:
     """Parse semver string into tuple (major, minor, patch, prerelease)."""
     # Handle ^, ~, >=, etc prefixes
-    version = re.sub(r'^[\^~>=<]+', '', version.strip())
+    version = _VERSION_PREFIX_RE.sub('', version.strip())
     
-    match = re.match(r'^(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:-(.+))?$', version)
+    match = _SEMVER_RE.match(version)
     if not match:
         return (0, 0, 0, "")
     
@@ -343,69 +653,138 @@ def parse_version(version: str) -> Tuple[int, int, int, str]:
 
 def compare_versions(v1: str, v2: str) -> int:
     """Compare two semver versions. Returns -1 if v1 < v2, 0 if equal, 1 if v1 > v2."""
-    p1 = parse_version(v1)
-    p2 = parse_version(v2)
-    
-    # Compare major, minor, patch
-    for i in range(3):
-        if p1[i] < p2[i]:
-            return -1
-        if p1[i] > p2[i]:
-            return 1
-    
-    # Handle prerelease (no prerelease > prerelease)
-    if not p1[3] and p2[3]:
-        return 1
-    if p1[3] and not p2[3]:
-        return -1
-    if p1[3] < p2[3]:
-        return -1
-    if p1[3] > p2[3]:
-        return 1
-    
-    return 0
+    return _compare_parsed(parse_version(v1), parse_version(v2))
 
 
+def _version_key(parsed: Tuple[int, int, int, str]) -> Tuple[int, int, int, bool, str]:
+    """Sort key for a parse_version() tuple."""
+    # A release sorts after any prerelease of the same version, so the
+    # flag is true when there is no prerelease tag
+    return (parsed[0], parsed[1], parsed[2], not parsed[3], parsed[3])
+
+
+def _compare_parsed(p1: Tuple[int, int, int, str], p2: Tuple[int, int, int, str]) -> int:
+    """compare_versions() for versions already run through parse_version()."""
+    key1 = _version_key(p1)
+    key2 = _version_key(p2)
+    return (key1 > key2) - (key1 < key2)
+
+
+@lru_cache(maxsize=2048)
 def version_satisfies(version: str, constraint: str) -> bool:
     """Check if version satisfies a constraint (^1.0.0, ~1.0.0, >=1.0.0, etc)."""
+    return _compile_constraint(constraint)(parse_version(version))
+
+
+@lru_cache(maxsize=4096)
+def _compile_constraint(constraint: str) -> Callable[[Tuple[int, int, int, str]], bool]:
+    """
+    Turn a constraint string into a predicate over parse_version() tuples.
+    
+    The constraint's shape and base version are worked out once, so checking
+    a version against it is just a few tuple comparisons.
+    """
     constraint = constraint.strip()
     
     if not constraint or constraint == "*":
-        return True
+        return lambda ver: True
     
     # Exact version
     if constraint[0].isdigit():
-        return compare_versions(version, constraint) == 0
+        base = parse_version(constraint)
+        return lambda ver: ver == base
     
     # Caret range (^1.2.3): >=1.2.3 <2.0.0
     if constraint.startswith("^"):
         base = parse_version(constraint[1:])
-        ver = parse_version(version)
-        
-        if ver[0] != base[0]:  # Major must match
-            return False
-        if ver[0] == 0:  # 0.x.y - minor must match
-            return ver[1] == base[1] and ver[2] >= base[2]
-        return compare_versions(version, constraint[1:]) >= 0
+        if base[0] == 0:  # 0.x.y - minor must match
+            return lambda ver: ver[0] == 0 and ver[1] == base[1] and ver[2] >= base[2]
+        base_key = _version_key(base)
+        return lambda ver: ver[0] == base[0] and _version_key(ver) >= base_key
     
     # Tilde range (~1.2.3): >=1.2.3 <1.3.0
     if constraint.startswith("~"):
         base = parse_version(constraint[1:])
-        ver = parse_version(version)
-        
-        return ver[0] == base[0] and ver[1] == base[1] and ver[2] >= base[2]
+        return lambda ver: ver[0] == base[0] and ver[1] == base[1] and ver[2] >= base[2]
     
     # Greater/less than
     if constraint.startswith(">="):
-        return compare_versions(version, constraint[2:]) >= 0
+        base_key = _version_key(parse_version(constraint[2:]))
+        return lambda ver: _version_key(ver) >= base_key
     if constraint.startswith("<="):
-        return compare_versions(version, constraint[2:]) <= 0
+        base_key = _version_key(parse_version(constraint[2:]))
+        return lambda ver: _version_key(ver) <= base_key
     if constraint.startswith(">"):
-        return compare_versions(version, constraint[1:]) > 0
+        base_key = _version_key(parse_version(constraint[1:]))
+        return lambda ver: _version_key(ver) > base_key
     if constraint.startswith("<"):
-        return compare_versions(version, constraint[1:]) < 0
+        base_key = _version_key(parse_version(constraint[1:]))
+        return lambda ver: _version_key(ver) < base_key
+    
+    return lambda ver: False
+
+
+# "skill_json_url@commit_sha" -> dependencies declared in that skill.json.
+# Loaded from and saved to SKILLS_CACHE/manifests.json so later runs skip the
+# fetch; the commit SHA changes whenever the upstream skill.json can have.
+_manifest_cache: Optional[Dict[str, Dict[str, str]]] = None
+_manifest_cache_dirty = False
+
+# skill_json_url -> dependencies for skills without a commit_sha; nothing pins
+# their content, so they are only reused within this process
+_unpinned_manifest_cache: Dict[str, Dict[str, str]] = {}
+
+
+def _load_manifest_cache() -> Dict[str, Dict[str, str]]:
+    global _manifest_cache
+    if _manifest_cache is None:
+        try:
+            _manifest_cache = _json_loads((SKILLS_CACHE / "manifests.json").read_bytes())
+        except (OSError, ValueError):
+            _manifest_cache = {}
+    return _manifest_cache
+
+
+def _save_manifest_cache():
+    global _manifest_cache_dirty
+    if not _manifest_cache_dirty:
+        return
+    try:
+        SKILLS_CACHE.mkdir(parents=True, exist_ok=True)
+        (SKILLS_CACHE / "manifests.json").write_text(_json_dumps(_manifest_cache), encoding="utf-8")
+        _manifest_cache_dirty = False
+    except OSError:
+        pass  # Cache is best-effort
+
+
+def _get_skill_dependencies(skill: Dict) -> Dict[str, str]:
+    """Dependencies from a catalog skill's skill.json, fetched once per source commit."""
+    global _manifest_cache_dirty
+    source = skill.get("source", {})
+    manifest_url = source.get("skill_json_url")
+    if not manifest_url:
+        return {}
+    
+    commit_sha = source.get("commit_sha")
+    if commit_sha:
+        cache = _load_manifest_cache()
+        key = f"{manifest_url}@{commit_sha}"
+    else:
+        cache = _unpinned_manifest_cache
+        key = manifest_url
+    if key in cache:
+        return cache[key]
     
-    return False
+    try:
+        manifest = _json_loads(fetch_url(manifest_url))
+        dependencies = manifest.get("dependencies", {})
+    except Exception:
+        return {}  # No manifest or fetch failed, no dependencies (not cached, may be transient)
+    
+    cache[key] = dependencies
+    if commit_sha:
+        _manifest_cache_dirty = True
+    return dependencies
 
 
 def resolve_dependencies(
@@ -416,7 +795,10 @@ def resolve_dependencies(
     depth: int = 0
 ) -> Tuple[Dict[str, Dict], List[str]]:
     """
-    Resolve dependencies for a skill recursively.
+    Resolve dependencies for a skill, breadth-first.
+    
+    The dependency manifests of each level are fetched concurrently, and a
+    dependency's depth is its shortest distance from the requested skill.
     
     Returns:
         (resolved_deps, errors): Dict of skill_id -> {skill, version, depth}, list of errors
@@ -425,100 +807,145 @@ def resolve_dependencies(
         resolved = {}
     
     errors = []
-    max_depth = 10  # Prevent infinite loops
+    max_depth = 10  # Prevent runaway dependency chains
     
-    if depth > max_depth:
-        errors.append(f"Maximum dependency depth ({max_depth}) exceeded")
-        return resolved, errors
-    
-    skill = find_skill(catalog, skill_id)
+    catalog_index = _per_catalog(_catalog_index, catalog, _build_catalog_index)
+    skill = catalog_index.get(skill_id)
     if not skill:
         errors.append(f"Skill not found: {skill_id}")
         return resolved, errors
     
-    # Get dependencies from skill manifest or catalog
-    source = skill.get("source", {})
-    manifest_url = source.get("skill_json_url")
-    
-    dependencies = {}
-    
-    # Try to fetch skill.json for dependencies
-    if manifest_url:
-        try:
-            manifest_content = fetch_url(manifest_url)
-            manifest = json.loads(manifest_content)
-            dependencies = manifest.get("dependencies", {})
-        except Exception:
-            pass  # No manifest or fetch failed, no dependencies
-    
-    # Process each dependency
-    for dep_id, version_constraint in dependencies.items():
-        if dep_id in resolved:
-            # Check version compatibility
-            existing_version = resolved[dep_id].get("version", "0.0.0")
-            if not version_satisfies(existing_version, version_constraint):
-                errors.append(
-                    f"Version conflict: {dep_id} requires {version_constraint}, "
-                    f"but {existing_version} is already resolved"
-                )
-            continue
-        
-        dep_skill = find_skill(catalog, dep_id)
-        if not dep_skill:
-            errors.append(f"Dependency not found: {dep_id} (required by {skill_id})")
-            continue
-        
-        dep_version = dep_skill.get("version", "0.0.0")
-        
-        # Check if version satisfies constraint
-        if not version_satisfies(dep_version, version_constraint):
-            errors.append(
-                f"No compatible version for {dep_id}: requires {version_constraint}, "
-                f"available: {dep_version}"
-            )
-            continue
-        
-        resolved[dep_id] = {
-            "skill": dep_skill,
-            "version": dep_version,
-            "constraint": version_constraint,
-            "required_by": skill_id,
-            "depth": depth + 1
-        }
+    _load_manifest_cache()  # Load once up front rather than from the fetch threads
+    level = [(skill_id, skill)]
+    
+    # Version chosen for every skill seen so far, including the requested one,
+    # so each skill's manifest is expanded exactly once even through cycles
+    chosen = {skill_id: skill.get("version", "0.0.0")}
+    chosen.update((dep_id, info.get("version", "0.0.0")) for dep_id, info in resolved.items())
+    
+    while level:
+        if depth > max_depth:
+            errors.append(f"Maximum dependency depth ({max_depth}) exceeded")
+            break
+        
+        # Get dependencies from each skill's manifest
+        level_dependencies = _map_io(_get_skill_dependencies, [s for _, s in level])
+        
+        next_level = []
+        for (parent_id, _), dependencies in zip(level, level_dependencies):
+            for dep_id, version_constraint in dependencies.items():
+                if dep_id in chosen:
+                    # Check version compatibility
+                    existing_version = chosen[dep_id]
+                    if not version_satisfies(existing_version, version_constraint):
+                        errors.append(
+                            f"Version conflict: {dep_id} requires {version_constraint}, "
+                            f"but {existing_version} is already resolved"
+                        )
+                    continue
+                
+                dep_skill = catalog_index.get(dep_id)
+                if not dep_skill:
+                    errors.append(f"Dependency not found: {dep_id} (required by {parent_id})")
+                    continue
+                
+                dep_version = dep_skill.get("version", "0.0.0")
+                
+                # Check if version satisfies constraint
+                if not version_satisfies(dep_version, version_constraint):
+                    errors.append(
+                        f"No compatible version for {dep_id}: requires {version_constraint}, "
+                        f"available: {dep_version}"
+                    )
+                    continue
+                
+                resolved[dep_id] = {
+                    "skill": dep_skill,
+                    "version": dep_version,
+                    "constraint": version_constraint,
+                    "required_by": parent_id,
+                    "depth": depth + 1
+                }
+                chosen[dep_id] = dep_version
+                next_level.append((dep_id, dep_skill))
         
-        # Recursively resolve dependencies
-        _, sub_errors = resolve_dependencies(dep_id, catalog, installed, resolved, depth + 1)
-        errors.extend(sub_errors)
+        level = next_level
+        depth += 1
+    
+    _save_manifest_cache()
     
     return resolved, errors
 
 
 def parse_skill_spec(spec: str) -> tuple[str, Optional[str]]:
     """Parse skill@version specification."""
-    if "@" in spec and not spec.startswith("@"):
-        parts = spec.rsplit("@", 1)
-        return parts[0], parts[1]
-    return spec, None
+    head, sep, tail = spec.rpartition("@")
+    if not sep or not head:
+        return spec, None
+    return head, tail
+
+
+def _per_catalog(cache: Dict[int, Tuple[Dict, Any]], catalog: Dict, build: Callable[[Dict], Any]) -> Any:
+    """
+    Return build(catalog), computed once per catalog object.
+    
+    Entries are keyed by id(catalog) and hold the catalog itself so the id
+    can't be reused while cached. Catalogs are treated as read-only.
+    """
+    entry = cache.get(id(catalog))
+    if entry is None:
+        if len(cache) >= 8:
+            cache.clear()
+        entry = cache[id(catalog)] = (catalog, build(catalog))
+    return entry[1]
+
+
+def _build_catalog_index(catalog: Dict) -> Dict[str, Dict]:
+    index = {}
+    for skill in catalog.get("skills", []):
+        index.setdefault(skill["id"], skill)  # First entry wins, as with a linear scan
+    return index
+
+
+# id(catalog) -> (catalog, {skill_id: skill})
+_catalog_index: Dict[int, Tuple[Dict, Dict[str, Dict]]] = {}
 
 
 def find_skill(catalog: Dict, skill_id: str) -> Optional[Dict]:
     """Find a skill by ID."""
-    for skill in catalog.get("skills", []):
-        if skill["id"] == skill_id:
-            return skill
-    return None
+    return _per_catalog(_catalog_index, catalog, _build_catalog_index).get(skill_id)
+
+
+def _build_search_index(catalog: Dict) -> List[Tuple[str, str, FrozenSet[str]]]:
+    """Lowercased (name, description, tags) per catalog skill, in catalog order."""
+    return [
+        (
+            skill.get("name", "").lower(),
+            skill.get("description", "").lower(),
+            frozenset(t.lower() for t in skill.get("tags", [])),
+        )
+        for skill in catalog.get("skills", [])
+    ]
+
 
+# id(catalog) -> (catalog, search index)
+_search_index: Dict[int, Tuple[Dict, List[Tuple[str, str, FrozenSet[str]]]]] = {}
 
-def search_skills(catalog: Dict, query: str) -> List[Dict]:
-    """Search skills by query."""
+
+def search_skills(catalog: Dict, query: str, limit: Optional[int] = None) -> List[Dict]:
+    """Search skills by query, best matches first, keeping at most limit results."""
+    return _top_matches(catalog, _score_skills(catalog, query), limit)
+
+
+def _score_skills(catalog: Dict, query: str) -> List[Tuple[int, int]]:
+    """(score, catalog index) for every skill matching the query, in catalog order."""
     query_lower = query.lower()
-    results = []
+    words = query_lower.split()
+    index = _per_catalog(_search_index, catalog, _build_search_index)
+    scored = []
     
-    for skill in catalog.get("skills", []):
+    for i, (name, desc, tags) in enumerate(index):
         score = 0
-        name = skill.get("name", "").lower()
-        desc = skill.get("description", "").lower()
-        tags = [t.lower() for t in skill.get("tags", [])]
         
         # Exact name match
         if query_lower == name:
@@ -534,7 +961,7 @@ def search_skills(catalog: Dict, query: str) -> List[Dict]:
             score += 30
         
         # Word matching
-        for word in query_lower.split():
+        for word in words:
             if word in name:
                 score += 10
             if word in desc:
@@ -543,72 +970,104 @@ def search_skills(catalog: Dict, query: str) -> List[Dict]:
                 score += 8
         
         if score > 0:
-            results.append((score, skill))
+            scored.append((score, i))
     
-    results.sort(key=lambda x: x[0], reverse=True)
-    return [skill for _, skill in results]
+    return scored
+
+
+def _top_matches(catalog: Dict, scored: List[Tuple[int, int]], limit: Optional[int] = None) -> List[Dict]:
+    """Skills for the highest scores; equal scores keep catalog order."""
+    skills = catalog.get("skills", [])
+    if limit is None or limit >= len(scored):
+        top = sorted(scored, key=itemgetter(0), reverse=True)
+    else:
+        # Only the first `limit` are shown, so avoid sorting every match
+        top = heapq.nlargest(limit, scored, key=itemgetter(0))
+    return [skills[i] for _, i in top]
+
+
+def _scandir_dirs(path: Union[str, Path]) -> List[os.DirEntry]:
+    """Subdirectory entries of path (following symlinks), or [] if it can't be listed."""
+    try:
+        with os.scandir(path) as it:
+            return [entry for entry in it if entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _has_skill_file(dir_path: str) -> bool:
+    """Check whether a directory directly contains SKILL.md or skill.json."""
+    return (
+        os.path.isfile(os.path.join(dir_path, "SKILL.md"))
+        or os.path.isfile(os.path.join(dir_path, "skill.json"))
+    )
 
 
 def get_installed_skills(project_path: Path = None) -> Dict[str, Dict]:
-    """Get dictionary of all installed skills across all locations."""
+    """
+    Get dictionary of all installed skills across all locations.
+    
+    The scan is cached per project path for the rest of the process and
+    must not be mutated; commands that add or remove skills call
+    _invalidate_installed_cache().
+    """
+    return _scan_installed_skills(str(project_path or Path.cwd()))
+
+
+def _invalidate_installed_cache():
+    """Drop cached get_installed_skills() results after skills change on disk."""
+    _scan_installed_skills.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _scan_installed_skills(project_path: str) -> Dict[str, Dict]:
     installed = {}
-    project_path = project_path or Path.cwd()
     
     def scan_skills_dir(base_path: Path, location_type: str):
         """Scan a skills directory for installed skills."""
-        if not base_path.exists():
-            return
-        
         # Skills can be either:
         # 1. Nested: base_path/provider/skill-name/
         # 2. Flat: base_path/skill-name/
-        
-        for entry in base_path.iterdir():
-            if not entry.is_dir():
-                continue
+        for entry in _scandir_dirs(base_path):
+            subdirs = _scandir_dirs(entry.path)
             
             # Check if this is a provider directory (has subdirectories with SKILL.md)
-            has_nested_skills = any(
-                (entry / sub / "SKILL.md").exists() or (entry / sub / "skill.json").exists()
-                for sub in entry.iterdir() if sub.is_dir()
-            )
-            
-            if has_nested_skills:
+            if any(_has_skill_file(sub.path) for sub in subdirs):
                 # Provider/skill structure
-                provider = entry.name
-                for skill_dir in entry.iterdir():
-                    if not skill_dir.is_dir():
-                        continue
-                    add_skill_from_dir(skill_dir, f"{provider}/{skill_dir.name}", location_type)
+                for skill_dir in subdirs:
+                    add_skill_from_dir(skill_dir, f"{entry.name}/{skill_dir.name}", location_type)
             else:
                 # Flat structure (skill directly in skills dir)
                 add_skill_from_dir(entry, f"local/{entry.name}", location_type)
     
-    def add_skill_from_dir(skill_dir: Path, skill_id: str, location_type: str):
+    def add_skill_from_dir(skill_dir: os.DirEntry, skill_id: str, location_type: str):
         """Add a skill from a directory to the installed dict."""
-        manifest_path = skill_dir / "skill.json"
-        skill_md_path = skill_dir / "SKILL.md"
+        try:
+            with open(os.path.join(skill_dir.path, "skill.json"), "rb") as f:
+                raw_manifest = f.read()
+        except OSError:
+            raw_manifest = None
         
-        if manifest_path.exists():
+        if raw_manifest is not None:
             try:
-                manifest = json.loads(manifest_path.read_text())
-            except json.JSONDecodeError:
+                manifest = _json_loads(raw_manifest)
+            except ValueError:
                 manifest = {}
-        elif skill_md_path.exists():
+        elif os.path.isfile(os.path.join(skill_dir.path, "SKILL.md")):
             # Extract basic info from SKILL.md
             manifest = {"name": skill_dir.name, "version": "0.0.0"}
         else:
             return
         
         installed[skill_id] = {
-            "path": str(skill_dir),
+            "path": skill_dir.path,
             "manifest": manifest,
             "version": manifest.get("version", "0.0.0"),
             "location": location_type
         }
     
     # Scan all possible locations
-    for location_type, path in get_all_install_locations(project_path):
+    for location_type, path in _iter_install_locations(Path(project_path)):
         scan_skills_dir(path, location_type)
     
     return installed
@@ -617,7 +1076,9 @@ def get_installed_skills(project_path: Path = None) -> Dict[str, Dict]:
 def cmd_search(args):
     """Search for skills."""
     catalog = fetch_catalog()
-    results = search_skills(catalog, args.query)
+    max_results = args.limit or 20
+    scored = _score_skills(catalog, args.query)
+    results = _top_matches(catalog, scored, max_results)
     
     # Track search for analytics
     track_search(args.query)
@@ -626,12 +1087,13 @@ def cmd_search(args):
         print_warning(f"No skills found for '{args.query}'")
         return 1
     
-    print(f"\n{Colors.BOLD}Found {len(results)} skill(s):{Colors.RESET}\n")
+    print(f"\n{Colors.BOLD}Found {len(scored)} skill(s):{Colors.RESET}\n")
     
     installed = get_installed_skills()
-    max_results = args.limit or 20
     
-    for skill in results[:max_results]:
+    # Build the whole listing and write it once
+    lines = []
+    for skill in results:
         skill_id = skill["id"]
         is_installed = skill_id in installed
         
@@ -644,18 +1106,19 @@ def cmd_search(args):
             score_color = Colors.GREEN if quality_score >= 80 else Colors.YELLOW if quality_score >= 60 else Colors.RED
             score_badge = f" {score_color}⭐{quality_score}{Colors.RESET}"
         
-        print(f"  {Colors.BOLD}{skill_id}{Colors.RESET}{score_badge} {status}")
-        print(f"  {Colors.DIM}{skill.get('description', 'No description')[:80]}{Colors.RESET}")
+        lines.append(f"  {Colors.BOLD}{skill_id}{Colors.RESET}{score_badge} {status}")
+        lines.append(f"  {Colors.DIM}{skill.get('description', 'No description')[:80]}{Colors.RESET}")
         
         tags = skill.get("tags", [])[:5]
         if tags:
             tag_str = " ".join(f"{Colors.CYAN}#{t}{Colors.RESET}" for t in tags)
-            print(f"  {tag_str}")
-        print()
+            lines.append(f"  {tag_str}")
+        lines.append("")
     
-    if len(results) > max_results:
-        print(f"  {Colors.DIM}... and {len(results) - max_results} more (use --limit to see more){Colors.RESET}\n")
+    if len(scored) > max_results:
+        lines.append(f"  {Colors.DIM}... and {len(scored) - max_results} more (use --limit to see more){Colors.RESET}\n")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -672,19 +1135,21 @@ def cmd_info(args):
     installed = get_installed_skills()
     is_installed = skill_id in installed
     
-    print(f"\n{Colors.BOLD}{skill['name']}{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
-    print(f"  {Colors.CYAN}id:{Colors.RESET}          {skill['id']}")
-    print(f"  {Colors.CYAN}provider:{Colors.RESET}    {skill['provider']}")
-    print(f"  {Colors.CYAN}category:{Colors.RESET}    {skill['category']}")
-    print(f"  {Colors.CYAN}description:{Colors.RESET} {skill.get('description', 'N/A')}")
+    # Build the whole report and write it once
+    lines = []
+    lines.append(f"\n{Colors.BOLD}{skill['name']}{Colors.RESET}")
+    lines.append(_RULE)
+    lines.append(f"  {Colors.CYAN}id:{Colors.RESET}          {skill['id']}")
+    lines.append(f"  {Colors.CYAN}provider:{Colors.RESET}    {skill['provider']}")
+    lines.append(f"  {Colors.CYAN}category:{Colors.RESET}    {skill['category']}")
+    lines.append(f"  {Colors.CYAN}description:{Colors.RESET} {skill.get('description', 'N/A')}")
     
     if skill.get("license"):
-        print(f"  {Colors.CYAN}license:{Colors.RESET}     {skill['license']}")
+        lines.append(f"  {Colors.CYAN}license:{Colors.RESET}     {skill['license']}")
     
     if skill.get("last_updated_at"):
         updated = skill["last_updated_at"][:10]
-        print(f"  {Colors.CYAN}updated:{Colors.RESET}     {updated}")
+        lines.append(f"  {Colors.CYAN}updated:{Colors.RESET}     {updated}")
         
         # Show maintenance status
         maint_status = skill.get("maintenance_status")
@@ -693,62 +1158,63 @@ def cmd_info(args):
             status_emoji = {"active": "🟢", "maintained": "🟡", "stale": "🟠", "abandoned": "🔴"}.get(maint_status, "⚪")
             status_label = maint_status.capitalize()
             if days_since is not None:
-                print(f"  {Colors.CYAN}maintenance:{Colors.RESET}  {status_emoji} {status_label} ({days_since} days ago)")
+                lines.append(f"  {Colors.CYAN}maintenance:{Colors.RESET}  {status_emoji} {status_label} ({days_since} days ago)")
             else:
-                print(f"  {Colors.CYAN}maintenance:{Colors.RESET}  {status_emoji} {status_label}")
+                lines.append(f"  {Colors.CYAN}maintenance:{Colors.RESET}  {status_emoji} {status_label}")
     
     # Show quality score
     quality_score = skill.get("quality_score")
     if quality_score is not None:
         score_color = Colors.GREEN if quality_score >= 80 else Colors.YELLOW if quality_score >= 60 else Colors.RED
-        print(f"  {Colors.CYAN}quality:{Colors.RESET}     {score_color}⭐ {quality_score}/100{Colors.RESET}")
+        lines.append(f"  {Colors.CYAN}quality:{Colors.RESET}     {score_color}⭐ {quality_score}/100{Colors.RESET}")
 
     # Community signals
     github_stars = skill.get("github_stars")
     if github_stars is not None:
-        print(f"  {Colors.CYAN}repo stars:{Colors.RESET}  ⭐ {github_stars:,}")
+        lines.append(f"  {Colors.CYAN}repo stars:{Colors.RESET}  ⭐ {github_stars:,}")
 
     # MCP requirement
     if skill.get("requires_mcp"):
-        print(f"  {Colors.YELLOW}requires_mcp:{Colors.RESET} ⚠️  Yes — an MCP server must be running to use this skill")
+        lines.append(f"  {Colors.YELLOW}requires_mcp:{Colors.RESET} ⚠️  Yes — an MCP server must be running to use this skill")
     
     tags = skill.get("tags", [])
     if tags:
         tag_str = ", ".join(tags)
-        print(f"  {Colors.CYAN}tags:{Colors.RESET}        {tag_str}")
+        lines.append(f"  {Colors.CYAN}tags:{Colors.RESET}        {tag_str}")
     
     source = skill.get("source", {})
     if source.get("repo"):
-        print(f"  {Colors.CYAN}repo:{Colors.RESET}        {source['repo']}")
+        lines.append(f"  {Colors.CYAN}repo:{Colors.RESET}        {source['repo']}")
     if source.get("skill_md_url"):
-        print(f"  {Colors.CYAN}skill.md:{Colors.RESET}    {source['skill_md_url']}")
+        lines.append(f"  {Colors.CYAN}skill.md:{Colors.RESET}    {source['skill_md_url']}")
     
-    print(f"\n  {Colors.CYAN}has_scripts:{Colors.RESET}    {'yes' if skill.get('has_scripts') else 'no'}")
-    print(f"  {Colors.CYAN}has_references:{Colors.RESET} {'yes' if skill.get('has_references') else 'no'}")
-    print(f"  {Colors.CYAN}has_assets:{Colors.RESET}     {'yes' if skill.get('has_assets') else 'no'}")
+    lines.append(f"\n  {Colors.CYAN}has_scripts:{Colors.RESET}    {'yes' if skill.get('has_scripts') else 'no'}")
+    lines.append(f"  {Colors.CYAN}has_references:{Colors.RESET} {'yes' if skill.get('has_references') else 'no'}")
+    lines.append(f"  {Colors.CYAN}has_assets:{Colors.RESET}     {'yes' if skill.get('has_assets') else 'no'}")
     
     if is_installed:
         inst = installed[skill_id]
-        print(f"\n  {Colors.GREEN}✓ Installed{Colors.RESET} (v{inst['version']} at {inst['path']})")
+        lines.append(f"\n  {Colors.GREEN}✓ Installed{Colors.RESET} (v{inst['version']} at {inst['path']})")
     else:
-        print(f"\n  {Colors.DIM}Not installed locally{Colors.RESET}")
+        lines.append(f"\n  {Colors.DIM}Not installed locally{Colors.RESET}")
     
     # Suggest skills.sh for actual installation
-    print(f"\n{Colors.BOLD}Installation Options:{Colors.RESET}")
-    print(f"  {Colors.CYAN}1. Via skills.sh (recommended):{Colors.RESET}")
-    print(f"     skills.sh install {skill['provider']}/{skill['name'].lower().replace(' ', '-')}")
-    print(f"\n  {Colors.CYAN}2. Manual from source:{Colors.RESET}")
+    lines.append(f"\n{Colors.BOLD}Installation Options:{Colors.RESET}")
+    lines.append(f"  {Colors.CYAN}1. Via skills.sh (recommended):{Colors.RESET}")
+    lines.append(f"     skills.sh install {skill['provider']}/{skill['name'].lower().replace(' ', '-')}")
+    lines.append(f"\n  {Colors.CYAN}2. Manual from source:{Colors.RESET}")
     if source.get("skill_md_url"):
-        print(f"     curl -O {source['skill_md_url']}")
-    print(f"\n  {Colors.DIM}💡 This directory provides quality metrics. Use skills.sh for package management.{Colors.RESET}")
+        lines.append(f"     curl -O {source['skill_md_url']}")
+    lines.append(f"\n  {Colors.DIM}💡 This directory provides quality metrics. Use skills.sh for package management.{Colors.RESET}")
     
-    print()
+    sys.stdout.write("\n".join(lines) + "\n\n")
     return 0
 
 
 def install_single_skill(
     skill: Dict,
     catalog: Dict,
+    installed: Dict[str, Dict],
     version: Optional[str] = None,
     agent: str = "auto",
     project: bool = False,
@@ -756,20 +1222,57 @@ def install_single_skill(
 ) -> Tuple[bool, Path]:
     """
     Install a single skill (helper for cmd_install).
+    
+    installed is the caller's copy of get_installed_skills(); it is updated
+    in place so a batch of installs doesn't rescan the filesystem.
     Returns (success, install_path).
     """
     skill_id = skill["id"]
-    installed = get_installed_skills()
     
     if skill_id in installed and not force:
         return True, Path(installed[skill_id]["path"])
     
     install_path = get_install_path(skill_id, agent=agent, project=project)
     install_path.mkdir(parents=True, exist_ok=True)
+    clear_fs_cache()
     
     detected_agent = detect_agent() if agent == "auto" else agent
     location_desc = f"project ({detected_agent})" if project else "global"
     
+    _write_skill_files(skill, catalog, installed, install_path, version, location_desc, detected_agent)
+    return True, install_path
+
+
+def _reinstall(skill: Dict, catalog: Dict, installed: Dict[str, Dict]) -> Path:
+    """
+    Refresh an installed skill in place from the catalog.
+    
+    Uses the install path and agent recorded in installed (no filesystem
+    rescan) and keeps the skill where it was installed.
+    """
+    existing = installed[skill["id"]]
+    install_path = Path(existing["path"])
+    manifest = existing.get("manifest", {})
+    _write_skill_files(
+        skill, catalog, installed, install_path, None,
+        manifest.get("installed_to", existing.get("location", "global")),
+        manifest.get("agent", "generic"),
+    )
+    return install_path
+
+
+def _write_skill_files(
+    skill: Dict,
+    catalog: Dict,
+    installed: Dict[str, Dict],
+    install_path: Path,
+    version: Optional[str],
+    location_desc: str,
+    detected_agent: str
+):
+    """Write SKILL.md and skill.json for a skill and record it in installed."""
+    skill_id = skill["id"]
+    
     # Fetch SKILL.md
     source = skill.get("source", {})
     skill_md_url = source.get("skill_md_url")
@@ -777,7 +1280,7 @@ def install_single_skill(
     if skill_md_url:
         try:
             skill_md_content = fetch_url(skill_md_url)
-            (install_path / "SKILL.md").write_text(skill_md_content)
+            (install_path / "SKILL.md").write_text(skill_md_content, encoding="utf-8")
         except Exception as e:
             print_warning(f"Could not fetch SKILL.md for {skill_id}: {e}")
     
@@ -800,9 +1303,14 @@ def install_single_skill(
         }
     }
     
-    (install_path / "skill.json").write_text(json.dumps(manifest, indent=2))
-    
-    return True, install_path
+    (install_path / "skill.json").write_bytes(_json_dumps_bytes(manifest))
+    _invalidate_installed_cache()
+    installed[skill_id] = {
+        "path": str(install_path),
+        "manifest": manifest,
+        "version": manifest["version"],
+        "location": location_desc
+    }
 
 
 def cmd_install(args):
@@ -817,7 +1325,8 @@ def cmd_install(args):
         print_error(f"Skill not found: {skill_id}")
         return 1
     
-    installed = get_installed_skills()
+    # Private copy: install_single_skill records each install in it
+    installed = dict(get_installed_skills())
     if skill_id in installed and not args.force:
         existing = installed[skill_id]
         print_warning(f"Skill already installed: {skill_id}")
@@ -865,7 +1374,7 @@ def cmd_install(args):
         
         print_info(f"Installing dependency {dep_id}...")
         success, dep_path = install_single_skill(
-            dep_info["skill"], catalog,
+            dep_info["skill"], catalog, installed,
             version=dep_info.get("version"),
             agent=agent, project=project_mode, force=args.force
         )
@@ -875,7 +1384,7 @@ def cmd_install(args):
     # Install main skill
     print_info(f"Installing {skill_id} [{location_desc}]...")
     success, install_path = install_single_skill(
-        skill, catalog, version=version,
+        skill, catalog, installed, version=version,
         agent=agent, project=project_mode, force=args.force
     )
     
@@ -894,9 +1403,9 @@ def cmd_install(args):
             print(f"  {Colors.DIM}Dependencies were skipped (--no-deps). Install manually if needed.{Colors.RESET}")
     
     # Show agent-specific guidance
-    profile = AGENT_PROFILES.get(detected_agent, AGENT_PROFILES["generic"])
-    if project_mode and profile.get("instructions_file"):
-        print_info(f"Tip: Reference this skill in your {profile['instructions_file']}")
+    profile = AGENT_PROFILES_RESOLVED[detected_agent]
+    if project_mode and profile.instructions_file:
+        print_info(f"Tip: Reference this skill in your {profile.instructions_file}")
     
     return 0
 
@@ -924,6 +1433,8 @@ def cmd_uninstall(args):
     provider_dir = install_path.parent
     if provider_dir.exists() and not any(provider_dir.iterdir()):
         provider_dir.rmdir()
+    clear_fs_cache()
+    _invalidate_installed_cache()
     
     print_success(f"Uninstalled {skill_id}")
     return 0
@@ -939,10 +1450,10 @@ def cmd_list(args):
         return 0
     
     if args.json:
-        print(json.dumps(installed, indent=2))
+        sys.stdout.write(_json_dumps(installed) + "\n")
         return 0
     
-    print(f"\n{Colors.BOLD}Installed skills ({len(installed)}):{Colors.RESET}\n")
+    lines = [f"\n{Colors.BOLD}Installed skills ({len(installed)}):{Colors.RESET}\n"]
     
     # Group by location
     by_location = {}
@@ -953,15 +1464,16 @@ def cmd_list(args):
         by_location[location].append((skill_id, info))
     
     for location, skills in sorted(by_location.items()):
-        print(f"  {Colors.CYAN}[{location}]{Colors.RESET}")
+        lines.append(f"  {Colors.CYAN}[{location}]{Colors.RESET}")
         for skill_id, info in sorted(skills):
             version = info.get("version", "?")
             desc = info.get("manifest", {}).get("description", "")[:45]
-            print(f"    {Colors.BOLD}{skill_id}{Colors.RESET}@{version}")
+            lines.append(f"    {Colors.BOLD}{skill_id}{Colors.RESET}@{version}")
             if desc:
-                print(f"    {Colors.DIM}{desc}{Colors.RESET}")
-        print()
+                lines.append(f"    {Colors.DIM}{desc}{Colors.RESET}")
+        lines.append("")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -1007,7 +1519,8 @@ def cmd_init(args):
     manifest = {k: v for k, v in manifest.items() if v is not None}
     
     target_dir.mkdir(parents=True, exist_ok=True)
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    clear_fs_cache()
+    manifest_path.write_text(_json_dumps(manifest), encoding="utf-8")
     
     # Create SKILL.md template if it doesn't exist
     skill_md_path = target_dir / "SKILL.md"
@@ -1046,7 +1559,8 @@ Any configuration options.
 
 def cmd_update(args):
     """Update installed skills."""
-    installed = get_installed_skills()
+    # Private copy: reinstalls record themselves in it instead of rescanning
+    installed = dict(get_installed_skills())
     
     if not installed:
         print_info("No skills installed")
@@ -1080,11 +1594,20 @@ def cmd_update(args):
             return 0
     
     for skill_id in updates_available:
-        # Simulate args for install
-        class InstallArgs:
-            skill_id = skill_id
-            force = True
-        cmd_install(InstallArgs())
+        print_info(f"Updating {skill_id}...")
+        install_path = _reinstall(find_skill(catalog, skill_id), catalog, installed)
+        print_success(f"Updated {skill_id} → {install_path}")
+        
+        # Pick up any dependencies the new version added
+        deps, dep_errors = resolve_dependencies(skill_id, catalog, installed)
+        for err in dep_errors:
+            print_warning(err)
+        for dep_id, dep_info in sorted(deps.items(), key=lambda x: -x[1]["depth"]):
+            if dep_id in installed:
+                continue
+            print_info(f"Installing dependency {dep_id}...")
+            _, dep_path = install_single_skill(dep_info["skill"], catalog, installed, version=dep_info.get("version"))
+            print_success(f"Installed {dep_id} → {dep_path}")
     
     return 0
 
@@ -1160,7 +1683,7 @@ def cmd_run(args):
     print(f"{Colors.YELLOW}Note: Skill execution requires an AI agent runtime.{Colors.RESET}")
     print(f"Load this skill in your MCP server, LangChain, or other agent framework.")
     print(f"\nSKILL.md content preview:")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(_RULE)
     
     content = entry_path.read_text()
     preview = content[:500]
@@ -1175,46 +1698,46 @@ def cmd_detect(args):
     """Show detected agent and skill paths."""
     project_path = Path.cwd()
     detected = detect_agent(project_path)
-    profile = AGENT_PROFILES.get(detected, AGENT_PROFILES["generic"])
+    profile = AGENT_PROFILES_RESOLVED[detected]
     
     print(f"\n{Colors.BOLD}Agent Detection{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
-    print(f"  {Colors.CYAN}Detected agent:{Colors.RESET}  {profile['name']} ({detected})")
+    print(_RULE)
+    print(f"  {Colors.CYAN}Detected agent:{Colors.RESET}  {profile.name} ({detected})")
     print(f"  {Colors.CYAN}Project path:{Colors.RESET}    {project_path}")
     
     print(f"\n{Colors.BOLD}Installation Paths{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(_RULE)
     
     # Project paths
     print(f"\n  {Colors.CYAN}Project paths (--project):{Colors.RESET}")
-    for proj_path in profile.get("project_paths", []):
+    for proj_path in profile.project_paths:
         full_path = project_path / proj_path
         exists = "✓" if full_path.exists() else " "
         print(f"    {Colors.GREEN if full_path.exists() else Colors.DIM}{exists} {full_path}{Colors.RESET}")
     
     # Personal/global path
-    personal = profile.get("personal_path", SKILLS_INSTALLED)
+    personal = profile.personal_path
     exists = "✓" if personal.exists() else " "
     print(f"\n  {Colors.CYAN}Personal path (--global):{Colors.RESET}")
     print(f"    {Colors.GREEN if personal.exists() else Colors.DIM}{exists} {personal}{Colors.RESET}")
     
     # Instructions file
-    if profile.get("instructions_file"):
-        inst_file = project_path / profile["instructions_file"]
+    if profile.instructions_file:
+        inst_file = project_path / profile.instructions_file
         exists = "✓" if inst_file.exists() else " "
         print(f"\n  {Colors.CYAN}Instructions file:{Colors.RESET}")
         print(f"    {Colors.GREEN if inst_file.exists() else Colors.DIM}{exists} {inst_file}{Colors.RESET}")
     
     # Show all agents
     print(f"\n{Colors.BOLD}All Supported Agents{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
-    for agent_id, agent_profile in AGENT_PROFILES.items():
+    print(_RULE)
+    for agent_id, agent_profile in AGENT_PROFILES_RESOLVED.items():
         if agent_id == "generic":
             continue
         marker = "→ " if agent_id == detected else "  "
-        print(f"  {marker}{Colors.BOLD}{agent_profile['name']}{Colors.RESET} ({agent_id})")
-        print(f"      Project: {agent_profile['project_paths'][0]}")
-        print(f"      Personal: {agent_profile['personal_path']}")
+        print(f"  {marker}{Colors.BOLD}{agent_profile.name}{Colors.RESET} ({agent_id})")
+        print(f"      Project: {agent_profile.project_paths[0]}")
+        print(f"      Personal: {agent_profile.personal_path}")
     
     print()
     return 0
@@ -1224,6 +1747,7 @@ def cmd_detect(args):
 # GitHub API helpers for publishing
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def get_github_token() -> Optional[str]:
     """Get GitHub token from environment or config."""
     # Check environment variables (common CI/CD and local dev patterns)
@@ -1240,51 +1764,234 @@ def get_github_token() -> Optional[str]:
     
     # Check gh CLI config (macOS/Linux)
     gh_config = Path.home() / ".config" / "gh" / "hosts.yml"
-    if gh_config.exists():
-        try:
-            import yaml
-            hosts = yaml.safe_load(gh_config.read_text())
-            if hosts and "github.com" in hosts:
-                return hosts["github.com"].get("oauth_token")
-        except Exception:
-            pass
+    try:
+        return _read_gh_hosts_token(gh_config.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _read_gh_hosts_token(text: str, host: str = "github.com") -> Optional[str]:
+    """
+    Extract <host>.oauth_token from a gh CLI hosts.yml.
     
+    The file is a flat two-level mapping, so a line scan avoids importing
+    PyYAML on every CLI invocation. Returns None for anything unexpected.
+    """
+    in_host = False
+    child_indent = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0:
+            in_host = stripped.rstrip(":").strip("'\"") == host and stripped.endswith(":")
+            child_indent = None
+            continue
+        if not in_host:
+            continue
+        if child_indent is None:
+            child_indent = indent
+        if indent != child_indent:
+            continue  # nested mapping, e.g. users:
+        key, sep, value = stripped.partition(":")
+        if sep and key.strip() == "oauth_token":
+            value = value.split(" #", 1)[0].strip().strip("'\"")
+            return value or None
     return None
 
 
 def github_api_request(endpoint: str, method: str = "GET", data: dict = None, token: str = None) -> dict:
     """Make a GitHub API request."""
     url = f"https://api.github.com{endpoint}"
+    headers = _github_headers(token)
+    
+    body = None
+    if data:
+        body = _json_dumps_compact(data)
+        headers["Content-Type"] = "application/json"
+    
+    # Revalidate GETs against the on-disk copy; a 304 carries no body and
+    # does not count against the API rate limit
+    cache_path = _github_cache_path(endpoint, token) if method == "GET" else None
+    cached = _read_github_cache(cache_path) if cache_path else None
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+    
+    status, resp_headers, resp_body = _github_api_send(url, method, body, headers)
+    wait = _rate_limit_wait(status, resp_headers)
+    if wait is not None:
+        if wait > RATE_LIMIT_MAX_WAIT:
+            raise RuntimeError(
+                f"GitHub API rate limit exceeded; resets in {int(wait) // 60 + 1} min"
+            )
+        time.sleep(wait)
+        status, resp_headers, resp_body = _github_api_send(url, method, body, headers)
+    
+    if status == 304 and cached:
+        return cached["body"]
+    if status >= 400:
+        raise _github_api_error(status, resp_body, f"HTTP {status}")
+    
+    result = _json_loads(resp_body)
+    etag = resp_headers.get("ETag") if cache_path and resp_headers else None
+    if etag:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(_json_dumps_bytes({"etag": etag, "body": result}))
+    return result
+
+
+def github_api_head(endpoint: str, token: str = None) -> Tuple[int, Any]:
+    """Make a GitHub API HEAD request; returns (status, headers) with no body to fetch or parse."""
+    status, headers, _ = _github_api_send(
+        f"https://api.github.com{endpoint}", "HEAD", None, _github_headers(token)
+    )
+    return status, headers
+
+
+def _github_headers(token: Optional[str]) -> Dict[str, str]:
+    """Request headers shared by all GitHub API calls."""
     headers = {
         "Accept": "application/vnd.github.v3+json",
         "User-Agent": f"skills-cli/{__version__}",
     }
     if token:
         headers["Authorization"] = f"token {token}"
-    
-    body = None
-    if data:
-        body = json.dumps(data).encode("utf-8")
-        headers["Content-Type"] = "application/json"
-    
-    req = Request(url, data=body, headers=headers, method=method)
-    
-    try:
-        with urlopen(req, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as e:
-        error_body = e.read().decode("utf-8")
+    return headers
+
+
+# Retry transient gateway errors; urllib3 only retries idempotent methods,
+# so POSTs (repo, release, issue creation) are never sent twice
+_GITHUB_RETRY = urllib3.Retry(
+    total=3, backoff_factor=0.5,
+    status_forcelist=[502, 503, 504], raise_on_status=False,
+) if _HAS_URLLIB3 else None
+
+# Rate limit reported by the last GitHub API response: {"remaining": int, "reset": epoch}
+_RATE_STATE: Dict[str, int] = {}
+
+# Longest we will sleep for a rate limit reset before giving up (seconds)
+RATE_LIMIT_MAX_WAIT = 60
+
+
+def _github_api_send(url: str, method: str, body: Optional[bytes], headers: Dict[str, str]) -> Tuple[int, Any, bytes]:
+    """Send one GitHub API request and return (status, headers, body)."""
+    if _HAS_URLLIB3:
         try:
-            error_data = json.loads(error_body)
-            message = error_data.get("message", str(e))
-        except json.JSONDecodeError:
-            message = error_body or str(e)
-        raise RuntimeError(f"GitHub API error ({e.code}): {message}")
+            response = _get_http_pool().request(
+                method, url, body=body, headers=headers, timeout=30, retries=_GITHUB_RETRY,
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise RuntimeError(f"Network error: {e}")
+        result = response.status, response.headers, response.data
+    else:
+        from urllib.request import urlopen, Request
+        from urllib.error import HTTPError
+        
+        req = Request(url, data=body, headers=headers, method=method)
+        try:
+            with urlopen(req, timeout=30) as response:
+                result = response.status, response.headers, response.read()
+        except HTTPError as e:
+            result = e.code, e.headers, e.read()
+    
+    _record_rate_limit(result[1])
+    return result
+
+
+def _record_rate_limit(headers) -> None:
+    """Remember the X-RateLimit-* values from a GitHub API response."""
+    if not headers:
+        return
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and remaining.isdigit():
+        _RATE_STATE["remaining"] = int(remaining)
+    if reset is not None and reset.isdigit():
+        _RATE_STATE["reset"] = int(reset)
+
+
+def _rate_limit_wait(status: int, headers) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response, or None if not rate-limited."""
+    if status not in (403, 429) or not headers:
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = headers.get("X-RateLimit-Reset", "")
+        if reset.isdigit():
+            return max(0.0, int(reset) - time.time()) + 1
+    return None
+
+
+def _github_cache_path(endpoint: str, token: Optional[str]) -> Path:
+    """Cache file for a GitHub API GET; keyed per token so users never share entries."""
+    key = hashlib.blake2b(f"{token or ''}\n{endpoint}".encode(), digest_size=16).hexdigest()
+    return SKILLS_CACHE / "github" / f"{key}.json"
 
 
+def _read_github_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a cached {etag, body} GitHub response, or None if missing/unreadable."""
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if isinstance(cached, dict) and cached.get("etag") and "body" in cached:
+        return cached
+    return None
+
+
+def _github_api_error(code: int, error_body: bytes, fallback: str) -> RuntimeError:
+    """Build the RuntimeError raised for a failed GitHub API call."""
+    error_text = error_body.decode("utf-8", errors="replace")
+    try:
+        message = _json_loads(error_body).get("message", fallback)
+    except (ValueError, AttributeError):
+        message = error_text or fallback
+    return RuntimeError(f"GitHub API error ({code}): {message}")
+
+
+# Remaining API calls required before cmd_publish starts creating anything
+PUBLISH_MIN_API_CALLS = 10
+
+
+# /user fields kept in the config's github_user_cache (everything whoami shows)
+_CACHED_USER_FIELDS = ("login", "name", "email", "html_url")
+
+
+@lru_cache(maxsize=1)
 def get_github_user(token: str) -> dict:
-    """Get authenticated GitHub user info."""
-    return github_api_request("/user", token=token)
+    """
+    Get authenticated GitHub user info.
+    
+    The answer is cached in config.json under a hash of the token for
+    GITHUB_USER_CACHE_TTL; a revoked token still fails on the next real
+    API call.
+    """
+    token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    config = load_config()
+    entry = config.get("github_user_cache", {}).get(token_hash)
+    if entry and time.time() - entry.get("cached_at", 0) < GITHUB_USER_CACHE_TTL:
+        return entry["user"]
+    
+    payload = github_api_request("/user", token=token)
+    # Same shape on a miss as on a cache hit
+    user = {field: payload.get(field) for field in _CACHED_USER_FIELDS}
+    config["github_user_cache"] = {
+        token_hash: {"user": user, "cached_at": time.time()}
+    }
+    save_config(config)
+    return user
+
+
+# skill.json fields that must be present and non-empty before publishing
+_REQUIRED_FIELDS = ("name", "version", "description")
+
+# Publishable skill names: lowercase alphanumerics and hyphens, no leading/trailing hyphen
+_SKILL_NAME_RE = re.compile(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$")
+# Publishable versions: strict MAJOR.MINOR.PATCH with optional -prerelease
+_PUBLISH_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+(-[\w.]+)?$")
 
 
 def validate_skill_for_publish(skill_dir: Path) -> Tuple[dict, List[str]]:
@@ -1295,46 +2002,77 @@ def validate_skill_for_publish(skill_dir: Path) -> Tuple[dict, List[str]]:
     errors = []
     manifest = {}
     
-    # Check skill.json exists
+    # Check skill.json exists (one open instead of stat + open)
     manifest_path = skill_dir / "skill.json"
-    if not manifest_path.exists():
+    try:
+        manifest_bytes = manifest_path.read_bytes()
+    except FileNotFoundError:
         errors.append("skill.json not found. Run 'skills init' first.")
         return manifest, errors
     
     try:
-        manifest = json.loads(manifest_path.read_text())
-    except json.JSONDecodeError as e:
+        manifest = _json_loads(manifest_bytes)
+    except ValueError as e:
         errors.append(f"Invalid skill.json: {e}")
         return manifest, errors
     
     # Required fields
-    required_fields = ["name", "version", "description"]
-    for field in required_fields:
-        if not manifest.get(field):
-            errors.append(f"Missing required field in skill.json: {field}")
+    errors.extend(
+        f"Missing required field in skill.json: {field}"
+        for field in _REQUIRED_FIELDS
+        if not manifest.get(field)
+    )
     
     # Validate name format (lowercase, alphanumeric, hyphens)
     name = manifest.get("name", "")
-    if name and not re.match(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$", name):
+    if name and not _SKILL_NAME_RE.match(name):
         errors.append(f"Invalid skill name '{name}'. Use lowercase letters, numbers, and hyphens only.")
     
     # Validate version (semver-like)
     version = manifest.get("version", "")
-    if version and not re.match(r"^\d+\.\d+\.\d+(-[\w.]+)?$", version):
+    if version and not _PUBLISH_VERSION_RE.match(version):
         errors.append(f"Invalid version '{version}'. Use semver format (e.g., 1.0.0)")
     
     # Check SKILL.md exists
     skill_md_path = skill_dir / "SKILL.md"
-    if not skill_md_path.exists():
+    try:
+        content = skill_md_path.read_text(encoding="utf-8", errors="replace")
+    except FileNotFoundError:
         errors.append("SKILL.md not found. Create a SKILL.md with your skill instructions.")
     else:
-        content = skill_md_path.read_text()
         if len(content.strip()) < 50:
             errors.append("SKILL.md is too short. Add meaningful instructions.")
     
     return manifest, errors
 
 
+def _fetch_catalog_for_duplicate_check(args) -> Dict[str, Any]:
+    """
+    Catalog for name-duplicate checks: any cached copy will do, since the
+    directory review catches anything published since. Without one, the
+    small skill-names export is used; --deep-check downloads a fresh catalog.
+    """
+    if getattr(args, "deep_check", False):
+        return fetch_catalog(force_refresh=True)
+    
+    config = load_config()
+    if config["registry"] != CATALOG_URL or get_cache_path(config["registry"]).exists():
+        return fetch_catalog(allow_stale=True)
+    
+    # No catalog on disk: the names-only export (tens of KB, vs MBs for the
+    # catalog) has the same {"skills": [{id, name}]} shape the check reads
+    names_path = get_cache_path(SKILL_NAMES_URL)
+    try:
+        if names_path.exists() and time.time() - names_path.stat().st_mtime < config["cache_ttl"]:
+            return _json_loads(names_path.read_bytes())
+        content = fetch_url_bytes(SKILL_NAMES_URL)
+        names = _json_loads(content)
+        names_path.write_bytes(content)
+        return names
+    except Exception:
+        return fetch_catalog()
+
+
 def cmd_validate(args):
     """Validate a skill for publishing."""
     from cli.validate import validate_skill_directory, format_validation_result
@@ -1342,7 +2080,7 @@ def cmd_validate(args):
     skill_dir = Path(args.path or ".").resolve()
     
     print(f"\n{Colors.BOLD}Validating Skill{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(_RULE)
     print(f"  Directory: {skill_dir}")
     
     # Optionally fetch catalog for duplicate checking
@@ -1350,7 +2088,7 @@ def cmd_validate(args):
     if not args.skip_catalog:
         try:
             print_info("Fetching catalog for duplicate check...")
-            catalog = fetch_catalog()
+            catalog = _fetch_catalog_for_duplicate_check(args)
         except Exception:
             print_warning("Could not fetch catalog, skipping duplicate check")
     
@@ -1360,6 +2098,26 @@ def cmd_validate(args):
     return 0 if result.is_valid else 1
 
 
+def _in_background(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run fn(*args) on a worker thread and return its Future."""
+    from concurrent.futures import ThreadPoolExecutor
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(fn, *args)
+    executor.shutdown(wait=False)
+    return future
+
+
+def _publish_repo_exists(user_future: Any, repo_name: str, token: str) -> bool:
+    """Whether the authenticated user already has repo_name on GitHub."""
+    username = user_future.result()["login"]
+    status, _ = github_api_head(f"/repos/{username}/{repo_name}", token=token)
+    if status == 404:
+        return False
+    if status >= 400:
+        raise RuntimeError(f"GitHub API error ({status}): could not check repository {repo_name}")
+    return True
+
+
 def cmd_publish(args):
     """Publish a skill to the registry via PR-based submission."""
     from cli.validate import validate_skill_directory, format_validation_result
@@ -1367,7 +2125,12 @@ def cmd_publish(args):
     skill_dir = Path(args.path or ".").resolve()
     
     print(f"\n{Colors.BOLD}Publishing Skill{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(_RULE)
+    
+    # Look up the GitHub user in the background while the catalog is
+    # fetched and the skill validated; the two requests are independent
+    token = get_github_token()
+    user_future = _in_background(get_github_user, token) if token else None
     
     # Step 1: Comprehensive validation
     print_info("Running validation checks...")
@@ -1375,7 +2138,7 @@ def cmd_publish(args):
     # Fetch catalog for duplicate checking
     catalog = None
     try:
-        catalog = fetch_catalog()
+        catalog = _fetch_catalog_for_duplicate_check(args)
     except Exception as e:
         print_warning(f"Could not fetch catalog: {e}")
     
@@ -1386,6 +2149,15 @@ def cmd_publish(args):
         print(format_validation_result(validation, verbose=True))
         return 1
     
+    # Load manifest
+    manifest = _json_loads((skill_dir / "skill.json").read_bytes())
+    skill_name = manifest["name"]
+    skill_version = manifest["version"]
+    repo_name = f"skill-{skill_name}"
+    
+    # Check for the target repo while the user reads any warnings below
+    repo_future = _in_background(_publish_repo_exists, user_future, repo_name, token) if token else None
+    
     if validation.warnings:
         print_warning(f"{len(validation.warnings)} warning(s):")
         for warn in validation.warnings:
@@ -1397,15 +2169,9 @@ def cmd_publish(args):
                 print_info("Aborted. Fix warnings and try again.")
                 return 0
     
-    # Load manifest
-    manifest = json.loads((skill_dir / "skill.json").read_text())
-    skill_name = manifest["name"]
-    skill_version = manifest["version"]
-    
     print_success(f"Valid skill: {skill_name}@{skill_version}")
     
     # Step 2: GitHub authentication
-    token = get_github_token()
     if not token:
         print_error("GitHub authentication required")
         print()
@@ -1413,7 +2179,7 @@ def cmd_publish(args):
         return 1
     
     try:
-        user = get_github_user(token)
+        user = user_future.result()
         username = user["login"]
         print_success(f"Authenticated as: {username}")
     except Exception as e:
@@ -1422,7 +2188,6 @@ def cmd_publish(args):
     
     # Skill ID = github-username/skill-name (unique by GitHub identity)
     skill_id = f"{username}/{skill_name}"
-    repo_name = f"skill-{skill_name}"
     
     print_info(f"Skill ID: {Colors.BOLD}{skill_id}{Colors.RESET}")
     
@@ -1437,21 +2202,21 @@ def cmd_publish(args):
             print(f"  4. Submit PR/issue to dmgrok/agent_skills_directory")
         return 0
     
+    # The /user response already reported the remaining quota; stop before
+    # a half-finished publish (repo created, no release) if it is nearly spent
+    remaining = _RATE_STATE.get("remaining")
+    if remaining is not None and remaining < PUBLISH_MIN_API_CALLS:
+        reset_at = datetime.fromtimestamp(_RATE_STATE.get("reset", time.time()))
+        print_error(f"GitHub API rate limit nearly exhausted ({remaining} calls left)")
+        print_info(f"  Try again after {reset_at:%H:%M}")
+        return 1
+    
     # Step 3: Ensure repository exists
     repo_url = f"https://github.com/{username}/{repo_name}"
-    repo_exists = False
-    
-    try:
-        github_api_request(f"/repos/{username}/{repo_name}", token=token)
-        repo_exists = True
+    repo_exists = repo_future.result()
+    if repo_exists:
         print_info(f"Repository: {repo_url}")
-    except RuntimeError as e:
-        if "404" in str(e):
-            repo_exists = False
-        else:
-            raise
-    
-    if not repo_exists:
+    else:
         if not args.yes:
             response = input(f"\nCreate repository '{repo_name}'? [Y/n] ")
             if response.lower() == "n":
@@ -1489,24 +2254,32 @@ def cmd_publish(args):
     return 0
 
 
+# PROVIDERS entry for scripts/aggregate.py, pasted into submission issues
+_PROVIDER_ENTRY_TEMPLATE = '''    "{username}": {{
+        "name": "{username}",
+        "repo": "https://github.com/{username}/{repo_name}",
+        "api_tree_url": "https://api.github.com/repos/{username}/{repo_name}/git/trees/main?recursive=1",
+        "raw_base": "https://raw.githubusercontent.com/{username}/{repo_name}/main",
+        "skills_path_prefix": "",  # Root-level SKILL.md
+    }},'''
+
+
 def cmd_submit_to_directory(token: str, username: str, skill_name: str, repo_name: str, manifest: dict) -> int:
     """Submit skill to the official directory via issue/PR."""
     
     print()
     print(f"{Colors.BOLD}Submitting to Official Directory{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(_RULE)
     
     DIRECTORY_REPO = "dmgrok/agent_skills_directory"
     skill_id = f"{username}/{skill_name}"
     
     # Generate provider entry for aggregate.py
-    provider_entry = f'''    "{username}": {{
-        "name": "{username}",
-        "repo": "https://github.com/{username}/{repo_name}",
-        "api_tree_url": "https://api.github.com/repos/{username}/{repo_name}/git/trees/main?recursive=1",
-        "raw_base": "https://raw.githubusercontent.com/{username}/{repo_name}/main",
-        "skills_path_prefix": "",  # Root-level SKILL.md
-    }},'''
+    provider_entry = _PROVIDER_ENTRY_TEMPLATE.format(username=username, repo_name=repo_name)
+    
+    # keywords/capabilities may be missing or null in skill.json
+    keywords = ', '.join(manifest.get('keywords') or []) or 'None specified'
+    capabilities = ', '.join(manifest.get('capabilities') or []) or 'None specified'
     
     # Create submission issue with all details for review
     pr_title = f"[Skill Submission] {skill_id}"
@@ -1538,10 +2311,10 @@ To add this skill, merge this entry into `PROVIDERS` in `scripts/aggregate.py`:
 ```
 
 ### Keywords
-`{', '.join(manifest.get('keywords', [])) or 'None specified'}`
+`{keywords}`
 
 ### Capabilities
-`{', '.join(manifest.get('capabilities', [])) or 'None specified'}`
+`{capabilities}`
 
 ---
 *Submitted via `skills publish --submit` • [View CLI docs](https://dmgrok.github.io/agent_skills_directory/)*
@@ -1561,17 +2334,6 @@ To add this skill, merge this entry into `PROVIDERS` in `scripts/aggregate.py`:
             token=token
         )
         
-        print_success("Submission created!")
-        print()
-        print(f"  {Colors.BLUE}{issue_data['html_url']}{Colors.RESET}")
-        print()
-        print("  What happens next:")
-        print("  1. Automated checks run on your submission")
-        print("  2. Maintainers review the skill")
-        print("  3. If approved, your skill appears in the next catalog update")
-        print()
-        print(f"  Track progress: {Colors.BLUE}{issue_data['html_url']}{Colors.RESET}")
-        
     except Exception as e:
         print_warning(f"Could not create issue automatically: {e}")
         print()
@@ -1581,11 +2343,29 @@ To add this skill, merge this entry into `PROVIDERS` in `scripts/aggregate.py`:
         print(f"  3. Include your repository URL and skill.json details")
         return 1
     
-    return 0
+    issue_url = f"{Colors.BLUE}{issue_data['html_url']}{Colors.RESET}"
+    print_success("Submission created!")
+    print()
+    print(f"  {issue_url}")
+    print()
+    print("  What happens next:")
+    print("  1. Automated checks run on your submission")
+    print("  2. Maintainers review the skill")
+    print("  3. If approved, your skill appears in the next catalog update")
+    print()
+    print(f"  Track progress: {issue_url}")
     
     return 0
 
 
+def _find_release(username: str, repo_name: str, tag_name: str, token: str) -> Optional[dict]:
+    """Return the GitHub release for tag_name, or None if there is none (or it can't be checked)."""
+    try:
+        return github_api_request(f"/repos/{username}/{repo_name}/releases/tags/{tag_name}", token=token)
+    except Exception:
+        return None
+
+
 def cmd_publish_auto(skill_dir: Path, manifest: dict, token: str, username: str, repo_name: str) -> int:
     """Automated publishing: push files and create release."""
     import subprocess
@@ -1594,24 +2374,23 @@ def cmd_publish_auto(skill_dir: Path, manifest: dict, token: str, username: str,
     
     print()
     print(f"{Colors.BOLD}Auto-publishing...{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(_RULE)
     
-    # Check if git is available
+    # Initialize git if needed; the first git call also tells us whether
+    # git is installed, so no separate `git --version` probe is spawned
+    remote_url = f"https://github.com/{username}/{repo_name}.git"
     try:
-        subprocess.run(["git", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        git_dir = skill_dir / ".git"
+        if not git_dir.exists():
+            print_info("Initializing git repository...")
+            subprocess.run(["git", "init"], cwd=skill_dir, capture_output=True, check=True)
+        
+        result = subprocess.run(["git", "remote", "get-url", "origin"], cwd=skill_dir, capture_output=True)
+    except FileNotFoundError:
         print_error("Git is required for auto-publishing. Install git first.")
         return 1
     
-    # Initialize git if needed
-    git_dir = skill_dir / ".git"
-    if not git_dir.exists():
-        print_info("Initializing git repository...")
-        subprocess.run(["git", "init"], cwd=skill_dir, capture_output=True, check=True)
-    
     # Set remote
-    remote_url = f"https://github.com/{username}/{repo_name}.git"
-    result = subprocess.run(["git", "remote", "get-url", "origin"], cwd=skill_dir, capture_output=True)
     if result.returncode != 0:
         print_info(f"Adding remote origin: {remote_url}")
         subprocess.run(["git", "remote", "add", "origin", remote_url], cwd=skill_dir, capture_output=True)
@@ -1623,14 +2402,13 @@ def cmd_publish_auto(skill_dir: Path, manifest: dict, token: str, username: str,
     
     # Stage files
     print_info("Staging files...")
-    files_to_add = ["skill.json", "SKILL.md"]
-    for f in ["scripts", "assets", "references", "README.md", "LICENSE"]:
-        if (skill_dir / f).exists():
-            files_to_add.append(f)
-    
-    for f in files_to_add:
-        if (skill_dir / f).exists():
-            subprocess.run(["git", "add", f], cwd=skill_dir, capture_output=True)
+    present = _dir_entries(skill_dir)  # one directory read instead of a stat per name
+    files_to_add = [
+        f for f in ("skill.json", "SKILL.md", "scripts", "assets", "references", "README.md", "LICENSE")
+        if f in present
+    ]
+    if files_to_add:
+        subprocess.run(["git", "add", "--"] + files_to_add, cwd=skill_dir, capture_output=True)
     
     # Check if there are changes to commit
     result = subprocess.run(["git", "status", "--porcelain"], cwd=skill_dir, capture_output=True)
@@ -1648,44 +2426,51 @@ def cmd_publish_auto(skill_dir: Path, manifest: dict, token: str, username: str,
     print_info("Pushing to GitHub...")
     # Configure git to use token for auth
     auth_remote = f"https://{token}@github.com/{username}/{repo_name}.git"
-    result = subprocess.run(
-        ["git", "push", auth_remote, "HEAD:main", "--force-with-lease"],
+    
+    # Plain push: if main on GitHub has commits we don't, it is rejected
+    # as non-fast-forward instead of overwriting them
+    push = subprocess.Popen(
+        ["git", "push", auth_remote, "HEAD:main"],
         cwd=skill_dir,
-        capture_output=True
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
     )
-    if result.returncode != 0:
-        # Try without force
-        result = subprocess.run(
-            ["git", "push", auth_remote, "HEAD:main"],
-            cwd=skill_dir,
-            capture_output=True
-        )
-        if result.returncode != 0:
-            print_error(f"Push failed: {result.stderr.decode()}")
-            return 1
+    
+    # The release must tag the pushed commit, so it is created after the
+    # push; checking whether it already exists does not depend on the push
+    tag_name = f"v{skill_version}"
+    existing_release = _find_release(username, repo_name, tag_name, token)
+    
+    _, push_stderr = push.communicate()
+    if push.returncode != 0:
+        print_error(f"Push failed: {push_stderr.decode()}")
+        return 1
     print_success("Pushed to GitHub")
     
     # Create release via API
-    print_info(f"Creating release v{skill_version}...")
-    try:
-        release_data = github_api_request(
-            f"/repos/{username}/{repo_name}/releases",
-            method="POST",
-            data={
-                "tag_name": f"v{skill_version}",
-                "name": f"v{skill_version}",
-                "body": f"Release of {manifest['name']} v{skill_version}\n\n{manifest.get('description', '')}",
-                "draft": False,
-                "prerelease": False,
-            },
-            token=token
-        )
-        print_success(f"Created release: {release_data['html_url']}")
-    except RuntimeError as e:
-        if "already_exists" in str(e):
-            print_warning(f"Release v{skill_version} already exists")
-        else:
-            print_error(f"Failed to create release: {e}")
+    if existing_release:
+        print_warning(f"Release {tag_name} already exists")
+    else:
+        print_info(f"Creating release {tag_name}...")
+        try:
+            release_data = github_api_request(
+                f"/repos/{username}/{repo_name}/releases",
+                method="POST",
+                data={
+                    "tag_name": tag_name,
+                    "name": tag_name,
+                    "body": f"Release of {manifest['name']} v{skill_version}\n\n{manifest.get('description', '')}",
+                    "draft": False,
+                    "prerelease": False,
+                },
+                token=token
+            )
+            print_success(f"Created release: {release_data['html_url']}")
+        except RuntimeError as e:
+            if "already_exists" in str(e):
+                print_warning(f"Release {tag_name} already exists")
+            else:
+                print_error(f"Failed to create release: {e}")
     
     # Final summary
     print()
@@ -1703,7 +2488,7 @@ def cmd_publish_auto(skill_dir: Path, manifest: dict, token: str, username: str,
 def cmd_login(args):
     """Authenticate with GitHub."""
     print(f"\n{Colors.BOLD}GitHub Authentication{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(_RULE)
     
     # Check existing auth
     existing_token = get_github_token()
@@ -1740,6 +2525,7 @@ def cmd_login(args):
     config["github_token"] = token
     config["github_user"] = username
     save_config(config)
+    get_github_token.cache_clear()
     
     print_success(f"Authenticated as: {username}")
     print_info("Token saved to ~/.skills/config.json")
@@ -1777,21 +2563,43 @@ def cmd_whoami(args):
 
 STATS_FILE = SKILLS_HOME / "stats.json"
 
+# Stats are read once per process and written back once, at exit
+_stats_cache: Optional[Dict[str, Any]] = None
+_stats_dirty = False
+
 
 def load_stats() -> Dict[str, Any]:
-    """Load local analytics stats."""
-    if STATS_FILE.exists():
-        try:
-            return json.loads(STATS_FILE.read_text())
-        except json.JSONDecodeError:
-            pass
-    return {"installs": {}, "searches": {}, "total_installs": 0}
+    """Load local analytics stats (cached for the rest of the process)."""
+    global _stats_cache
+    if _stats_cache is None:
+        _stats_cache = {"installs": {}, "searches": {}, "total_installs": 0}
+        if STATS_FILE.exists():
+            try:
+                _stats_cache = _json_loads(STATS_FILE.read_bytes())
+            except json.JSONDecodeError:
+                pass
+    return _stats_cache
 
 
 def save_stats(stats: Dict[str, Any]):
-    """Save local analytics stats."""
-    ensure_dirs()
-    STATS_FILE.write_text(json.dumps(stats, indent=2))
+    """Save local analytics stats; the file is written once when the process exits."""
+    global _stats_cache, _stats_dirty
+    _stats_cache = stats
+    _stats_dirty = True
+
+
+@atexit.register
+def _flush_stats():
+    """Write pending stats with write-then-rename so readers never see a partial file."""
+    global _stats_dirty
+    if not _stats_dirty:
+        return
+    _stats_dirty = False
+    try:
+        ensure_dirs()
+        _atomic_write_bytes(STATS_FILE, _json_dumps_compact(_stats_cache))
+    except OSError:
+        pass  # Analytics must never fail the command that triggered them
 
 
 def track_install(skill_id: str):
@@ -1823,56 +2631,67 @@ def track_search(query: str):
     save_stats(stats)
 
 
+# Category bars in `skills stats`, prebuilt for every width up to the cap
+_STATS_BAR_WIDTH = 30
+_STATS_BARS = tuple("█" * n for n in range(_STATS_BAR_WIDTH + 1))
+
+
 def cmd_stats(args):
     """Show analytics and statistics."""
-    print(f"\n{Colors.BOLD}Skills Statistics{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 50}{Colors.RESET}")
+    lines = [f"\n{Colors.BOLD}Skills Statistics{Colors.RESET}", f"{Colors.DIM}{'─' * 50}{Colors.RESET}"]
     
     # Local stats
     stats = load_stats()
     installed = get_installed_skills()
     
-    print(f"\n{Colors.CYAN}Local Statistics:{Colors.RESET}")
-    print(f"  Installed skills:    {len(installed)}")
-    print(f"  Total installs:      {stats.get('total_installs', 0)}")
-    print(f"  Unique searches:     {len(stats.get('searches', {}))}")
+    lines.append(f"\n{Colors.CYAN}Local Statistics:{Colors.RESET}")
+    lines.append(f"  Installed skills:    {len(installed)}")
+    lines.append(f"  Total installs:      {stats.get('total_installs', 0)}")
+    lines.append(f"  Unique searches:     {len(stats.get('searches', {}))}")
     
     # Most installed locally
     if stats.get("installs"):
-        print(f"\n{Colors.CYAN}Most Installed (local):{Colors.RESET}")
+        lines.append(f"\n{Colors.CYAN}Most Installed (local):{Colors.RESET}")
         sorted_installs = sorted(
             stats["installs"].items(),
             key=lambda x: x[1]["count"],
             reverse=True
         )[:5]
         for skill_id, data in sorted_installs:
-            print(f"  {skill_id}: {data['count']} install(s)")
+            lines.append(f"  {skill_id}: {data['count']} install(s)")
+    
+    # Local section goes out before fetch_catalog() may print its own progress
+    sys.stdout.write("\n".join(lines) + "\n")
+    lines = []
     
     # Catalog stats
     try:
         catalog = fetch_catalog()
         
-        print(f"\n{Colors.CYAN}Catalog Statistics:{Colors.RESET}")
-        print(f"  Total skills:        {len(catalog.get('skills', []))}")
-        print(f"  Providers:           {len(catalog.get('providers', {}))}")
-        print(f"  Catalog version:     {catalog.get('version', 'unknown')}")
+        lines.append(f"\n{Colors.CYAN}Catalog Statistics:{Colors.RESET}")
+        lines.append(f"  Total skills:        {len(catalog.get('skills', []))}")
+        lines.append(f"  Providers:           {len(catalog.get('providers', {}))}")
+        lines.append(f"  Catalog version:     {catalog.get('version', 'unknown')}")
         
-        # Category breakdown
+        # Category and provider counts in a single pass over the skills
         categories = {}
+        provider_counts = {}
         for skill in catalog.get("skills", []):
             cat = skill.get("category", "other")
             categories[cat] = categories.get(cat, 0) + 1
+            provider = skill.get("provider")
+            provider_counts[provider] = provider_counts.get(provider, 0) + 1
         
         if categories:
-            print(f"\n{Colors.CYAN}Skills by Category:{Colors.RESET}")
+            lines.append(f"\n{Colors.CYAN}Skills by Category:{Colors.RESET}")
             for cat, count in sorted(categories.items(), key=lambda x: -x[1]):
-                bar = "█" * min(count, 30)
-                print(f"  {cat:15} {count:3} {Colors.GREEN}{bar}{Colors.RESET}")
+                bar = _STATS_BARS[min(count, _STATS_BAR_WIDTH)]
+                lines.append(f"  {cat:15} {count:3} {Colors.GREEN}{bar}{Colors.RESET}")
         
         # Provider stats with GitHub stars
         providers = catalog.get("providers", {})
         if providers and args.detailed:
-            print(f"\n{Colors.CYAN}Top Providers by Stars:{Colors.RESET}")
+            lines.append(f"\n{Colors.CYAN}Top Providers by Stars:{Colors.RESET}")
             sorted_providers = sorted(
                 providers.items(),
                 key=lambda x: x[1].get("stars") or 0,
@@ -1880,11 +2699,11 @@ def cmd_stats(args):
             )[:10]
             for provider_id, info in sorted_providers:
                 stars = info.get("stars") or 0
-                skill_count = sum(1 for s in catalog.get("skills", []) if s.get("provider") == provider_id)
-                print(f"  {provider_id:25} ⭐ {stars:,}  ({skill_count} skills)")
+                skill_count = provider_counts.get(provider_id, 0)
+                lines.append(f"  {provider_id:25} ⭐ {stars:,}  ({skill_count} skills)")
         
     except Exception as e:
-        print_warning(f"Could not fetch catalog stats: {e}")
+        lines.append(f"{_WARNING_PREFIX} Could not fetch catalog stats: {e}")
     
     # Recent activity
     if stats.get("installs"):
@@ -1895,15 +2714,57 @@ def cmd_stats(args):
         )[:5]
         
         if recent:
-            print(f"\n{Colors.CYAN}Recent Installs:{Colors.RESET}")
+            lines.append(f"\n{Colors.CYAN}Recent Installs:{Colors.RESET}")
             for skill_id, data in recent:
                 last = data["last"][:10] if data.get("last") else "unknown"
-                print(f"  {skill_id} ({last})")
+                lines.append(f"  {skill_id} ({last})")
     
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
+# Project scan lookups, by file suffix and by exact file name (case-sensitive)
+_LANGUAGE_SUFFIXES = {
+    ".py": "python",
+    ".js": "javascript", ".ts": "javascript", ".jsx": "javascript", ".tsx": "javascript",
+    ".java": "java",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+    ".cpp": "c++", ".hpp": "c++",
+    ".c": "c", ".h": "c",
+}
+_LANGUAGE_FILES = {
+    "requirements.txt": "python", "setup.py": "python", "pyproject.toml": "python", "Pipfile": "python",
+    "package.json": "javascript",
+    "pom.xml": "java", "build.gradle": "java",
+    "go.mod": "go",
+    "Cargo.toml": "rust",
+    "Gemfile": "ruby",
+    "composer.json": "php",
+    "CMakeLists.txt": "c++",
+    "Makefile": "c",
+}
+_FRAMEWORK_FILES = {
+    "package.json": ("react", "vue", "express"),
+    "angular.json": ("angular",),
+    "manage.py": ("django",),
+    "settings.py": ("django",),
+    "app.py": ("flask",),
+    "main.py": ("fastapi",),
+    "next.config.js": ("nextjs",),
+    "next.config.ts": ("nextjs",),
+    "gatsby-config.js": ("gatsby",),
+}
+_PACKAGE_FILES = frozenset({"package.json", "requirements.txt", "Cargo.toml", "go.mod", "pom.xml"})
+_SCAN_SKIP_DIRS = frozenset({
+    ".git", "node_modules", "venv", ".venv", "__pycache__", "dist", "build", ".next", "target", "vendor",
+})
+_SCAN_MAX_DEPTH = 3
+
+
 def analyze_project_structure(project_path: Path) -> Dict[str, Any]:
     """Analyze project structure to understand what technologies and frameworks are used."""
     analysis = {
@@ -1914,78 +2775,99 @@ def analyze_project_structure(project_path: Path) -> Dict[str, Any]:
         "package_files": []
     }
     
-    # Common patterns to identify technologies
-    tech_patterns = {
-        "python": ["*.py", "requirements.txt", "setup.py", "pyproject.toml", "Pipfile"],
-        "javascript": ["*.js", "package.json", "*.ts", "*.jsx", "*.tsx"],
-        "java": ["*.java", "pom.xml", "build.gradle"],
-        "go": ["*.go", "go.mod"],
-        "rust": ["*.rs", "Cargo.toml"],
-        "ruby": ["*.rb", "Gemfile"],
-        "php": ["*.php", "composer.json"],
-        "c++": ["*.cpp", "*.hpp", "CMakeLists.txt"],
-        "c": ["*.c", "*.h", "Makefile"],
-    }
-    
-    framework_patterns = {
-        "react": ["package.json"],
-        "vue": ["package.json"],
-        "angular": ["angular.json"],
-        "django": ["manage.py", "settings.py"],
-        "flask": ["app.py"],
-        "fastapi": ["main.py"],
-        "express": ["package.json"],
-        "nextjs": ["next.config.js", "next.config.ts"],
-        "gatsby": ["gatsby-config.js"],
-    }
+    languages = analysis["languages"]
+    frameworks = analysis["frameworks"]
+    file_types = analysis["file_types"]
     
     try:
-        # Walk project directory (limit depth to avoid very deep recursion)
-        for root, dirs, files in os.walk(project_path):
-            # Skip common ignored directories
-            dirs[:] = [d for d in dirs if d not in {'.git', 'node_modules', 'venv', '.venv', 
-                                                     '__pycache__', 'dist', 'build', '.next', 
-                                                     'target', 'vendor'}]
-            
-            # Check relative depth
-            rel_path = Path(root).relative_to(project_path)
-            if len(rel_path.parts) > 3:
-                continue
-            
-            for file in files:
-                file_path = Path(root) / file
-                suffix = file_path.suffix.lower()
-                
-                # Track file types
-                if suffix:
-                    analysis["file_types"].add(suffix)
-                
-                # Check language patterns
-                for lang, patterns in tech_patterns.items():
-                    for pattern in patterns:
-                        if file_path.match(pattern):
-                            analysis["languages"].add(lang)
-                            if file in ["package.json", "requirements.txt", "Cargo.toml", "go.mod", "pom.xml"]:
-                                analysis["package_files"].append(str(file_path))
-                
-                # Check framework patterns
-                for framework, patterns in framework_patterns.items():
-                    for pattern in patterns:
-                        if file_path.match(pattern):
-                            analysis["frameworks"].add(framework)
+        # Depth-first walk in os.walk order, never descending below _SCAN_MAX_DEPTH
+        stack = [(str(project_path), 0)]
+        while stack:
+            root, depth = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            if (depth < _SCAN_MAX_DEPTH and entry.name not in _SCAN_SKIP_DIRS
+                                    and not entry.is_symlink()):
+                                subdirs.append(entry.path)
+                            continue
+                        
+                        name = entry.name
+                        suffix = os.path.splitext(name)[1]
+                        
+                        # Track file types
+                        if len(suffix) > 1:
+                            file_types.add(suffix.lower())
+                        
+                        # Check language patterns
+                        lang = _LANGUAGE_SUFFIXES.get(suffix)
+                        if lang:
+                            languages.add(lang)
+                        lang = _LANGUAGE_FILES.get(name)
+                        if lang:
+                            languages.add(lang)
+                            if name in _PACKAGE_FILES:
+                                analysis["package_files"].append(os.path.join(root, name))
+                        
+                        # Check framework patterns
+                        frameworks.update(_FRAMEWORK_FILES.get(name, ()))
+            except OSError:
+                continue  # Unreadable directory; os.walk skipped these silently too
+            stack.extend((path, depth + 1) for path in reversed(subdirs))
     
     except Exception as e:
         print_warning(f"Error analyzing project: {e}")
     
     # Convert sets to lists for JSON serialization
-    analysis["languages"] = list(analysis["languages"])
-    analysis["frameworks"] = list(analysis["frameworks"])
+    analysis["languages"] = list(languages)
+    analysis["frameworks"] = list(frameworks)
     analysis["tools"] = list(analysis["tools"])
-    analysis["file_types"] = list(analysis["file_types"])
+    analysis["file_types"] = list(file_types)
     
     return analysis
 
 
+# Bump whenever analyze_project_structure's tables or output shape change
+_PROJECT_CACHE_VERSION = 2
+
+
+def _project_cache_path(project_path: Path) -> Path:
+    """Cache file holding the last analysis of a project directory."""
+    key = hashlib.blake2b(str(project_path.resolve()).encode(), digest_size=16).hexdigest()
+    return SKILLS_CACHE / "projects" / f"{key}.json"
+
+
+def analyze_project_cached(project_path: Path, readme_path: Optional[Path], rescan: bool = False) -> Dict[str, Any]:
+    """analyze_project_structure, reused while the project dir and README mtimes are unchanged."""
+    try:
+        stamp = [
+            _PROJECT_CACHE_VERSION,
+            project_path.stat().st_mtime_ns,
+            readme_path.stat().st_mtime_ns if readme_path else 0,
+        ]
+    except OSError:
+        return analyze_project_structure(project_path)
+    
+    cache_path = _project_cache_path(project_path)
+    if not rescan:
+        try:
+            cached = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cached = None
+        if isinstance(cached, dict) and cached.get("stamp") == stamp:
+            return cached["analysis"]
+    
+    analysis = analyze_project_structure(project_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(_json_dumps_compact({"stamp": stamp, "analysis": analysis}))
+    except OSError:
+        pass  # Caching is best-effort
+    return analysis
+
+
 def find_readme(project_path: Path) -> Optional[Path]:
     """Find README file in project directory."""
     readme_patterns = ["README.md", "README.MD", "readme.md", "README", "README.txt"]
@@ -1998,86 +2880,254 @@ def find_readme(project_path: Path) -> Optional[Path]:
     return None
 
 
-def count_similar_skills(skill: Dict, all_skills: List[Dict]) -> int:
+# Domains matched between README and skill text, in priority order
+_DOMAIN_KEYWORDS = {
+    'api': ('api', 'rest', 'graphql', 'endpoint', 'swagger'),
+    'database': ('database', 'sql', 'postgres', 'mysql', 'mongodb', 'redis'),
+    'testing': ('test', 'testing', 'pytest', 'jest', 'cypress'),
+    'devops': ('docker', 'kubernetes', 'deploy', 'ci/cd', 'github-actions'),
+    'frontend': ('react', 'vue', 'angular', 'frontend', 'ui', 'component'),
+    'backend': ('backend', 'server', 'express', 'fastapi', 'django'),
+    'ml': ('machine-learning', 'ml', 'tensorflow', 'pytorch', 'model'),
+    'docs': ('documentation', 'docs', 'readme', 'markdown'),
+}
+_DOMAIN_NAMES = tuple(_DOMAIN_KEYWORDS)
+
+
+def _domain_bits(text_has: Callable[[str], bool]) -> int:
+    """Bitmask with bit i set when text_has() any keyword of _DOMAIN_NAMES[i]."""
+    bits = 0
+    for i, keywords in enumerate(_DOMAIN_KEYWORDS.values()):
+        if any(text_has(kw) for kw in keywords):
+            bits |= 1 << i
+    return bits
+
+
+# Official providers get a slight boost in recommendations
+_TRUSTED_PROVIDERS = frozenset({
+    'anthropics', 'openai', 'github', 'vercel', 'cloudflare',
+    'stripe', 'supabase', 'huggingface'
+})
+
+# Static score components, indexed by quality tier (<60, 60-79, 80+) or keyed by maintenance_status
+_PREFILTER_QUALITY_BONUS = (0, 2, 5)
+_PREFILTER_MAINT_BONUS = {"active": 3, "maintained": 1}
+_RANKING_QUALITY_BONUS = (0, 5, 10)
+_RANKING_MAINT_BONUS = {"active": 8, "maintained": 4}
+_RANKING_TRUSTED_BONUS = 3
+
+# Separators inside skill names, which are mostly hyphenated slugs
+_NAME_PARTS_RE = re.compile(r'[\s_-]+')
+
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
+class _SkillFeatures:
+    """Lowercased fields, keyword sets and scoring columns of one skill, shared by the suggest scorers."""
+    name: str
+    desc: str
+    tags: Tuple[str, ...]
+    tag_set: FrozenSet[str]
+    category: str
+    name_words: FrozenSet[str]
+    name_parts: FrozenSet[str]
+    desc_keywords: FrozenSet[str]
+    text: str
+    text_keywords: FrozenSet[str]
+    domain_bits: int
+    prefilter_bonus: int
+    ranking_bonus: int
+    ranking_reasons: Tuple[str, ...]
+
+
+def _skill_features(skill: Dict) -> _SkillFeatures:
+    """Tokenize a skill once for prefiltering, ranking and similarity counting."""
+    name = skill["name"].lower()
+    desc = skill.get("description", "").lower()
+    tags = tuple(t.lower() for t in skill.get("tags", []))
+    category = skill.get("category", "").lower()
+    text = f"{name} {desc} {' '.join(tags)} {category}"
+    domain_bits = _domain_bits(lambda kw: kw in name or kw in desc or kw in tags)
+    
+    # Quality, maintenance and provider trust don't depend on the project
+    quality = skill.get("quality_score", 0)
+    tier = 2 if quality >= 80 else 1 if quality >= 60 else 0
+    maint = skill.get("maintenance_status", "")
+    trusted = skill["id"].split('/')[0] in _TRUSTED_PROVIDERS
+    ranking_reasons = (("high quality",) if tier == 2 else ()) + (
+        ("actively maintained",) if maint == "active" else ())
+    
+    return _SkillFeatures(
+        name=name,
+        desc=desc,
+        tags=tags,
+        tag_set=frozenset(tags),
+        category=category,
+        name_words=frozenset(name.split()),
+        name_parts=frozenset(_NAME_PARTS_RE.split(name)),
+        desc_keywords=frozenset(extract_keywords(desc)),
+        text=text,
+        text_keywords=frozenset(extract_keywords(text)),
+        domain_bits=domain_bits,
+        prefilter_bonus=_PREFILTER_QUALITY_BONUS[tier] + _PREFILTER_MAINT_BONUS.get(maint, 0),
+        ranking_bonus=(_RANKING_QUALITY_BONUS[tier] + _RANKING_MAINT_BONUS.get(maint, 0)
+                       + (_RANKING_TRUSTED_BONUS if trusted else 0)),
+        ranking_reasons=ranking_reasons,
+    )
+
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
+class _SuggestIndex:
+    """Features of every catalog skill plus tag and name-word postings.
+    
+    Postings map a token to positions in `skills`, so similar-skill counting
+    only visits skills that share a tag or name word with the query.
+    """
+    skills: List[Dict]
+    features: Dict[int, _SkillFeatures]
+    tag_postings: Dict[str, List[int]]
+    name_postings: Dict[str, List[int]]
+
+
+def _build_suggest_index(catalog: Dict) -> _SuggestIndex:
+    """Tokenize every catalog skill and build the tag/name-word postings."""
+    skills = catalog.get("skills", [])
+    features: Dict[int, _SkillFeatures] = {}
+    tag_postings: Dict[str, List[int]] = {}
+    name_postings: Dict[str, List[int]] = {}
+    for pos, skill in enumerate(skills):
+        f = features[id(skill)] = _skill_features(skill)
+        for tag in f.tag_set:
+            tag_postings.setdefault(tag, []).append(pos)
+        for word in f.name_words:
+            name_postings.setdefault(word, []).append(pos)
+    return _SuggestIndex(skills, features, tag_postings, name_postings)
+
+
+# id(catalog) -> (catalog, _SuggestIndex)
+_suggest_index: Dict[int, Tuple[Dict, _SuggestIndex]] = {}
+
+
+def _features(skill: Dict, index: Optional[_SuggestIndex]) -> _SkillFeatures:
+    """Precomputed features for skill if index has them, else computed now."""
+    features = index.features.get(id(skill)) if index else None
+    return features if features is not None else _skill_features(skill)
+
+
+def _similarity_score(own: _SkillFeatures, other: _SkillFeatures, tag_overlap: int, name_overlap: int) -> int:
+    """Score two skills on category, tag, name and description overlap."""
+    similarity_score = 0
+    
+    # Same category
+    if own.category and own.category == other.category:
+        similarity_score += 1
+    
+    # Tag overlap
+    if tag_overlap >= 2:
+        similarity_score += 2
+    elif tag_overlap >= 1:
+        similarity_score += 1
+    
+    # Name similarity (common words)
+    if name_overlap >= 2:
+        similarity_score += 2
+    elif name_overlap >= 1:
+        similarity_score += 1
+    
+    # Description keyword overlap
+    if len(own.desc_keywords & other.desc_keywords) >= 3:
+        similarity_score += 1
+    
+    return similarity_score
+
+
+def count_similar_skills(
+    skill: Dict,
+    all_skills: List[Dict],
+    index: Optional[_SuggestIndex] = None
+) -> int:
     """Count how many similar skills exist in the catalog."""
-    skill_name = skill["name"].lower()
-    skill_desc = skill.get("description", "").lower()
-    skill_tags = set(t.lower() for t in skill.get("tags", []))
-    skill_category = skill.get("category", "").lower()
+    own = _features(skill, index)
     skill_id = skill["id"]
     
+    if index is not None and all_skills is index.skills:
+        # Category and description add at most 2 points, so a skill can only
+        # reach the threshold of 3 by sharing a tag or a name word.
+        tag_hits: Dict[int, int] = {}
+        for tag in own.tag_set:
+            for pos in index.tag_postings.get(tag, ()):
+                tag_hits[pos] = tag_hits.get(pos, 0) + 1
+        name_hits: Dict[int, int] = {}
+        for word in own.name_words:
+            for pos in index.name_postings.get(word, ()):
+                name_hits[pos] = name_hits.get(pos, 0) + 1
+        
+        candidates = (
+            (all_skills[pos], tag_hits.get(pos, 0), name_hits.get(pos, 0))
+            for pos in tag_hits.keys() | name_hits.keys()
+        )
+    else:
+        candidates = (
+            (other_skill, None, None) for other_skill in all_skills
+        )
+    
     similar_count = 0
     
-    for other_skill in all_skills:
+    for other_skill, tag_overlap, name_overlap in candidates:
         if other_skill["id"] == skill_id:
             continue
         
-        other_name = other_skill["name"].lower()
-        other_desc = other_skill.get("description", "").lower()
-        other_tags = set(t.lower() for t in other_skill.get("tags", []))
-        other_category = other_skill.get("category", "").lower()
-        
-        similarity_score = 0
-        
-        # Same category
-        if skill_category and skill_category == other_category:
-            similarity_score += 1
-        
-        # Tag overlap
-        tag_overlap = len(skill_tags & other_tags)
-        if tag_overlap >= 2:
-            similarity_score += 2
-        elif tag_overlap >= 1:
-            similarity_score += 1
-        
-        # Name similarity (common words)
-        skill_words = set(skill_name.split())
-        other_words = set(other_name.split())
-        name_overlap = len(skill_words & other_words)
-        if name_overlap >= 2:
-            similarity_score += 2
-        elif name_overlap >= 1:
-            similarity_score += 1
-        
-        # Description keyword overlap
-        skill_desc_words = set(extract_keywords(skill_desc))
-        other_desc_words = set(extract_keywords(other_desc))
-        desc_overlap = len(skill_desc_words & other_desc_words)
-        if desc_overlap >= 3:
-            similarity_score += 1
+        other = _features(other_skill, index)
+        if tag_overlap is None:
+            tag_overlap = len(own.tag_set & other.tag_set)
+            name_overlap = len(own.name_words & other.name_words)
         
         # Consider similar if score >= 3
-        if similarity_score >= 3:
+        if _similarity_score(own, other, tag_overlap, name_overlap) >= 3:
             similar_count += 1
     
     return similar_count
 
 
+# Markdown noise stripped before keyword extraction
+_CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+_INLINE_CODE_RE = re.compile(r'`[^`]+`')
+_URL_RE = re.compile(r'https?://\S+')
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+
+
+@lru_cache(maxsize=None)
+def _keyword_re(min_length: int) -> "re.Pattern":
+    """Words of at least min_length chars; the length check runs inside the regex engine."""
+    return re.compile(r'\b[a-z][a-z0-9_-]{%d,}\b' % max(min_length - 1, 0))
+
+# Common stop words to exclude from keywords
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
+    'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
+    'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'use',
+    'using', 'used', 'make', 'made', 'get', 'set', 'put', 'new', 'also'
+})
+
+
 def extract_keywords(text: str, min_length: int = 3) -> set:
     """Extract meaningful keywords from text."""
-    # Remove markdown, code blocks, URLs
-    text = re.sub(r'```.*?```', ' ', text, flags=re.DOTALL)
-    text = re.sub(r'`[^`]+`', ' ', text)
-    text = re.sub(r'https?://\S+', ' ', text)
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    # Remove markdown, code blocks, URLs (skipping passes that cannot match)
+    if '`' in text:
+        text = _CODE_BLOCK_RE.sub(' ', text)
+        text = _INLINE_CODE_RE.sub(' ', text)
+    if '://' in text:
+        text = _URL_RE.sub(' ', text)
+    if '](' in text:
+        text = _MD_LINK_RE.sub(r'\1', text)
     
     # Extract words
-    words = re.findall(r'\b[a-z][a-z0-9_-]*\b', text.lower())
-    
-    # Common stop words to exclude
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-        'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-        'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
-        'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-        'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
-        'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
-        'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'use',
-        'using', 'used', 'make', 'made', 'get', 'set', 'put', 'new', 'also'
-    }
-    
-    keywords = {w for w in words if len(w) >= min_length and w not in stop_words}
+    keywords = set(_keyword_re(min_length).findall(text.lower()))
+    keywords -= STOP_WORDS
     return keywords
 
 
@@ -2085,19 +3135,20 @@ def prefilter_skills_by_relevance(
     skills: List[Dict],
     readme_content: str,
     analysis: Dict,
-    top_n: int = 30
+    top_n: int = 30,
+    index: Optional[_SuggestIndex] = None
 ) -> List[Dict]:
     """
     Pre-filter catalog to top N most relevant skills before LLM analysis.
     This dramatically reduces the context size sent to LLM.
     """
     # Extract keywords from README
-    readme_keywords = extract_keywords(readme_content) if readme_content else set()
+    readme_keywords = frozenset(extract_keywords(readme_content)) if readme_content else frozenset()
+    readme_keywords_long = frozenset(k for k in readme_keywords if len(k) > 4)
     
     # Extract context from project structure
-    languages = set(l.lower() for l in analysis.get("languages", []))
-    frameworks = set(f.lower() for f in analysis.get("frameworks", []))
-    file_exts = set(analysis.get("file_types", []))
+    languages = frozenset(l.lower() for l in analysis.get("languages", []))
+    frameworks = frozenset(f.lower() for f in analysis.get("frameworks", []))
     
     # Build combined context keywords
     context_keywords = readme_keywords | languages | frameworks
@@ -2106,46 +3157,30 @@ def prefilter_skills_by_relevance(
     scored_skills = []
     for skill in skills:
         score = 0
-        skill_name = skill["name"].lower()
-        skill_desc = skill.get("description", "").lower()
-        skill_tags = [t.lower() for t in skill.get("tags", [])]
-        skill_category = skill.get("category", "").lower()
+        features = _features(skill, index)
         
-        # Build skill searchable text
-        skill_text = f"{skill_name} {skill_desc} {' '.join(skill_tags)} {skill_category}"
-        skill_words = set(extract_keywords(skill_text))
+        # Skill searchable text
+        skill_text = features.text
+        skill_words = features.text_keywords
         
         # Keyword overlap score (most important)
         overlap = context_keywords & skill_words
         score += len(overlap) * 10
         
         # Direct keyword matches get bonus
-        for keyword in readme_keywords:
-            if len(keyword) > 4 and keyword in skill_text:
-                score += 20
+        score += len(readme_keywords_long & skill_words) * 20
         
         # Language exact matches
-        for lang in languages:
-            if lang in skill_tags or lang in skill_name:
-                score += 15
+        score += 15 * sum(
+            1 for lang in languages
+            if lang in features.tag_set or lang in features.name_parts
+        )
         
         # Framework exact matches
-        for framework in frameworks:
-            if framework in skill_text:
-                score += 15
+        score += len(frameworks & skill_words) * 15
         
         # Quality and maintenance bonus
-        quality = skill.get("quality_score", 0)
-        if quality >= 80:
-            score += 5
-        elif quality >= 60:
-            score += 2
-        
-        maint = skill.get("maintenance_status", "")
-        if maint == "active":
-            score += 3
-        elif maint == "maintained":
-            score += 1
+        score += features.prefilter_bonus
         
         # Category relevance
         if readme_content:
@@ -2162,9 +3197,9 @@ def prefilter_skills_by_relevance(
         if score > 0:
             scored_skills.append((score, skill))
     
-    # Sort by score and return top N
-    scored_skills.sort(key=lambda x: (-x[0], -x[1].get("quality_score", 0)))
-    return [skill for score, skill in scored_skills[:top_n]]
+    # Top N by score, then quality (nlargest keeps sorted()'s tie order)
+    top = heapq.nlargest(top_n, scored_skills, key=lambda x: (x[0], x[1].get("quality_score", 0)))
+    return [skill for score, skill in top]
 
 
 def cmd_suggest(args):
@@ -2183,8 +3218,9 @@ def cmd_suggest(args):
     
     if readme_path:
         try:
-            readme_content = readme_path.read_text(encoding='utf-8', errors='ignore')
-            # Truncate if too long (keep first 8000 chars for context)
+            # Keep the first 8000 chars for context; reading one more tells us if it was truncated
+            with readme_path.open(encoding='utf-8', errors='ignore') as f:
+                readme_content = f.read(8001)
             if len(readme_content) > 8000:
                 readme_content = readme_content[:8000] + "\n\n[... truncated for length ...]"
             print_info(f"Found README: {readme_path.name}")
@@ -2193,8 +3229,8 @@ def cmd_suggest(args):
     else:
         print_warning("No README found. Analysis will be limited.")
     
-    # Analyze project structure
-    analysis = analyze_project_structure(project_path)
+    # Analyze project structure (cached until the project dir or README changes)
+    analysis = analyze_project_cached(project_path, readme_path, rescan=getattr(args, "rescan", False))
     
     if args.verbose:
         print(f"\n{Colors.DIM}Project Analysis:{Colors.RESET}")
@@ -2215,8 +3251,11 @@ def cmd_suggest(args):
     skills_list = catalog.get("skills", [])
     print_info(f"Analyzing against {len(skills_list)} skills from catalog...")
     
+    # Tokenize every skill once for all the scoring passes below
+    index = _per_catalog(_suggest_index, catalog, _build_suggest_index)
+    
     # Pre-filter to most relevant skills (dramatically reduces LLM context)
-    relevant_skills = prefilter_skills_by_relevance(skills_list, readme_content, analysis, top_n=30)
+    relevant_skills = prefilter_skills_by_relevance(skills_list, readme_content, analysis, top_n=30, index=index)
     
     if args.verbose:
         efficiency = (1 - len(relevant_skills) / len(skills_list)) * 100
@@ -2248,7 +3287,7 @@ PROJECT STRUCTURE:
 - File types: {', '.join(list(analysis['file_types'])[:20])}
 
 RELEVANT SKILLS (pre-filtered from {len(skills_list)} total skills):
-{json.dumps(skills_summary, indent=2)}
+{_json_dumps(skills_summary)}
 
 TASK:
 Based on the README and project structure, recommend 5-10 skills from the list above.
@@ -2277,7 +3316,8 @@ RESPONSE FORMAT (JSON only):
         relevant_skills, 
         readme_content, 
         analysis, 
-        top_n=10
+        top_n=10,
+        index=index
     )
     
     # Optional: Try LLM enhancement if --llm flag is set (future feature)
@@ -2295,7 +3335,7 @@ RESPONSE FORMAT (JSON only):
             if json_match:
                 response_text = json_match.group(1)
             
-            parsed = json.loads(response_text)
+            parsed = _json_loads(response_text)
             llm_recommendations = parsed.get("recommendations", [])
             project_summary = parsed.get("project_summary")
             
@@ -2319,20 +3359,12 @@ RESPONSE FORMAT (JSON only):
     
     print(f"{Colors.BOLD}Recommended Skills for Your Project:{Colors.RESET}\n")
     
-    # Calculate similar skills for each recommendation
-    similar_counts = {}
-    for rec in recommendations:
-        skill = find_skill(catalog, rec["skill_id"])
-        if skill:
-            similar_count = count_similar_skills(skill, skills_list)
-            similar_counts[rec["skill_id"]] = similar_count
-    
     for i, rec in enumerate(recommendations, 1):
         skill_id = rec["skill_id"]
         reason = rec["reason"]
         confidence = rec.get("confidence", "medium")
         
-        # Get full skill details
+        # Get full skill details (looked up once, from the catalog already loaded above)
         skill = find_skill(catalog, skill_id)
         if not skill:
             continue
@@ -2371,7 +3403,7 @@ RESPONSE FORMAT (JSON only):
             days_label = ""
         
         # Similar skills count
-        similar_count = similar_counts.get(skill_id, 0)
+        similar_count = count_similar_skills(skill, skills_list, index)
         similar_label = f"{Colors.CYAN}{similar_count} similar{Colors.RESET}" if similar_count > 0 else ""
         
         # Header line
@@ -2406,7 +3438,8 @@ def generate_enhanced_recommendations(
     skills: List[Dict],
     readme_content: str,
     analysis: Dict,
-    top_n: int = 10
+    top_n: int = 10,
+    index: Optional[_SuggestIndex] = None
 ) -> List[Dict]:
     """
     Generate high-quality skill recommendations using enhanced heuristics.
@@ -2419,36 +3452,39 @@ def generate_enhanced_recommendations(
     frameworks = set(f.lower() for f in analysis.get("frameworks", []))
     file_types = set(analysis.get("file_types", []))
     
+    # Project-side checks that are the same for every skill
+    readme_domain_bits = _domain_bits(readme_lower.__contains__)
+    has_data_files = any(ext in ['.json', '.yaml', '.toml', '.xml'] for ext in file_types)
+    mentions_documents = 'document' in readme_lower
+    
     scored_skills = []
     
     for skill in skills:
         score = 0
         reasons = []
         
-        skill_id = skill["id"]
-        skill_name = skill["name"].lower()
-        skill_desc = skill.get("description", "").lower()
-        skill_tags = [t.lower() for t in skill.get("tags", [])]
-        skill_category = skill.get("category", "").lower()
+        features = _features(skill, index)
+        skill_name = features.name
+        skill_desc = features.desc
+        skill_tags = features.tags
+        skill_category = features.category
         
         # Primary matching: README keywords
         if readme_keywords:
             # Exact keyword matches in skill name (highest weight)
-            name_words = set(skill_name.split())
-            name_matches = readme_keywords & name_words
+            name_matches = readme_keywords & features.name_words
             if name_matches:
                 score += 30
                 reasons.append(f"name matches: {', '.join(list(name_matches)[:2])}")
             
             # Keyword matches in tags (high weight)
-            tag_matches = readme_keywords & set(skill_tags)
+            tag_matches = readme_keywords & features.tag_set
             if tag_matches:
                 score += 25
                 reasons.append(f"tags match: {', '.join(list(tag_matches)[:2])}")
             
             # Keyword matches in description (medium weight)
-            desc_words = set(extract_keywords(skill_desc))
-            desc_matches = readme_keywords & desc_words
+            desc_matches = readme_keywords & features.desc_keywords
             if len(desc_matches) >= 2:
                 score += 15
                 reasons.append(f"{len(desc_matches)} keyword matches")
@@ -2474,61 +3510,24 @@ def generate_enhanced_recommendations(
                 reasons.append(f"mentions {framework}")
                 break
         
-        # Domain-specific matching (from README context)
-        if readme_lower:
-            domain_keywords = {
-                'api': ['api', 'rest', 'graphql', 'endpoint', 'swagger'],
-                'database': ['database', 'sql', 'postgres', 'mysql', 'mongodb', 'redis'],
-                'testing': ['test', 'testing', 'pytest', 'jest', 'cypress'],
-                'devops': ['docker', 'kubernetes', 'deploy', 'ci/cd', 'github-actions'],
-                'frontend': ['react', 'vue', 'angular', 'frontend', 'ui', 'component'],
-                'backend': ['backend', 'server', 'express', 'fastapi', 'django'],
-                'ml': ['machine-learning', 'ml', 'tensorflow', 'pytorch', 'model'],
-                'docs': ['documentation', 'docs', 'readme', 'markdown']
-            }
-            
-            for domain, keywords in domain_keywords.items():
-                readme_has_domain = any(kw in readme_lower for kw in keywords)
-                skill_in_domain = any(kw in skill_name or kw in skill_desc or kw in skill_tags for kw in keywords)
-                
-                if readme_has_domain and skill_in_domain:
-                    score += 15
-                    reasons.append(f"{domain} domain match")
-                    break
+        # Domain-specific matching (from README context); first shared domain wins
+        shared = features.domain_bits & readme_domain_bits
+        if shared:
+            score += 15
+            reasons.append(f"{_DOMAIN_NAMES[(shared & -shared).bit_length() - 1]} domain match")
         
-        # Quality and maintenance scoring
-        quality = skill.get("quality_score", 0)
-        if quality >= 80:
-            score += 10
-            reasons.append("high quality")
-        elif quality >= 60:
-            score += 5
-        
-        maint = skill.get("maintenance_status", "")
-        if maint == "active":
-            score += 8
-            reasons.append("actively maintained")
-        elif maint == "maintained":
-            score += 4
+        # Quality, maintenance and provider trust (official providers get slight boost)
+        score += features.ranking_bonus
+        reasons.extend(features.ranking_reasons)
         
         # Category relevance bonuses
         if skill_category:
             if languages and skill_category == "development":
                 score += 5
-            if file_types and any(ext in ['.json', '.yaml', '.toml', '.xml'] for ext in file_types):
-                if skill_category == "data":
-                    score += 5
-            if readme_lower and 'document' in readme_lower and skill_category == "documents":
+            if has_data_files and skill_category == "data":
+                score += 5
+            if mentions_documents and skill_category == "documents":
                 score += 5
-        
-        # Provider trust score (official providers get slight boost)
-        provider = skill_id.split('/')[0]
-        trusted_providers = {
-            'anthropics', 'openai', 'github', 'vercel', 'cloudflare',
-            'stripe', 'supabase', 'huggingface'
-        }
-        if provider in trusted_providers:
-            score += 3
         
         if score > 0:
             # Determine confidence level
@@ -2546,12 +3545,12 @@ def generate_enhanced_recommendations(
                 "confidence": confidence
             })
     
-    # Sort by score and quality
-    scored_skills.sort(key=lambda x: (-x["score"], -x["skill"].get("quality_score", 0)))
+    # Top N by score and quality
+    top = heapq.nlargest(top_n, scored_skills, key=lambda x: (x["score"], x["skill"].get("quality_score", 0)))
     
     # Convert to recommendation format
     recommendations = []
-    for item in scored_skills[:top_n]:
+    for item in top:
         reason = "; ".join(item["reasons"][:3]) if item["reasons"] else "General utility"
         recommendations.append({
             "skill_id": item["skill"]["id"],
@@ -2588,7 +3587,7 @@ def cmd_export(args):
         skills = load_skills_from_dir(skills_dir)
     else:
         # Load from all installed locations
-        for location_type, path in get_all_install_locations():
+        for location_type, path in _iter_install_locations():
             skills.extend(load_skills_from_dir(path))
     
     if not skills:
@@ -2732,10 +3731,12 @@ Examples:
   skillsdir suggest /path/to/project   # Analyze specific project
   skillsdir suggest --verbose          # Show detailed analysis
   skillsdir suggest --llm              # Enhance with LLM (requires MCP)
+  skillsdir suggest --rescan           # Re-scan instead of using the cached analysis
 """)
     p_suggest.add_argument("path", nargs="?", help="Project directory (default: current directory)")
     p_suggest.add_argument("--verbose", "-v", action="store_true", help="Show detailed project analysis")
     p_suggest.add_argument("--llm", action="store_true", dest="use_llm", help="Enhance with LLM analysis (optional, requires Perplexity MCP)")
+    p_suggest.add_argument("--rescan", action="store_true", help="Ignore the cached project analysis and scan again")
     p_suggest.set_defaults(func=cmd_suggest)
     
     # install
@@ -2826,10 +3827,12 @@ Examples:
   skills validate ./my-skill         # Validate specific directory
   skills validate --verbose          # Show detailed results
   skills validate --skip-catalog     # Skip duplicate checking
+  skills validate --deep-check       # Check duplicates against a fresh catalog
 """)
     p_validate.add_argument("path", nargs="?", help="Skill directory (default: current)")
     p_validate.add_argument("--verbose", "-v", action="store_true", help="Show detailed validation results")
     p_validate.add_argument("--skip-catalog", action="store_true", help="Skip catalog fetch for duplicate checking")
+    p_validate.add_argument("--deep-check", action="store_true", help="Re-download the catalog for duplicate checking instead of using the cached copy")
     p_validate.set_defaults(func=cmd_validate)
     
     # publish - publish a skill to the registry
@@ -2856,12 +3859,14 @@ Examples:
   skills publish --submit        # Also submit to official directory
   skills publish --dry-run       # Preview what would happen
   skills publish --force         # Continue despite warnings
+  skills publish --deep-check    # Check duplicates against a fresh catalog
 """)
     p_publish.add_argument("path", nargs="?", help="Skill directory (default: current)")
     p_publish.add_argument("--dry-run", "-n", action="store_true", help="Preview without making changes")
     p_publish.add_argument("--yes", "-y", action="store_true", help="Auto-confirm prompts")
     p_publish.add_argument("--submit", "-s", action="store_true", help="Submit to official directory via issue")
     p_publish.add_argument("--force", "-f", action="store_true", help="Continue despite validation warnings")
+    p_publish.add_argument("--deep-check", action="store_true", help="Re-download the catalog for duplicate checking instead of using the cached copy")
     p_publish.set_defaults(func=cmd_publish)
     
     # login - authenticate with GitHub
@@ -1215,6 +1215,15 @@ def check_provider_changed(provider_id: str, provider_config: dict, last_commit:
     return current_commit != last_commit
 
 
+def build_skill_names_export(catalog: dict) -> dict:
+    """Reduce the catalog to the id/name pairs needed for duplicate-name checks."""
+    return {
+        "version": catalog["version"],
+        "generated_at": catalog["generated_at"],
+        "skills": [{"id": s["id"], "name": s["name"]} for s in catalog["skills"]],
+    }
+
+
 def generate_ecosystem_exports(catalog: dict, output_dir: Path) -> None:
     """Generate ecosystem-specific filtered exports for Claude, Copilot, MCP, and badges."""
     exports_dir = output_dir / "exports"
@@ -1298,6 +1307,14 @@ def generate_ecosystem_exports(catalog: dict, output_dir: Path) -> None:
             json.dump(data, f, indent=2, cls=CatalogEncoder)
         print(f"✓ Export: {filepath} ({data['total_skills']} skills)")
     
+    # Names-only index for the CLI's publish-time duplicate check, so it need
+    # not download the full catalog
+    names_export = build_skill_names_export(catalog)
+    filepath = exports_dir / "skill-names.json"
+    with open(filepath, "w") as f:
+        json.dump(names_export, f, separators=(",", ":"), ensure_ascii=False)
+    print(f"✓ Export: {filepath} ({len(names_export['skills'])} names)")
+    
     # Generate shields.io endpoint for dynamic badges
     badge_data = {
         "schemaVersion": 1,
@@ -1369,6 +1386,11 @@ def generate_ecosystem_exports(catalog: dict, output_dir: Path) -> None:
                 "description": "Recently maintained skills",
                 "total": active_export["total_skills"],
                 "cdn": "https://cdn.jsdelivr.net/gh/dmgrok/agent_skills_directory@main/exports/active-skills.json"
+            },
+            "skill-names.json": {
+                "description": "Skill IDs and names only (duplicate-name checks)",
+                "total": len(names_export["skills"]),
+                "cdn": "https://cdn.jsdelivr.net/gh/dmgrok/agent_skills_directory@main/exports/skill-names.json"
             }
         },
         "badges": {
@@ -27,4 +27,15 @@ def test_extract_tags_includes_keywords_and_name_words():
     tags = aggregate.extract_tags("PDF Converter", "Convert PDF to text")
     assert "pdf" in tags
     assert "convert" in tags
-    assert "converter" in tags
\ No newline at end of file
+    assert "converter" in tags
+
+
+def test_build_skill_names_export_keeps_only_ids_and_names():
+    catalog = {
+        "version": "2026.07.02",
+        "generated_at": "2026-07-02T09:31:07+00:00",
+        "skills": [{"id": "anthropics/pdf", "name": "pdf", "description": "long", "tags": ["pdf"]}],
+    }
+    export = aggregate.build_skill_names_export(catalog)
+    assert export["skills"] == [{"id": "anthropics/pdf", "name": "pdf"}]
+    assert export["version"] == "2026.07.02"
@@ -0,0 +1,173 @@
+import sys
+from pathlib import Path
+
+
+# Ensure project root is on path so we can import cli.loader
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import pytest  # noqa: E402
+
+from cli.loader import Skill, SkillInput, SkillOutput  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    from cli import skills
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(skills, "SKILLS_CACHE", cache_dir)
+    return cache_dir
+
+
+def _sample_skill():
+    return Skill(
+        id="local/sample",
+        name="Sample Skill",
+        description="Does something",
+        instructions="Use {query} to search.",
+        inputs=[
+            SkillInput(name="query", description="Search query", required=True),
+            SkillInput(name="limit", type="integer", default=10),
+        ],
+        outputs=[SkillOutput(name="results", type="array")],
+    )
+
+
+def test_get_metadata_serializes_inputs_and_outputs():
+    metadata = _sample_skill().get_metadata()
+    assert metadata["inputs"][0] == {
+        "name": "query",
+        "type": "string",
+        "description": "Search query",
+        "required": True,
+        "default": None,
+    }
+    assert metadata["outputs"] == [{"name": "results", "type": "array", "description": ""}]
+
+
+def test_tool_exports_share_input_schema():
+    skill = _sample_skill()
+    tool = skill.to_langchain_tool()
+    assert tool["args_schema"]["required"] == ["query"]
+    assert set(tool["args_schema"]["properties"]) == {"query", "limit"}
+    assert skill.to_anthropic_tools()[0]["input_schema"] == tool["args_schema"]
+
+
+def test_langchain_prompt_escapes_declared_inputs_only():
+    skill = _sample_skill()
+    skill.instructions = "Use {query} ({limit} max), keep {other}."
+    assert skill.to_langchain_prompt() == "Use {{query}} ({{limit}} max), keep {other}."
+
+
+def test_mcp_handler_caches_payload_until_files_change(tmp_path):
+    import os
+
+    from cli.loader import create_mcp_resource_handler
+
+    skill_dir = tmp_path / "pdf"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: pdf\ndescription: PDF tools\n---\nOriginal body\n")
+
+    handler = create_mcp_resource_handler(tmp_path)
+    first = handler.read("skill://local/pdf")
+    assert first["content"] == "Original body"
+    assert handler.list() == [first]
+    assert handler.read("local/pdf") is first
+
+    skill_md.write_text("---\nname: pdf\ndescription: PDF tools\n---\nUpdated body\n")
+    stat = skill_md.stat()
+    os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert handler.read("skill://local/pdf")["content"] == "Updated body"
+
+
+def test_load_skills_from_dir_defers_instructions(tmp_path):
+    from cli.loader import LazySkill, load_skills_from_dir
+
+    skill_dir = tmp_path / "anthropic" / "pdf"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: PDF Tools\ndescription: Work with PDFs\n---\n\n# PDF\n\nBody text.\n"
+    )
+
+    [skill] = load_skills_from_dir(tmp_path)
+    assert isinstance(skill, LazySkill)
+    assert skill.name == "PDF Tools"
+    assert "instructions" not in vars(skill)
+    assert skill.instructions == "# PDF\n\nBody text."
+
+
+def test_frontmatter_parse_cache_is_reused_until_file_changes(tmp_path, isolated_cache, monkeypatch):
+    from cli.loader import SkillLoader
+
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text("---\nname: cached\n---\nBody\n")
+
+    assert SkillLoader.from_directory(skill_dir).name == "cached"
+    assert len(list((isolated_cache / "parsed").iterdir())) == 1
+
+    def fail(text):
+        raise AssertionError("frontmatter should come from the parse cache")
+
+    monkeypatch.setattr(SkillLoader, "_parse_frontmatter", staticmethod(fail))
+    skill = SkillLoader.from_directory(skill_dir)
+    assert skill.name == "cached"
+    assert skill.instructions == "Body"
+
+
+def test_fallback_parser_cache_entries_are_redone_with_pyyaml(tmp_path, isolated_cache, monkeypatch):
+    import cli.loader as loader
+
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text("---\nname: tagged\ntags: [a, b]\n---\nBody\n")
+
+    with monkeypatch.context() as m:
+        m.setattr(loader, "HAS_YAML", False)
+        assert loader.SkillLoader.from_directory(skill_dir).raw_manifest["tags"] == "[a, b]"
+
+    assert loader.SkillLoader.from_directory(skill_dir).raw_manifest["tags"] == ["a", "b"]
+
+
+def test_fallback_frontmatter_parser_reads_top_level_pairs(monkeypatch):
+    import cli.loader as loader
+
+    monkeypatch.setattr(loader, "HAS_YAML", False)
+    frontmatter = loader.SkillLoader._parse_frontmatter(
+        "name: pdf  \nversion : 1.0\n  nested: skipped\ndescription: Read: and write\n"
+    )
+    assert frontmatter == {"name": "pdf", "version": "1.0", "description": "Read: and write"}
+
+
+def test_read_frontmatter_only_reports_body_offset(tmp_path):
+    from cli.loader import SkillLoader
+
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_bytes("---\nname: café\n---\n\n# Body\n".encode("utf-8"))
+
+    text, offset = SkillLoader._read_frontmatter_only(skill_md)
+    assert text == "name: café\n"
+    assert skill_md.read_bytes()[offset:] == b"\n# Body\n"
+
+
+@pytest.mark.parametrize("raw, name, body", [
+    (b"---\r\nname: pdf\r\n---\r\nLine one\r\nLine two\r\n", "pdf", "Line one\nLine two"),
+    (b"---\nname: pdf\ndescription: a --- b\n---\nBody\n", "pdf", "Body"),
+    (b"No frontmatter\n", "skill", "No frontmatter\n"),
+])
+def test_lazy_and_eager_loads_agree(tmp_path, isolated_cache, raw, name, body):
+    from cli.loader import SkillLoader
+
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_bytes(raw)
+
+    # Lazy first, so the eager load reads frontmatter from the shared parse cache
+    lazy = SkillLoader.from_directory(skill_dir, lazy=True)
+    eager = SkillLoader.from_directory(skill_dir)
+    for skill in (lazy, eager):
+        assert (skill.name, skill.instructions) == (name, body)
+    assert lazy.raw_manifest == eager.raw_manifest
@@ -0,0 +1,762 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Ensure project root is on path so we can import cli.skills
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from cli import skills  # noqa: E402
+
+
+@pytest.fixture
+def skills_home(tmp_path, monkeypatch):
+    """Point all ~/.skills paths at a temporary directory."""
+    home = tmp_path / ".skills"
+    monkeypatch.setattr(skills, "SKILLS_HOME", home)
+    monkeypatch.setattr(skills, "SKILLS_CONFIG", home / "config.json")
+    monkeypatch.setattr(skills, "SKILLS_INSTALLED", home / "installed")
+    monkeypatch.setattr(skills, "SKILLS_CACHE", home / "cache")
+    monkeypatch.setattr(skills, "_manifest_cache", None)
+    monkeypatch.setattr(skills, "_manifest_cache_dirty", False)
+    monkeypatch.setattr(skills, "_unpinned_manifest_cache", {})
+    monkeypatch.setattr(skills, "STATS_FILE", home / "stats.json")
+    monkeypatch.setattr(skills, "_stats_cache", None)
+    monkeypatch.setattr(skills, "_stats_dirty", False)
+    skills._invalidate_installed_cache()
+    yield home
+    skills._invalidate_installed_cache()
+
+
+def test_fetch_catalog_reuses_parsed_cache_within_process(skills_home, monkeypatch):
+    skills.ensure_dirs()
+    cache_path = skills.get_cache_path(skills.CATALOG_URL)
+    cache_path.write_text('{"version": "2026.01.01", "skills": []}')
+
+    first = skills.fetch_catalog()
+    assert first["version"] == "2026.01.01"
+
+    parsed = []
+    real_loads = skills._json_loads
+    monkeypatch.setattr(skills, "_json_loads", lambda data: parsed.append(data) or real_loads(data))
+    assert skills.fetch_catalog() is first
+    assert not any(b'"skills"' in data for data in parsed)
+
+    # Touching the cache file invalidates the in-process copy
+    cache_path.write_text('{"version": "2026.02.01", "skills": []}')
+    os.utime(cache_path, ns=(0, cache_path.stat().st_mtime_ns + 1_000_000))
+    assert skills.fetch_catalog()["version"] == "2026.02.01"
+
+
+def test_detect_agent_is_memoized_per_project(tmp_path, monkeypatch):
+    for profile in skills.AGENT_PROFILES.values():
+        if profile["env_var"]:
+            monkeypatch.delenv(profile["env_var"], raising=False)
+    for agent_id in ("claude", "copilot", "codex", "cursor"):
+        monkeypatch.setitem(skills.AGENT_PROFILES[agent_id], "personal_path", tmp_path / "none")
+    skills.detect_agent.cache_clear()
+
+    project = tmp_path / "project"
+    project.mkdir()
+    assert skills.detect_agent(project) == "generic"
+
+    (project / ".cursor").mkdir()
+    assert skills.detect_agent(project) == "generic"
+
+    skills.detect_agent.cache_clear()
+    assert skills.detect_agent(project) == "cursor"
+    skills.detect_agent.cache_clear()
+
+
+def test_get_install_path_validates_skill_id(tmp_path):
+    path = skills.get_install_path("anthropic/pdf", agent="claude", project=True, project_path=tmp_path)
+    assert path == tmp_path / ".claude" / "skills" / "pdf"
+
+    with pytest.raises(ValueError, match="provider/name"):
+        skills.get_install_path("pdf", agent="claude")
+
+
+def test_get_all_install_locations_lists_existing_dirs_in_order(skills_home, tmp_path, monkeypatch):
+    for agent_id in ("claude", "copilot", "codex", "cursor", "generic"):
+        monkeypatch.setitem(skills.AGENT_PROFILES[agent_id], "personal_path", tmp_path / agent_id)
+    (tmp_path / "codex").mkdir()
+    skills.ensure_dirs()
+
+    project = tmp_path / "project"
+    (project / ".cursor" / "skills").mkdir(parents=True)
+
+    assert skills.get_all_install_locations(project) == [
+        ("global", skills_home / "installed"),
+        ("personal (codex)", tmp_path / "codex"),
+        ("project (cursor)", project / ".cursor" / "skills"),
+    ]
+
+
+def test_find_skill_uses_first_match_and_indexes_each_catalog():
+    first = {"id": "a/one", "name": "First"}
+    catalog = {"skills": [first, {"id": "a/two"}, {"id": "a/one", "name": "Duplicate"}]}
+    assert skills.find_skill(catalog, "a/one") is first
+    assert skills.find_skill(catalog, "a/missing") is None
+    assert skills.find_skill({"skills": [{"id": "a/one", "name": "Other"}]}, "a/one")["name"] == "Other"
+
+
+def test_resolve_dependencies_fetches_each_manifest_once(skills_home, monkeypatch):
+    catalog = {"skills": [
+        {"id": "a/app", "version": "1.0.0",
+         "source": {"skill_json_url": "https://x/app.json", "commit_sha": "aaa"}},
+        {"id": "a/lib", "version": "1.2.0", "source": {"skill_json_url": "https://x/lib.json"}},
+    ]}
+    manifests = {
+        "https://x/app.json": '{"dependencies": {"a/lib": "^1.0.0"}}',
+        "https://x/lib.json": '{"dependencies": {}}',
+    }
+    fetched = []
+    monkeypatch.setattr(skills, "fetch_url", lambda url: fetched.append(url) or manifests[url])
+
+    resolved, errors = skills.resolve_dependencies("a/app", catalog, {})
+    assert errors == [] and resolved["a/lib"]["version"] == "1.2.0"
+    assert len(fetched) == 2
+
+    # Same process, then a fresh process reading the persisted cache
+    skills.resolve_dependencies("a/app", catalog, {})
+    monkeypatch.setattr(skills, "_manifest_cache", None)
+    monkeypatch.setattr(skills, "_unpinned_manifest_cache", {})
+    resolved, _ = skills.resolve_dependencies("a/app", catalog, {})
+    assert list(resolved) == ["a/lib"]
+    # Only a/lib, which has no commit_sha pinning its skill.json, is fetched again
+    assert fetched == ["https://x/app.json", "https://x/lib.json", "https://x/lib.json"]
+
+    # A new upstream commit invalidates the persisted entry
+    catalog["skills"][0]["source"]["commit_sha"] = "bbb"
+    manifests["https://x/app.json"] = '{"dependencies": {}}'
+    assert skills.resolve_dependencies("a/app", catalog, {}) == ({}, [])
+
+
+def test_get_installed_skills_is_cached_until_invalidated(skills_home, tmp_path):
+    skills.ensure_dirs()
+    project = tmp_path / "project"
+    project.mkdir()
+    assert skills.get_installed_skills(project) == {}
+
+    skill_dir = skills_home / "installed" / "acme" / "pdf"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "skill.json").write_text('{"name": "pdf", "version": "1.0.0"}')
+    assert skills.get_installed_skills(project) == {}
+
+    skills._invalidate_installed_cache()
+    installed = skills.get_installed_skills(project)
+    assert installed["acme/pdf"]["version"] == "1.0.0"
+    assert installed["acme/pdf"]["location"] == "global"
+
+
+@pytest.mark.parametrize("version,constraint,expected", [
+    ("1.4.0", "^1.2.0", True),
+    ("2.0.0", "^1.2.0", False),
+    ("0.2.5", "^0.2.1", True),
+    ("0.3.0", "^0.2.1", False),
+    ("1.2.9", "~1.2.3", True),
+    ("1.3.0", "~1.2.3", False),
+    ("1.0.0", ">=1.0.0-rc1", True),
+    ("1.0.0-rc1", "<1.0.0", True),
+    ("1.0.0", "1.0.0", True),
+    ("1.0.1", "*", True),
+])
+def test_version_satisfies(version, constraint, expected):
+    assert skills.version_satisfies(version, constraint) is expected
+
+
+def test_compare_versions_orders_prereleases_first():
+    assert skills.compare_versions("1.0.0-alpha", "1.0.0") == -1
+    assert skills.compare_versions("1.0.0-beta", "1.0.0-alpha") == 1
+    assert skills.compare_versions("1.2", "1.2.0") == 0
+    assert skills.compare_versions("2.0.0", "10.0.0") == -1
+
+
+def test_resolve_dependencies_walks_levels_and_stops_on_cycles(skills_home, monkeypatch):
+    deps = {
+        "a/app": {"a/ui": "^1.0.0", "a/core": "*"},
+        "a/ui": {"a/core": "^2.0.0", "a/app": "*"},
+        "a/core": {"a/missing": "*"},
+    }
+    catalog = {"skills": [
+        {"id": sid, "version": "2.1.0" if sid == "a/core" else "1.0.0",
+         "source": {"skill_json_url": f"https://x/{sid}.json"}}
+        for sid in deps
+    ]}
+    monkeypatch.setattr(
+        skills, "fetch_url",
+        lambda url: skills._json_dumps({"dependencies": deps[url[len("https://x/"):-len(".json")]]}),
+    )
+
+    resolved, errors = skills.resolve_dependencies("a/app", catalog, {})
+    # a/ui -> a/app loops back to the requested skill, which is not re-expanded
+    assert {sid: info["depth"] for sid, info in resolved.items()} == {"a/ui": 1, "a/core": 1}
+    assert errors == ["Dependency not found: a/missing (required by a/core)"]
+
+
+@pytest.mark.parametrize("spec,expected", [
+    ("anthropic/pdf", ("anthropic/pdf", None)),
+    ("anthropic/pdf@1.2.0", ("anthropic/pdf", "1.2.0")),
+    ("@scope/pdf", ("@scope/pdf", None)),
+    ("@scope/pdf@2.0.0", ("@scope/pdf", "2.0.0")),
+])
+def test_parse_skill_spec(spec, expected):
+    assert skills.parse_skill_spec(spec) == expected
+
+
+def test_install_single_skill_records_install_in_callers_dict(skills_home, monkeypatch):
+    monkeypatch.setitem(skills._PROFILE_PERSONAL, "generic", skills_home / "installed")
+    monkeypatch.setattr(skills, "fetch_url", lambda url: "---\nname: pdf\n---\nBody\n")
+    skill = {
+        "id": "acme/pdf", "name": "pdf", "provider": "acme", "version": "1.1.0",
+        "source": {"skill_md_url": "https://x/SKILL.md"},
+    }
+    installed = {}
+
+    ok, path = skills.install_single_skill(skill, {"version": "1"}, installed, agent="generic")
+    assert ok and path == skills_home / "installed" / "pdf"
+    assert installed["acme/pdf"]["version"] == "1.1.0"
+    assert (path / "SKILL.md").read_text().endswith("Body\n")
+
+    monkeypatch.setattr(skills, "fetch_url", lambda url: pytest.fail("already installed"))
+    assert skills.install_single_skill(skill, {}, installed, agent="generic") == (True, path)
+
+
+def test_reinstall_keeps_existing_location(skills_home, monkeypatch):
+    old_path = skills_home / "project" / ".claude" / "skills" / "pdf"
+    old_path.mkdir(parents=True)
+    monkeypatch.setattr(skills, "fetch_url", lambda url: "new body\n")
+    monkeypatch.setattr(skills, "get_install_path", lambda *a, **k: pytest.fail("path recomputed"))
+    skill = {"id": "acme/pdf", "name": "pdf", "provider": "acme", "version": "2.0.0",
+             "source": {"skill_md_url": "https://x/SKILL.md"}}
+    installed = {"acme/pdf": {
+        "path": str(old_path), "version": "1.0.0", "location": "project",
+        "manifest": {"installed_to": "project (claude)", "agent": "claude"},
+    }}
+
+    assert skills._reinstall(skill, {}, installed) == old_path
+    assert (old_path / "SKILL.md").read_text() == "new body\n"
+    assert installed["acme/pdf"]["version"] == "2.0.0"
+    assert installed["acme/pdf"]["manifest"]["agent"] == "claude"
+
+
+def test_search_skills_ranks_and_limits_results():
+    catalog = {"skills": [
+        {"id": "a/reader", "name": "Reader", "description": "Reads pdf files", "tags": []},
+        {"id": "a/pdf", "name": "PDF", "description": "", "tags": ["pdf"]},
+        {"id": "a/other", "name": "Other", "description": "Unrelated", "tags": []},
+        {"id": "a/writer", "name": "Writer", "description": "Writes pdf files", "tags": []},
+    ]}
+    ids = [s["id"] for s in skills.search_skills(catalog, "pdf")]
+    assert ids == ["a/pdf", "a/reader", "a/writer"]
+    assert [s["id"] for s in skills.search_skills(catalog, "pdf", limit=2)] == ids[:2]
+
+
+def test_publish_looks_up_user_and_repo_in_background(skills_home, tmp_path, monkeypatch):
+    import threading
+    from types import SimpleNamespace
+    from cli import validate
+
+    (tmp_path / "skill.json").write_text('{"name": "pdf", "version": "1.0.0"}')
+    user_seen = threading.Event()
+    repo_checked = threading.Event()
+
+    def fake_user(token):
+        user_seen.set()
+        return {"login": "octo"}
+
+    def fake_catalog(**kwargs):
+        assert user_seen.wait(5), "user lookup did not overlap the catalog fetch"
+        return {"skills": []}
+
+    def fake_head(endpoint, token=None):
+        assert endpoint == "/repos/octo/skill-pdf"
+        repo_checked.set()
+        return 404, {}
+
+    def fake_input(prompt):
+        assert repo_checked.wait(5), "repo check did not overlap the warnings prompt"
+        return "y"
+
+    monkeypatch.setattr(skills, "get_github_token", lambda: "t0ken")
+    monkeypatch.setattr(skills, "get_github_user", fake_user)
+    monkeypatch.setattr(skills, "fetch_catalog", fake_catalog)
+    monkeypatch.setattr(skills, "github_api_head", fake_head)
+    monkeypatch.setattr("builtins.input", fake_input)
+    monkeypatch.setattr(validate, "validate_skill_directory",
+                        lambda d, c: SimpleNamespace(is_valid=True, warnings=["short description"]))
+
+    args = SimpleNamespace(path=str(tmp_path), force=False, dry_run=True, submit=False, yes=True)
+    assert skills.cmd_publish(args) == 0
+
+
+def test_github_api_request_reports_api_message(skills_home, monkeypatch):
+    import io
+    from urllib.error import HTTPError
+
+    def fake_urlopen(req, timeout):
+        raise HTTPError(req.full_url, 404, "Not Found", {}, io.BytesIO(b'{"message": "Not Found"}'))
+
+    monkeypatch.setattr(skills, "_HAS_URLLIB3", False)
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    with pytest.raises(RuntimeError, match=r"GitHub API error \(404\): Not Found"):
+        skills.github_api_request("/repos/octo/missing")
+    assert str(skills._github_api_error(502, b"bad gateway", "x")) == "GitHub API error (502): bad gateway"
+
+
+def test_github_api_get_revalidates_with_etag(skills_home, monkeypatch):
+    sent = []
+
+    def fake_send(url, method, body, headers):
+        sent.append(headers.get("If-None-Match"))
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, {}, b""
+        return 200, {"ETag": '"v1"'}, b'{"login": "octo"}'
+
+    monkeypatch.setattr(skills, "_github_api_send", fake_send)
+    assert skills.github_api_request("/user", token="a") == {"login": "octo"}
+    assert skills.github_api_request("/user", token="a") == {"login": "octo"}
+    assert sent == [None, '"v1"']
+
+    # Entries are per token
+    skills.github_api_request("/user", token="b")
+    assert sent[-1] is None
+
+
+def test_github_api_request_waits_out_rate_limit_once(skills_home, monkeypatch):
+    responses = [
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1005"}, b'{"message": "rate limited"}'),
+        (200, {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "4600"}, b'{"login": "octo"}'),
+    ]
+    sent = []
+
+    def fake_send(url, method, body, headers):
+        sent.append(url)
+        result = responses[len(sent) - 1]
+        skills._record_rate_limit(result[1])
+        return result
+
+    slept = []
+    monkeypatch.setattr(skills, "_github_api_send", fake_send)
+    monkeypatch.setattr(skills, "_RATE_STATE", {})
+    monkeypatch.setattr(skills.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(skills.time, "sleep", slept.append)
+
+    assert skills.github_api_request("/user") == {"login": "octo"}
+    assert slept == [6.0] and len(sent) == 2
+    assert skills._RATE_STATE == {"remaining": 4999, "reset": 4600}
+
+    sent.clear()
+    responses[0] = (429, {"Retry-After": "3600"}, b"{}")
+    with pytest.raises(RuntimeError, match="rate limit exceeded"):
+        skills.github_api_request("/user")
+
+
+def test_read_gh_hosts_token_reads_direct_host_key():
+    text = (
+        "gitlab.example.com:\n"
+        "    oauth_token: other\n"
+        "github.com:\n"
+        "    users:\n"
+        "        octo:\n"
+        "            oauth_token: nested\n"
+        "    oauth_token: \"gho_abc123\"  # comment\n"
+        "    user: octo\n"
+    )
+    assert skills._read_gh_hosts_token(text) == "gho_abc123"
+    assert skills._read_gh_hosts_token("github.com:\n    user: octo\n") is None
+    assert skills._read_gh_hosts_token("") is None
+
+
+def test_get_github_user_is_cached_in_config(skills_home, monkeypatch):
+    calls = []
+
+    def fake_request(endpoint, token=None, **kwargs):
+        calls.append(token)
+        return {"login": "octo", "name": "Octo", "email": None,
+                "html_url": "https://github.com/octo", "plan": {"private_repos": 1}}
+
+    monkeypatch.setattr(skills, "github_api_request", fake_request)
+    skills.get_github_user.cache_clear()
+    try:
+        expected = {
+            "login": "octo", "name": "Octo", "email": None, "html_url": "https://github.com/octo",
+        }
+        assert skills.get_github_user("t0ken") == expected
+        skills.get_github_user.cache_clear()  # as in a new process
+        assert skills.get_github_user("t0ken") == expected
+        assert calls == ["t0ken"]
+        assert "t0ken" not in skills.SKILLS_CONFIG.read_text()
+
+        monkeypatch.setattr(skills, "GITHUB_USER_CACHE_TTL", 0)
+        skills.get_github_user.cache_clear()
+        skills.get_github_user("t0ken")
+        assert calls == ["t0ken", "t0ken"]
+    finally:
+        skills.get_github_user.cache_clear()
+
+
+def test_validate_skill_for_publish_reports_missing_and_short_files(tmp_path):
+    assert skills.validate_skill_for_publish(tmp_path)[1] == [
+        "skill.json not found. Run 'skills init' first."
+    ]
+
+    (tmp_path / "skill.json").write_text("{not json")
+    assert skills.validate_skill_for_publish(tmp_path)[1][0].startswith("Invalid skill.json")
+
+    (tmp_path / "skill.json").write_text('{"name": "pdf", "version": "1.0.0", "description": "d"}')
+    assert skills.validate_skill_for_publish(tmp_path)[1] == [
+        "SKILL.md not found. Create a SKILL.md with your skill instructions."
+    ]
+
+    (tmp_path / "SKILL.md").write_text("# PDF\n")
+    assert skills.validate_skill_for_publish(tmp_path)[1] == [
+        "SKILL.md is too short. Add meaningful instructions."
+    ]
+
+    (tmp_path / "SKILL.md").write_text("# PDF\n\n" + "Extract text and tables from PDF files. " * 3)
+    manifest, errors = skills.validate_skill_for_publish(tmp_path)
+    assert errors == [] and manifest["name"] == "pdf"
+
+
+@pytest.mark.parametrize("name,version,bad", [
+    ("pdf-tools", "1.2.3-beta.1", []),
+    ("p", "1.0.0", []),
+    ("-pdf", "1.0", ["skill", "version"]),
+    ("PDF", "v1.0.0", ["skill", "version"]),
+])
+def test_validate_skill_for_publish_name_and_version(tmp_path, name, version, bad):
+    (tmp_path / "skill.json").write_text(f'{{"name": "{name}", "version": "{version}", "description": "d"}}')
+    (tmp_path / "SKILL.md").write_text("x" * 60)
+    errors = skills.validate_skill_for_publish(tmp_path)[1]
+    assert [e.split()[1] for e in errors] == bad
+
+
+def test_publish_auto_checks_release_while_pushing(tmp_path, monkeypatch):
+    import subprocess
+    from types import SimpleNamespace
+
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "skill.json").write_text("{}")
+    (tmp_path / "SKILL.md").write_text("# PDF")
+    (tmp_path / "scripts").mkdir()
+    events = []
+    commands = []
+
+    class FakePush:
+        returncode = 0
+
+        def __init__(self, cmd, **kwargs):
+            commands.append(cmd)
+            events.append("push started")
+
+        def communicate(self):
+            events.append("push finished")
+            return b"", b""
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        out = b"https://github.com/octo/skill-pdf.git\n" if cmd[1] == "remote" else b""
+        return SimpleNamespace(returncode=0, stdout=out, stderr=b"")
+
+    def fake_request(endpoint, method="GET", data=None, token=None):
+        events.append(f"{method} {endpoint}")
+        return {"html_url": "https://github.com/octo/skill-pdf/releases/v1.0.0"}
+
+    monkeypatch.setattr(subprocess, "Popen", FakePush)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(skills, "github_api_request", fake_request)
+
+    manifest = {"name": "pdf", "version": "1.0.0"}
+    assert skills.cmd_publish_auto(tmp_path, manifest, "t0ken", "octo", "skill-pdf") == 0
+    assert events == [
+        "push started",
+        "GET /repos/octo/skill-pdf/releases/tags/v1.0.0",
+        "push finished",
+    ]
+    assert ["git", "--version"] not in commands
+    push_cmd = [cmd for cmd in commands if cmd[1] == "push"]
+    assert push_cmd == [["git", "push", "https://t0ken@github.com/octo/skill-pdf.git", "HEAD:main"]]
+    assert [cmd for cmd in commands if cmd[1] == "add"] == [
+        ["git", "add", "--", "skill.json", "SKILL.md", "scripts"]
+    ]
+
+
+def test_publish_auto_does_not_overwrite_diverged_remote(tmp_path, monkeypatch):
+    import subprocess
+
+    def git(*args, cwd):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                       cwd=cwd, check=True, capture_output=True)
+
+    # GitHub's main has a commit the local skill repo has never seen
+    remote = tmp_path / "remote.git"
+    git("init", "--bare", "-b", "main", str(remote), cwd=tmp_path)
+    other = tmp_path / "other"
+    git("clone", str(remote), str(other), cwd=tmp_path)
+    (other / "NOTES.md").write_text("edited on GitHub")
+    git("add", "NOTES.md", cwd=other)
+    git("commit", "-m", "remote-only", cwd=other)
+    git("push", "origin", "HEAD:main", cwd=other)
+    remote_head = subprocess.run(["git", "rev-parse", "main"], cwd=remote,
+                                 capture_output=True, text=True).stdout
+
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    git("init", "-b", "main", cwd=skill_dir)
+    (skill_dir / "skill.json").write_text("{}")
+    (skill_dir / "SKILL.md").write_text("# PDF")
+
+    # Route the token URL to the local bare repo; commit with a fixed identity
+    auth_remote = "https://t0ken@github.com/octo/skill-pdf.git"
+    real_run, real_popen = subprocess.run, subprocess.Popen
+
+    def local(cmd):
+        cmd = [str(remote) if arg == auth_remote else arg for arg in cmd]
+        return cmd[:1] + ["-c", "user.name=t", "-c", "user.email=t@t"] + cmd[1:]
+
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kw: real_run(local(cmd), **kw))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd, **kw: real_popen(local(cmd), **kw))
+    monkeypatch.setattr(skills, "_find_release", lambda *args: None)
+    monkeypatch.setattr(skills, "github_api_request", lambda *a, **k: pytest.fail("released after failed push"))
+
+    manifest = {"name": "pdf", "version": "1.0.0"}
+    assert skills.cmd_publish_auto(skill_dir, manifest, "t0ken", "octo", "skill-pdf") == 1
+    assert real_run(["git", "rev-parse", "main"], cwd=remote, capture_output=True, text=True).stdout == remote_head
+
+
+def test_fetch_catalog_caches_downloaded_bytes(skills_home, monkeypatch):
+    raw = '{"version": "2026.02.01", "skills": [{"id": "a/ü"}]}'.encode("utf-8")
+    monkeypatch.setattr(skills, "fetch_url_conditional", lambda url, etag: (raw, None))
+
+    catalog = skills.fetch_catalog(force_refresh=True)
+    assert catalog["skills"][0]["id"] == "a/ü"
+    assert skills.get_cache_path(skills.CATALOG_URL).read_bytes() == raw
+
+
+def test_fetch_catalog_revalidates_expired_cache_with_etag(skills_home, monkeypatch):
+    skills.ensure_dirs()
+    requests = []
+
+    def fake_fetch(url, etag):
+        requests.append(etag)
+        if etag == '"v1"':
+            return None, etag
+        return b'{"version": "v1", "skills": []}', '"v1"'
+
+    monkeypatch.setattr(skills, "fetch_url_conditional", fake_fetch)
+    assert skills.fetch_catalog(force_refresh=True)["version"] == "v1"
+
+    cache_path = skills.get_cache_path(skills.CATALOG_URL)
+    os.utime(cache_path, (0, 0))
+    assert skills.fetch_catalog()["version"] == "v1"  # served from cache after a 304
+    assert requests == [None, '"v1"']
+    # The 304 restarted the TTL
+    assert skills.fetch_catalog()["version"] == "v1"
+    assert len(requests) == 2
+
+
+def test_submit_to_directory_issue_body(monkeypatch):
+    sent = {}
+
+    def fake_request(endpoint, method="GET", data=None, token=None):
+        sent.update(data)
+        return {"html_url": "https://github.com/dmgrok/agent_skills_directory/issues/1"}
+
+    monkeypatch.setattr(skills, "github_api_request", fake_request)
+    manifest = {"name": "pdf", "version": "1.0.0", "keywords": None, "capabilities": ["read", "write"]}
+    assert skills.cmd_submit_to_directory("t0ken", "octo", "pdf", "skill-pdf", manifest) == 0
+
+    body = sent["body"]
+    assert "### Keywords\n`None specified`" in body
+    assert "### Capabilities\n`read, write`" in body
+    assert '    "octo": {\n        "name": "octo",\n        "repo": "https://github.com/octo/skill-pdf",' in body
+
+
+def test_duplicate_check_uses_stale_catalog_unless_deep_check(skills_home, monkeypatch):
+    from types import SimpleNamespace
+
+    skills.ensure_dirs()
+    cache_path = skills.get_cache_path(skills.CATALOG_URL)
+    cache_path.write_text('{"version": "old", "skills": []}')
+    os.utime(cache_path, (0, 0))
+    monkeypatch.setattr(skills, "fetch_url_conditional", lambda url, etag: (b'{"version": "new", "skills": []}', None))
+
+    args = SimpleNamespace(deep_check=False)
+    assert skills._fetch_catalog_for_duplicate_check(args)["version"] == "old"
+    args.deep_check = True
+    assert skills._fetch_catalog_for_duplicate_check(args)["version"] == "new"
+
+
+def test_duplicate_check_without_cached_catalog_uses_names_export(skills_home, monkeypatch):
+    from types import SimpleNamespace
+
+    fetched = []
+
+    def fake_fetch(url):
+        fetched.append(url)
+        return b'{"version": "v", "skills": [{"id": "a/pdf", "name": "pdf"}]}'
+
+    monkeypatch.setattr(skills, "fetch_url_bytes", fake_fetch)
+    args = SimpleNamespace(deep_check=False)
+    assert skills._fetch_catalog_for_duplicate_check(args)["skills"] == [{"id": "a/pdf", "name": "pdf"}]
+    assert skills._fetch_catalog_for_duplicate_check(args)["skills"][0]["name"] == "pdf"
+    assert fetched == [skills.SKILL_NAMES_URL]
+
+
+def test_extract_keywords_strips_markdown_and_stop_words():
+    text = "Use the [PDF toolkit](https://x.io) to parse `code` files\n```\nignored block\n```\nsee https://example.com"
+    assert skills.extract_keywords(text) == {"pdf", "toolkit", "parse", "files", "see"}
+    assert skills.extract_keywords("go is ok", min_length=2) == {"go", "ok"}
+
+
+def test_count_similar_skills_uses_precomputed_features(monkeypatch):
+    catalog = {"skills": [
+        {"id": "a/pdf-reader", "name": "PDF Reader", "category": "documents", "tags": ["pdf", "read"],
+         "description": "Extract text tables from documents"},
+        {"id": "a/pdf-writer", "name": "PDF Writer", "category": "documents", "tags": ["pdf"],
+         "description": "Create documents"},
+        {"id": "a/other", "name": "Other", "category": "devops", "tags": [], "description": "Deploy"},
+    ]}
+    all_skills = catalog["skills"]
+    expected = [skills.count_similar_skills(s, all_skills) for s in all_skills]
+    assert expected == [1, 1, 0]
+
+    index = skills._build_suggest_index(catalog)
+    monkeypatch.setattr(skills, "extract_keywords", lambda *a, **k: pytest.fail("re-tokenized"))
+    assert [skills.count_similar_skills(s, all_skills, index) for s in all_skills] == expected
+    # A different skill list than the index was built from scans it in full
+    assert [skills.count_similar_skills(s, list(all_skills), index) for s in all_skills] == expected
+
+
+def test_prefilter_matches_whole_words_not_substrings():
+    catalog = {"skills": [
+        {"id": "a/mongo", "name": "Mongodb Parser", "description": "Query collections", "tags": []},
+        {"id": "a/go", "name": "Go Linter", "description": "Lint packages", "tags": ["go"]},
+        {"id": "a/parse", "name": "Parse", "description": "Parse logs", "tags": ["flask"]},
+    ]}
+    ranked = skills.prefilter_skills_by_relevance(
+        catalog["skills"], "We parse logs", {"languages": ["go"], "frameworks": ["flask"]},
+    )
+    # "go" is not a substring match for "mongodb", nor "parse" for "parser"
+    assert [s["id"] for s in ranked] == ["a/parse", "a/go"]
+
+
+def test_prefilter_matches_languages_in_hyphenated_names():
+    catalog = {"skills": [
+        {"id": "a/docs", "name": "markdown-docs", "description": "Write docs", "tags": []},
+        {"id": "a/go", "name": "go-module-linter", "description": "Lint modules", "tags": []},
+    ]}
+    ranked = skills.prefilter_skills_by_relevance(
+        catalog["skills"], "", {"languages": ["Go"], "frameworks": []}, top_n=1,
+    )
+    assert [s["id"] for s in ranked] == ["a/go"]
+
+
+def test_track_events_write_stats_once_at_flush(skills_home):
+    skills.track_install("a/one")
+    skills.track_install("a/one")
+    skills.track_search("PDF")
+    assert not skills.STATS_FILE.exists()
+
+    skills._flush_stats()
+    stats = skills._json_loads(skills.STATS_FILE.read_bytes())
+    assert stats["installs"]["a/one"]["count"] == 2
+    assert stats["total_installs"] == 2
+    assert stats["searches"] == {"pdf": 1}
+    assert list(skills_home.glob("*.tmp")) == []
+
+
+def test_analyze_project_structure_maps_files_and_limits_depth(tmp_path):
+    for rel in ["package.json", "src/app.py", "src/lib/util.TS", "a/b/c/go.mod", "a/b/c/d/deep.rs",
+                "node_modules/pkg/index.rb", "Makefile"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    analysis = skills.analyze_project_structure(tmp_path)
+    # .TS is recorded as a file type but, as with *.ts patterns, is not a language match
+    assert sorted(analysis["languages"]) == ["c", "go", "javascript", "python"]
+    assert sorted(analysis["frameworks"]) == ["express", "flask", "react", "vue"]
+    assert sorted(analysis["file_types"]) == [".json", ".mod", ".py", ".ts"]
+    assert sorted(analysis["package_files"]) == [
+        str(tmp_path / "a/b/c/go.mod"), str(tmp_path / "package.json"),
+    ]
+
+
+def test_analyze_project_structure_reports_every_file_type(tmp_path):
+    for i in range(60):
+        (tmp_path / f"f.x{i}").write_text("")
+
+    analysis = skills.analyze_project_structure(tmp_path)
+    assert len(analysis["file_types"]) == 60
+
+
+def test_analyze_project_cached_reuses_analysis_until_mtime_changes(skills_home, tmp_path, monkeypatch):
+    project = tmp_path / "proj"
+    project.mkdir()
+    (project / "a.py").write_text("")
+    readme = project / "README.md"
+    readme.write_text("# Proj")
+
+    scans = []
+    real_scan = skills.analyze_project_structure
+    monkeypatch.setattr(skills, "analyze_project_structure", lambda p: scans.append(p) or real_scan(p))
+
+    first = skills.analyze_project_cached(project, readme)
+    assert skills.analyze_project_cached(project, readme) == first
+    assert len(scans) == 1
+
+    skills.analyze_project_cached(project, readme, rescan=True)
+    assert len(scans) == 2
+
+    os.utime(readme, ns=(1, 1))
+    skills.analyze_project_cached(project, readme)
+    assert len(scans) == 3
+
+
+def test_stats_counts_categories_and_provider_skills(skills_home, monkeypatch, capsys):
+    from types import SimpleNamespace
+
+    catalog = {
+        "version": "v",
+        "providers": {"big": {"stars": 10}, "small": {"stars": 1}, "empty": {"stars": 5}},
+        "skills": [
+            {"id": "big/a", "provider": "big", "category": "web"},
+            {"id": "big/b", "provider": "big", "category": "data"},
+            {"id": "small/c", "provider": "small", "category": "web"},
+        ],
+    }
+    monkeypatch.setattr(skills, "fetch_catalog", lambda: catalog)
+    assert skills.cmd_stats(SimpleNamespace(detailed=True)) == 0
+
+    out = capsys.readouterr().out
+    assert "web               2" in out and "data              1" in out
+    assert "big                       ⭐ 10  (2 skills)" in out
+    assert "empty                     ⭐ 5  (0 skills)" in out
+    assert "small                     ⭐ 1  (1 skills)" in out
+
+
+def test_enhanced_recommendations_use_precomputed_domains_and_bonuses():
+    catalog = {"skills": [
+        {"id": "github/sql-helper", "name": "SQL Helper", "description": "Query a database",
+         "tags": [], "quality_score": 85, "maintenance_status": "active"},
+        {"id": "someone/painter", "name": "Painter", "description": "Draw pictures", "tags": []},
+    ]}
+    index = skills._build_suggest_index(catalog)
+    assert index.features[id(catalog["skills"][0])].domain_bits == 1 << skills._DOMAIN_NAMES.index("database")
+
+    recs = skills.generate_enhanced_recommendations(
+        catalog["skills"], "Our service stores data in postgres", {}, index=index,
+    )
+    # database domain (15) + high quality (10) + active (8) + trusted provider (3)
+    assert recs == [{
+        "skill_id": "github/sql-helper",
+        "reason": "database domain match; high quality; actively maintained",
+        "confidence": "medium",
+        "score": 36,
+    }]